@@ -16,20 +16,93 @@ Reference:
 import hashlib
 import hmac
 import json
+import math
 from collections import OrderedDict
+from json.encoder import encode_basestring_ascii
 from typing import Any, Generator, Optional, Union
 
+import numpy as np
 from netqasm.sdk.classical_communication.message import StructuredMessage
 from pydynaa import EventExpression
 
 from hackathon_challenge.auth.exceptions import IntegrityError, SecurityError
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import mmh3
+
+    MMH3_AVAILABLE = True
+except ImportError:
+    MMH3_AVAILABLE = False
+
+try:
+    from cryptography.hazmat.primitives import cmac as crypto_cmac
+    from cryptography.hazmat.primitives import hashes as crypto_hashes
+    from cryptography.hazmat.primitives import hmac as crypto_hmac
+    from cryptography.hazmat.primitives.ciphers import algorithms as crypto_algorithms
+
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
+# Buffers accepted as HMAC input without copying
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# HMAC-SHA256 output size in bytes
+HMAC_TAG_BYTES = hashlib.sha256().digest_size
+
+# Supported message authentication codes
+MAC_HMAC_SHA256 = "hmac-sha256"
+MAC_CMAC_AES = "cmac-aes"
+
+# Tag size in bytes per MAC algorithm
+MAC_TAG_BYTES = {MAC_HMAC_SHA256: HMAC_TAG_BYTES, MAC_CMAC_AES: 16}
+
+# Label for deriving the AES-256 CMAC key from the pre-shared key
+_CMAC_KEY_LABEL = b"AuthenticatedSocket/cmac-aes"
+
+_ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy values for the JSON encoders.
+
+    Parameters
+    ----------
+    obj : Any
+        Object the encoder does not handle natively.
+
+    Returns
+    -------
+    Any
+        The equivalent Python number, bool or (nested) list, via
+        ``obj.tolist()``.
+
+    Raises
+    ------
+    TypeError
+        For any other type.
+    """
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Payload of type {type(obj).__name__} is not JSON-serializable")
+
 
 def _serialize_payload(payload: Any) -> bytes:
     """Serialize payload deterministically for HMAC computation.
 
     Uses JSON serialization with sorted keys to ensure deterministic
-    byte representation regardless of dict ordering.
+    byte representation regardless of dict ordering. Scalar payloads
+    (as sent by ``send``, ``send_int`` and ``send_float``) are encoded
+    directly, producing the same bytes as the JSON path without
+    building an encoder per call. Containers are encoded with ``orjson``
+    when it is installed, falling back to the stdlib ``json`` module.
 
     Parameters
     ----------
@@ -44,43 +117,132 @@ def _serialize_payload(payload: Any) -> bytes:
     Raises
     ------
     TypeError
-        If payload cannot be serialized.
+        If payload cannot be serialized. The receiver decodes the bytes
+        with ``json.loads``, so values are never converted to strings.
 
     Notes
     -----
     Uses OrderedDict and sorted keys to ensure deterministic serialization
     across Python versions and avoid HMAC verification failures.
+
+    NumPy scalars and arrays are encoded as the equivalent Python numbers
+    and lists (see ``_json_default``).
     """
+    # Fast path for scalars; exact type checks keep bool/int subclasses on
+    # the JSON path
+    payload_type = type(payload)
+    if payload_type is str:
+        return encode_basestring_ascii(payload).encode("ascii")
+    if payload_type is int:
+        return str(payload).encode("ascii")
+    if payload_type is float and math.isfinite(payload):
+        return repr(payload).encode("ascii")
+
+    if ORJSON_AVAILABLE and payload_type in (dict, list, tuple):
+        try:
+            # Rust encoder; emits sorted-key UTF-8 bytes directly
+            serialized = orjson.dumps(payload, default=_json_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; use the stdlib encoder
+            pass
+        else:
+            # orjson writes non-finite floats as null; only the stdlib
+            # encoder round-trips them, so re-encode any payload with a null
+            if b"null" not in serialized:
+                return serialized
+
     try:
         # Convert to JSON with sorted keys for determinism
         serialized = json.dumps(
             payload,
             sort_keys=True,
             separators=(",", ":"),
-            default=str,
+            default=_json_default,
         )
-        return serialized.encode("utf-8")
-    except (TypeError, ValueError) as e:
-        # Fallback to repr for non-JSON-serializable objects
-        return repr(payload).encode("utf-8")
+    except ValueError as e:
+        # e.g. circular references
+        raise TypeError(f"Payload is not JSON-serializable: {e}") from e
+    return serialized.encode("utf-8")
+
+
+def _deserialize_payload(data: BytesLike) -> Any:
+    """Decode a payload produced by ``_serialize_payload``.
+
+    Parameters
+    ----------
+    data : BytesLike
+        Serialized payload, already authenticated.
+
+    Returns
+    -------
+    Any
+        Decoded payload. JSON has no tuple type, so tuples are returned
+        as lists.
 
+    Raises
+    ------
+    SecurityError
+        If the payload is not valid JSON, i.e. it was not produced by
+        ``_serialize_payload``.
+    """
+    if isinstance(data, memoryview):
+        # json.loads does not take buffers; copy only once authenticated
+        data = data.tobytes()
+    try:
+        return json.loads(data)
+    except ValueError as e:
+        raise SecurityError(f"Authenticated payload is not valid JSON: {e}") from e
+
+
+def _fingerprint_payload(payload: Any) -> int:
+    """Compute a fast non-cryptographic fingerprint of a payload.
+
+    Hashes the canonical serialization with MurmurHash3 (128-bit) when
+    ``mmh3`` is installed, otherwise with Python's built-in ``hash``.
+    Intended for in-process equality caches only; it offers no
+    protection against adversarial collisions and must never replace
+    the HMAC on the authentication path.
+
+    Parameters
+    ----------
+    payload : Any
+        Payload to fingerprint.
 
-def _compute_hmac(key: bytes, data: bytes) -> bytes:
-    """Compute HMAC-SHA256 tag for data.
+    Returns
+    -------
+    int
+        Fingerprint of ``_serialize_payload(payload)``. Stable within a
+        process; not comparable across processes.
+    """
+    data = _serialize_payload(payload)
+    if MMH3_AVAILABLE:
+        return mmh3.hash128(data)
+    return hash(data)
+
+
+def _compute_hmac(key: bytes, *chunks: BytesLike) -> bytes:
+    """Compute HMAC-SHA256 tag over the concatenation of data chunks.
+
+    The chunks are fed to the HMAC one after another, so callers never
+    need to build the concatenated message. Chunks may be any buffer
+    (e.g. ``memoryview`` slices), which are hashed in place.
 
     Parameters
     ----------
     key : bytes
         Secret authentication key.
-    data : bytes
-        Data to authenticate.
+    *chunks : BytesLike
+        Data to authenticate, in order.
 
     Returns
     -------
     bytes
         HMAC-SHA256 tag (32 bytes).
     """
-    return hmac.new(key, data, hashlib.sha256).digest()
+    h = hmac.new(key, None, hashlib.sha256)
+    for chunk in chunks:
+        h.update(chunk)
+    return h.digest()
 
 
 class AuthenticatedSocket:
@@ -92,7 +254,7 @@ class AuthenticatedSocket:
 
     The socket wraps messages in an envelope containing:
     - Original header
-    - Tuple of (payload, hmac_tag)
+    - Tuple of (serialized_payload, hmac_tag)
 
     Parameters
     ----------
@@ -101,6 +263,9 @@ class AuthenticatedSocket:
     key : bytes
         Pre-shared authentication key. Should be at least 32 bytes
         for adequate security.
+    mac_algorithm : str, optional
+        ``"hmac-sha256"`` (default) or ``"cmac-aes"``. Both peers must
+        use the same algorithm.
 
     Attributes
     ----------
@@ -108,6 +273,14 @@ class AuthenticatedSocket:
         The wrapped socket instance.
     _key : bytes
         Pre-shared authentication key.
+    _mac_template : object
+        MAC object keyed once and fed no data. Copying it reuses the keyed
+        state instead of rebuilding it for every message. For HMAC the
+        backend is the ``cryptography`` context when installed (lower
+        per-message overhead), otherwise the stdlib ``hmac`` object; both
+        run the OpenSSL SHA-256 implementation.
+    _tag_bytes : int
+        Tag size of the selected MAC.
 
     Notes
     -----
@@ -129,7 +302,9 @@ class AuthenticatedSocket:
     - extending_qkd_technical_aspects.md §3.1 (AuthenticatedSocket design)
     """
 
-    def __init__(self, socket: "ClassicalSocket", key: bytes) -> None:
+    def __init__(
+        self, socket: "ClassicalSocket", key: bytes, mac_algorithm: str = MAC_HMAC_SHA256
+    ) -> None:
         """Initialize authenticated socket.
 
         Parameters
@@ -138,17 +313,63 @@ class AuthenticatedSocket:
             Underlying classical socket.
         key : bytes
             Pre-shared authentication key.
+        mac_algorithm : str
+            MAC used to tag messages (``"hmac-sha256"`` or ``"cmac-aes"``).
 
         Raises
         ------
         ValueError
-            If key is empty.
+            If key is empty, the algorithm is unknown, or ``"cmac-aes"`` is
+            requested without the ``cryptography`` package.
+
+        Notes
+        -----
+        AES-CMAC runs on AES-NI and is the cheaper choice on CPUs without
+        SHA extensions. Its AES-256 key is derived from ``key`` with
+        HMAC-SHA256, so the pre-shared key may have any length.
         """
         if not key:
             raise ValueError("Authentication key cannot be empty")
-        
+        if mac_algorithm not in MAC_TAG_BYTES:
+            raise ValueError(f"Unknown MAC algorithm: {mac_algorithm!r}")
+
         self._socket = socket
         self._key = key
+        self._mac_algorithm = mac_algorithm
+        self._tag_bytes = MAC_TAG_BYTES[mac_algorithm]
+
+        if mac_algorithm == MAC_CMAC_AES:
+            if not CRYPTOGRAPHY_AVAILABLE:
+                raise ValueError("cmac-aes requires the 'cryptography' package")
+            aes_key = _compute_hmac(key, _CMAC_KEY_LABEL)
+            self._mac_template = crypto_cmac.CMAC(crypto_algorithms.AES(aes_key))
+            self._finalize = crypto_cmac.CMAC.finalize
+        elif CRYPTOGRAPHY_AVAILABLE:
+            self._mac_template = crypto_hmac.HMAC(key, crypto_hashes.SHA256())
+            self._finalize = crypto_hmac.HMAC.finalize
+        else:
+            self._mac_template = hmac.new(key, None, hashlib.sha256)
+            self._finalize = hmac.HMAC.digest
+
+    def _compute_tag(self, *chunks: BytesLike) -> bytes:
+        """Compute the MAC tag of the given chunks with the socket key.
+
+        For HMAC-SHA256 this equals ``_compute_hmac(self._key, *chunks)``.
+
+        Parameters
+        ----------
+        *chunks : BytesLike
+            Data to authenticate, in order.
+
+        Returns
+        -------
+        bytes
+            Tag of ``_tag_bytes`` bytes.
+        """
+        h = self._mac_template.copy()
+        for chunk in chunks:
+            h.update(chunk)
+        return self._finalize(h)
 
     @property
     def peer_name(self) -> str:
@@ -165,7 +386,9 @@ class AuthenticatedSocket:
         """Send authenticated message.
 
         Computes HMAC-SHA256 over the header and serialized payload,
-        then sends an envelope containing the original payload and tag.
+        then sends an envelope containing the serialized payload and tag.
+        The receiver verifies the transmitted bytes directly, so the
+        payload is serialized exactly once.
 
         Parameters
         ----------
@@ -177,19 +400,19 @@ class AuthenticatedSocket:
         The envelope format is:
         StructuredMessage(
             header=original_header,
-            payload=(original_payload, hmac_tag)
+            payload=(serialized_payload, hmac_tag)
         )
+        where ``serialized_payload`` is the output of ``_serialize_payload``.
         """
         # Serialize header + payload for HMAC computation
         header_bytes = msg.header.encode("utf-8")
         payload_bytes = _serialize_payload(msg.payload)
         
         # Compute HMAC over header || payload
-        data_to_sign = header_bytes + b"|" + payload_bytes
-        tag = _compute_hmac(self._key, data_to_sign)
+        tag = self._compute_tag(header_bytes, b"|", payload_bytes)
         
-        # Create envelope with (payload, tag)
-        envelope = StructuredMessage(msg.header, (msg.payload, tag))
+        # Create envelope with (serialized payload, tag)
+        envelope = StructuredMessage(msg.header, (payload_bytes, tag))
         self._socket.send_structured(envelope)
 
     def recv_structured(
@@ -239,19 +462,29 @@ class AuthenticatedSocket:
                 f"got {type(envelope.payload)}"
             )
         
-        payload, received_tag = envelope.payload
+        payload_bytes, received_tag = envelope.payload
+        
+        # Validate payload and tag types
+        if not isinstance(payload_bytes, (bytes, bytearray, memoryview)):
+            raise SecurityError(
+                f"Invalid payload type: expected serialized bytes, got {type(payload_bytes)}"
+            )
         
-        # Validate tag type
         if not isinstance(received_tag, bytes):
             raise SecurityError(
                 f"Invalid tag type: expected bytes, got {type(received_tag)}"
             )
         
-        # Recompute expected HMAC
+        # The tag length is a public protocol constant, so rejecting a
+        # mismatch early leaks nothing
+        if len(received_tag) != self._tag_bytes:
+            raise SecurityError(
+                f"Invalid tag length: expected {self._tag_bytes} bytes, got {len(received_tag)}"
+            )
+        
+        # Recompute expected HMAC over the bytes exactly as received
         header_bytes = envelope.header.encode("utf-8")
-        payload_bytes = _serialize_payload(payload)
-        data_to_verify = header_bytes + b"|" + payload_bytes
-        expected_tag = _compute_hmac(self._key, data_to_verify)
+        expected_tag = self._compute_tag(header_bytes, b"|", payload_bytes)
         
         # Constant-time comparison to prevent timing attacks
         if not hmac.compare_digest(received_tag, expected_tag):
@@ -260,8 +493,8 @@ class AuthenticatedSocket:
                 "Message may have been tampered with or keys do not match."
             )
         
-        # Return original message (unwrapped)
-        return StructuredMessage(envelope.header, payload)
+        # Decode only after the bytes are known to be authentic
+        return StructuredMessage(envelope.header, _deserialize_payload(payload_bytes))
 
     def send(self, msg: str) -> None:
         """Send authenticated raw string message.
@@ -12,19 +12,32 @@ Reference:
 - extending_qkd_theorethical_aspects.md Step 3 §3.1
 """
 
+import hashlib
 import hmac
 import secrets
-from typing import List, Tuple
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Tuple, Union
 
 import numpy as np
 
+from hackathon_challenge.utils.compat import NUMBA_AVAILABLE
+from hackathon_challenge.utils.math import parity_u64
+
+if NUMBA_AVAILABLE:
+    from numba import njit
 
 # Default tag length in bits (40 bits provides ε_auth ≈ 10^-12)
 DEFAULT_TAG_BITS = 64
 
+# Number of message lengths whose Toeplitz matrix a ToeplitzAuthenticator keeps
+TOEPLITZ_CACHE_SIZE = 32
+
+# Upper bound on the (rows, vectors, words) temporary built by _gf2_matmat
+_MATMAT_BLOCK_WORDS = 1 << 20
+
 
-def _bytes_to_bits(data: bytes) -> List[int]:
-    """Convert bytes to a list of bits.
+def _bytes_to_bits(data: bytes) -> np.ndarray:
+    """Convert bytes to an array of bits (MSB first).
 
     Parameters
     ----------
@@ -33,45 +46,27 @@ def _bytes_to_bits(data: bytes) -> List[int]:
 
     Returns
     -------
-    List[int]
-        List of bits (0 or 1).
+    np.ndarray
+        uint8 array of bits (0 or 1), length ``8 * len(data)``.
     """
-    bits = []
-    for byte in data:
-        for i in range(7, -1, -1):
-            bits.append((byte >> i) & 1)
-    return bits
+    return np.unpackbits(np.frombuffer(data, dtype=np.uint8))
 
 
-def _bits_to_bytes(bits: List[int]) -> bytes:
-    """Convert a list of bits to bytes.
+def _bits_to_bytes(bits: Union[List[int], np.ndarray]) -> bytes:
+    """Convert a sequence of bits to bytes (MSB first).
 
     Parameters
     ----------
-    bits : List[int]
-        List of bits (0 or 1). Length must be multiple of 8.
+    bits : Union[List[int], np.ndarray]
+        Bits (0 or 1). If the length is not a multiple of 8, the last
+        byte is zero-padded on the right.
 
     Returns
     -------
     bytes
         Output byte string.
-
-    Raises
-    ------
-    ValueError
-        If bit list length is not a multiple of 8.
     """
-    if len(bits) % 8 != 0:
-        # Pad with zeros if necessary
-        bits = bits + [0] * (8 - len(bits) % 8)
-    
-    result = bytearray()
-    for i in range(0, len(bits), 8):
-        byte = 0
-        for j in range(8):
-            byte = (byte << 1) | bits[i + j]
-        result.append(byte)
-    return bytes(result)
+    return np.packbits(np.asarray(bits, dtype=np.uint8)).tobytes()
 
 
 def _construct_toeplitz_matrix(seed: List[int], rows: int, cols: int) -> np.ndarray:
@@ -92,7 +87,8 @@ def _construct_toeplitz_matrix(seed: List[int], rows: int, cols: int) -> np.ndar
     Returns
     -------
     np.ndarray
-        Toeplitz matrix of shape (rows, cols).
+        Read-only Toeplitz view of shape (rows, cols) over a buffer of
+        length (rows + cols - 1); no rows x cols matrix is allocated.
 
     Raises
     ------
@@ -107,16 +103,175 @@ def _construct_toeplitz_matrix(seed: List[int], rows: int, cols: int) -> np.ndar
     
     # First column is seed[0:rows]
     # First row is seed[rows-1:rows+cols-1] (starting from seed[rows-1])
-    col = np.array(seed[:rows], dtype=np.uint8)
-    row = np.array(seed[rows - 1 : rows + cols - 1], dtype=np.uint8)
-    
-    # Build Toeplitz matrix
-    # T[i,j] = seed[i - j + cols - 1] for the standard construction
-    from scipy.linalg import toeplitz
-    return toeplitz(col, row).astype(np.uint8)
+    # Lay the diagonals out in a single buffer so that T[i, j] = diag[rows-1-i+j]:
+    # the first column is stored reversed, followed by the rest of the first row.
+    seed_arr = np.asarray(seed, dtype=np.uint8)
+    diagonals = np.empty(expected_seed_len, dtype=np.uint8)
+    diagonals[:rows] = seed_arr[:rows][::-1]
+    diagonals[rows:] = seed_arr[rows : rows + cols - 1]
+
+    # Zero-copy view: stepping down a row moves one element back in the buffer,
+    # stepping right moves one element forward.
+    stride = diagonals.strides[0]
+    return np.lib.stride_tricks.as_strided(
+        diagonals[rows - 1 :],
+        shape=(rows, cols),
+        strides=(-stride, stride),
+        writeable=False,
+    )
+
+
+def _pack_words(bits: np.ndarray) -> np.ndarray:
+    """Pack a 2-D bit array row-wise into 64-bit words.
+
+    Parameters
+    ----------
+    bits : np.ndarray
+        Array of shape (rows, cols) containing bits (0 or 1).
+
+    Returns
+    -------
+    np.ndarray
+        uint64 array of shape (rows, ceil(cols / 64)). Rows are
+        zero-padded on the right to a whole number of words.
+    """
+    packed = np.packbits(bits, axis=1)
+    pad = -packed.shape[1] % 8
+    if pad:
+        packed = np.pad(packed, ((0, 0), (0, pad)))
+    return np.ascontiguousarray(packed).view(np.uint64)
+
+
+def _message_words(message: bytes) -> np.ndarray:
+    """View a message as 64-bit words, zero-padded to a word boundary.
+
+    Parameters
+    ----------
+    message : bytes
+        Message to pack.
+
+    Returns
+    -------
+    np.ndarray
+        uint64 array of length ceil(len(message) / 8).
+    """
+    padded = bytearray(len(message) + (-len(message) % 8))
+    padded[: len(message)] = message
+    return np.frombuffer(padded, dtype=np.uint64)
+
+
+def _gf2_matvec_numpy(row_words: np.ndarray, message_words: np.ndarray) -> np.ndarray:
+    """NumPy implementation of ``_gf2_matvec``."""
+    return parity_u64(np.bitwise_xor.reduce(row_words & message_words, axis=1))
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _gf2_matvec_jit(row_words: np.ndarray, message_words: np.ndarray) -> np.ndarray:
+        """Numba implementation of ``_gf2_matvec``."""
+        rows, nwords = row_words.shape
+        result = np.empty(rows, dtype=np.uint8)
+        for i in range(rows):
+            acc = np.uint64(0)
+            for j in range(nwords):
+                acc ^= row_words[i, j] & message_words[j]
+            for shift in (32, 16, 8, 4, 2, 1):
+                acc ^= acc >> np.uint64(shift)
+            result[i] = acc & np.uint64(1)
+        return result
+
+
+def _gf2_matvec(row_words: np.ndarray, message_words: np.ndarray) -> np.ndarray:
+    """Multiply a packed binary matrix by a packed binary vector over GF(2).
+
+    Each output bit is the parity of (row AND message). The AND is done on
+    64 columns per word and the per-word results are XOR-folded before a
+    single parity computation per row. Uses a Numba kernel when numba is
+    installed, which avoids the (rows, nwords) temporary.
+
+    Parameters
+    ----------
+    row_words : np.ndarray
+        Packed matrix rows, uint64 array of shape (rows, nwords).
+    message_words : np.ndarray
+        Packed vector, uint64 array of length nwords.
+
+    Returns
+    -------
+    np.ndarray
+        uint8 array of length rows with the product bits.
+    """
+    if NUMBA_AVAILABLE:
+        return _gf2_matvec_jit(row_words, message_words)
+    return _gf2_matvec_numpy(row_words, message_words)
+
+
+def _gf2_matmat(row_words: np.ndarray, message_words: np.ndarray) -> np.ndarray:
+    """Multiply a packed binary matrix by several packed vectors over GF(2).
+
+    Parameters
+    ----------
+    row_words : np.ndarray
+        Packed matrix rows, uint64 array of shape (rows, nwords).
+    message_words : np.ndarray
+        Packed vectors, uint64 array of shape (nvectors, nwords).
+
+    Returns
+    -------
+    np.ndarray
+        uint8 array of shape (rows, nvectors); column ``k`` equals
+        ``_gf2_matvec(row_words, message_words[k])``.
+
+    Notes
+    -----
+    With numba the matvec kernel runs once per vector. Otherwise vectors
+    are processed in blocks so the (rows, vectors, nwords) AND temporary
+    stays within ``_MATMAT_BLOCK_WORDS`` words.
+    """
+    rows, nwords = row_words.shape
+    result = np.empty((rows, len(message_words)), dtype=np.uint8)
+    if NUMBA_AVAILABLE:
+        for k in range(len(message_words)):
+            result[:, k] = _gf2_matvec_jit(row_words, message_words[k])
+        return result
+
+    vectors_per_block = max(1, _MATMAT_BLOCK_WORDS // max(1, rows * nwords))
+    for start in range(0, len(message_words), vectors_per_block):
+        block = message_words[start : start + vectors_per_block]
+        products = row_words[:, None, :] & block[None, :, :]
+        result[:, start : start + len(block)] = parity_u64(
+            np.bitwise_xor.reduce(products, axis=2)
+        )
+    return result
+
+
+def _iter_seed_blocks(key: bytes) -> Iterator[bytes]:
+    """Yield the HMAC-SHA256 counter-mode blocks of the Toeplitz seed.
+
+    Block ``i`` is ``HMAC(key, "toeplitz_seed_<i>")``. The keyed HMAC state
+    is built once and copied per block rather than re-keyed each time.
+
+    Parameters
+    ----------
+    key : bytes
+        Pre-shared authentication key.
+
+    Yields
+    ------
+    bytes
+        Successive 32-byte seed blocks.
+    """
+    keyed = hmac.new(key, None, hashlib.sha256)
+    counter = 0
+    while True:
+        h = keyed.copy()
+        h.update(f"toeplitz_seed_{counter}".encode())
+        yield h.digest()
+        counter += 1
 
 
-def _derive_toeplitz_seed(key: bytes, message_bits: int, tag_bits: int) -> List[int]:
+def _derive_toeplitz_seed(key: bytes, message_bits: int, tag_bits: int) -> np.ndarray:
     """Derive a deterministic seed for Toeplitz matrix from key.
 
     Uses HMAC-SHA256 to expand the key into enough bits for the matrix seed.
@@ -133,24 +288,23 @@ def _derive_toeplitz_seed(key: bytes, message_bits: int, tag_bits: int) -> List[
 
     Returns
     -------
-    List[int]
+    np.ndarray
         Seed bits for Toeplitz matrix construction.
     """
     seed_bits_needed = message_bits + tag_bits - 1
     seed_bytes_needed = (seed_bits_needed + 7) // 8 + 1  # Extra byte for safety
     
-    # Use HMAC in counter mode to generate enough bits
-    seed_bytes = b""
-    counter = 0
-    while len(seed_bytes) < seed_bytes_needed:
-        h = hmac.new(key, f"toeplitz_seed_{counter}".encode(), "sha256")
-        seed_bytes += h.digest()
-        counter += 1
+    # Fill a preallocated buffer with exactly as many HMAC blocks as needed
+    seed_bytes = bytearray(seed_bytes_needed)
+    blocks = _iter_seed_blocks(key)
+    for offset in range(0, seed_bytes_needed, 32):
+        block = next(blocks)
+        seed_bytes[offset : offset + 32] = block[: seed_bytes_needed - offset]
     
-    return _bytes_to_bits(seed_bytes[:seed_bytes_needed])
+    return _bytes_to_bits(seed_bytes)
 
 
-def _derive_otp_mask(key: bytes, message: bytes, tag_bits: int) -> List[int]:
+def _derive_otp_mask(key: bytes, message: bytes, tag_bits: int) -> int:
     """Derive a one-time pad mask for the authentication tag.
 
     Uses HMAC-SHA256 with the message to derive a unique mask.
@@ -169,14 +323,59 @@ def _derive_otp_mask(key: bytes, message: bytes, tag_bits: int) -> List[int]:
 
     Returns
     -------
-    List[int]
-        One-time pad mask bits.
+    int
+        One-time pad mask as a big-endian integer over ceil(tag_bits / 8)
+        bytes. The first ``tag_bits`` bits are mask bits; the trailing pad
+        bits of the last byte are zero.
     """
     # Derive unique mask using HMAC with the message
-    h = hmac.new(key, b"otp_mask_" + message, "sha256")
-    mask_bytes = h.digest()
+    h = hmac.new(key, b"otp_mask_", hashlib.sha256)
+    h.update(message)
     
-    return _bytes_to_bits(mask_bytes)[: tag_bits]
+    num_bytes = (tag_bits + 7) // 8
+    pad_bits = 8 * num_bytes - tag_bits
+    return int.from_bytes(h.digest()[:num_bytes], "big") >> pad_bits << pad_bits
+
+
+def _derive_toeplitz_rows(key: bytes, message_bits: int, tag_bits: int) -> np.ndarray:
+    """Derive the packed Toeplitz matrix for a given message length.
+
+    Parameters
+    ----------
+    key : bytes
+        Pre-shared authentication key.
+    message_bits : int
+        Length of the message in bits.
+    tag_bits : int
+        Desired tag length in bits.
+
+    Returns
+    -------
+    np.ndarray
+        uint64 array of shape (tag_bits, ceil(message_bits / 64)) holding
+        the Toeplitz rows packed as by ``_pack_words``.
+    """
+    toeplitz_seed = _derive_toeplitz_seed(key, message_bits, tag_bits)
+    return _pack_words(_construct_toeplitz_matrix(toeplitz_seed, tag_bits, message_bits))
+
+
+def _empty_message_tag(key: bytes, tag_bits: int) -> bytes:
+    """Return the tag for an empty message, derived from the key only.
+
+    Parameters
+    ----------
+    key : bytes
+        Pre-shared authentication key.
+    tag_bits : int
+        Desired tag length in bits.
+
+    Returns
+    -------
+    bytes
+        Tag of length ceil(tag_bits / 8) bytes.
+    """
+    h = hmac.new(key, b"empty_message_tag", "sha256")
+    return h.digest()[:((tag_bits + 7) // 8)]
 
 
 def generate_auth_tag(
@@ -216,33 +415,76 @@ def generate_auth_tag(
       authentication and set equality"
     - extending_qkd_theorethical_aspects.md Step 3 §3.1
     """
-    # Convert message to bits
-    message_bits = _bytes_to_bits(message)
-    message_len = len(message_bits)
-    
-    if message_len == 0:
-        # Handle empty message: return tag derived from key only
-        h = hmac.new(key, b"empty_message_tag", "sha256")
-        return h.digest()[:((tag_bits + 7) // 8)]
+    if not message:
+        return _empty_message_tag(key, tag_bits)
     
-    # Derive Toeplitz matrix seed from key (reusable across messages)
-    toeplitz_seed = _derive_toeplitz_seed(key, message_len, tag_bits)
+    # Derive Toeplitz matrix from key (reusable across messages)
+    matrix = _derive_toeplitz_rows(key, len(message) * 8, tag_bits)
     
-    # Construct Toeplitz matrix
-    T = _construct_toeplitz_matrix(toeplitz_seed, tag_bits, message_len)
+    return generate_auth_tag_with_matrix(message, matrix, key, tag_bits)
+
+
+def generate_auth_tag_with_matrix(
+    message: bytes,
+    matrix: np.ndarray,
+    key: bytes,
+    tag_bits: int = DEFAULT_TAG_BITS
+) -> bytes:
+    """Generate Wegman-Carter authentication tag from a precomputed matrix.
+
+    Performs only the per-message work of ``generate_auth_tag``: the
+    GF(2) hash with an already derived Toeplitz matrix and the OTP mask.
+
+    Parameters
+    ----------
+    message : bytes
+        Message to authenticate (non-empty).
+    matrix : np.ndarray
+        Packed Toeplitz rows for ``len(message) * 8`` columns, as returned
+        by ``_derive_toeplitz_rows``.
+    key : bytes
+        Pre-shared authentication key.
+    tag_bits : int, optional
+        Tag length in bits. Must match the number of matrix rows.
+
+    Returns
+    -------
+    bytes
+        Authentication tag of length ceil(tag_bits / 8) bytes.
+    """
+    # Hash: H = T × M over GF(2), 64 columns per AND/popcount
+    hash_result = _gf2_matvec(matrix, _message_words(message))
     
-    # Hash: H = T × M (matrix-vector multiplication mod 2)
-    message_arr = np.array(message_bits, dtype=np.uint8)
-    hash_result = (T @ message_arr) % 2
+    return _mask_hash(hash_result, message, key, tag_bits)
+
+
+def _mask_hash(hash_result: np.ndarray, message: bytes, key: bytes, tag_bits: int) -> bytes:
+    """Encrypt a Toeplitz hash with the message's one-time pad mask.
+
+    Parameters
+    ----------
+    hash_result : np.ndarray
+        Hash bits H = T × M, length ``tag_bits``.
+    message : bytes
+        Message the hash belongs to (selects the OTP mask).
+    key : bytes
+        Pre-shared authentication key.
+    tag_bits : int
+        Tag length in bits.
+
+    Returns
+    -------
+    bytes
+        Tag = H ⊕ r, of length ceil(tag_bits / 8) bytes.
+    """
+    hash_bytes = _bits_to_bytes(hash_result)
     
     # Derive OTP mask (unique per message)
     otp_mask = _derive_otp_mask(key, message, tag_bits)
-    otp_arr = np.array(otp_mask[:tag_bits], dtype=np.uint8)
-    
-    # Tag = H ⊕ r (XOR with one-time pad)
-    tag_bits_result = (hash_result ^ otp_arr).tolist()
     
-    return _bits_to_bytes(tag_bits_result)
+    # Tag = H ⊕ r (XOR with one-time pad), on whole bytes
+    tag = int.from_bytes(hash_bytes, "big") ^ otp_mask
+    return tag.to_bytes(len(hash_bytes), "big")
 
 
 def verify_auth_tag(
@@ -298,8 +540,7 @@ def generate_toeplitz_seed_bits(seed_length: int) -> List[int]:
     """
     num_bytes = (seed_length + 7) // 8
     random_bytes = secrets.token_bytes(num_bytes)
-    bits = _bytes_to_bits(random_bytes)
-    return bits[:seed_length]
+    return _bytes_to_bits(random_bytes)[:seed_length].tolist()
 
 
 class ToeplitzAuthenticator:
@@ -323,6 +564,11 @@ class ToeplitzAuthenticator:
         Authentication key.
     _message_counter : int
         Counter for unique mask derivation.
+    _toeplitz_cache : OrderedDict[int, np.ndarray]
+        Packed Toeplitz matrices keyed by message length in bits, least
+        recently used first. The matrix depends only on the key, message
+        length and tag length, so it is derived once per length; at most
+        ``TOEPLITZ_CACHE_SIZE`` lengths are kept.
 
     Notes
     -----
@@ -340,6 +586,50 @@ class ToeplitzAuthenticator:
         self._key = key
         self.tag_bits = tag_bits
         self._message_counter = 0
+        self._toeplitz_cache: "OrderedDict[int, np.ndarray]" = OrderedDict()
+
+    def _toeplitz_rows(self, message_len: int) -> np.ndarray:
+        """Return the packed Toeplitz matrix for a message length, cached.
+
+        Parameters
+        ----------
+        message_len : int
+            Message length in bits.
+
+        Returns
+        -------
+        np.ndarray
+            Packed Toeplitz rows as returned by ``_derive_toeplitz_rows``.
+        """
+        matrix = self._toeplitz_cache.get(message_len)
+        if matrix is not None:
+            self._toeplitz_cache.move_to_end(message_len)
+            return matrix
+
+        matrix = _derive_toeplitz_rows(self._key, message_len, self.tag_bits)
+        self._toeplitz_cache[message_len] = matrix
+        if len(self._toeplitz_cache) > TOEPLITZ_CACHE_SIZE:
+            self._toeplitz_cache.popitem(last=False)
+        return matrix
+
+    def _generate_tag(self, message: bytes) -> bytes:
+        """Generate a tag, reusing the cached Toeplitz matrix for this length.
+
+        Parameters
+        ----------
+        message : bytes
+            Message to authenticate.
+
+        Returns
+        -------
+        bytes
+            Authentication tag, identical to ``generate_auth_tag``.
+        """
+        if not message:
+            return _empty_message_tag(self._key, self.tag_bits)
+
+        matrix = self._toeplitz_rows(len(message) * 8)
+        return generate_auth_tag_with_matrix(message, matrix, self._key, self.tag_bits)
 
     def authenticate(self, message: bytes) -> Tuple[bytes, bytes]:
         """Generate authentication tag for a message.
@@ -354,10 +644,50 @@ class ToeplitzAuthenticator:
         Tuple[bytes, bytes]
             Tuple of (message, tag).
         """
-        tag = generate_auth_tag(message, self._key, self.tag_bits)
+        tag = self._generate_tag(message)
         self._message_counter += 1
         return message, tag
 
+    def batch_authenticate(self, messages: List[bytes]) -> List[bytes]:
+        """Generate authentication tags for several messages at once.
+
+        Messages are grouped by length; each group is hashed with a single
+        vectorized pass over its (cached) Toeplitz matrix.
+
+        Parameters
+        ----------
+        messages : List[bytes]
+            Messages to authenticate.
+
+        Returns
+        -------
+        List[bytes]
+            Tags in the order of ``messages``, identical to calling
+            ``authenticate`` on each message.
+        """
+        tags: List[bytes] = [b""] * len(messages)
+        groups: Dict[int, List[int]] = {}
+        for position, message in enumerate(messages):
+            groups.setdefault(len(message), []).append(position)
+
+        for length, positions in groups.items():
+            if length == 0:
+                empty_tag = _empty_message_tag(self._key, self.tag_bits)
+                for position in positions:
+                    tags[position] = empty_tag
+                continue
+
+            matrix = self._toeplitz_rows(length * 8)
+            message_words = np.stack([_message_words(messages[p]) for p in positions])
+            hashes = _gf2_matmat(matrix, message_words)
+            for column, position in enumerate(positions):
+                tags[position] = _mask_hash(
+                    hashes[:, column], messages[position], self._key, self.tag_bits
+                )
+
+        self._message_counter += len(messages)
+        return tags
+
     def verify(self, message: bytes, tag: bytes) -> bool:
         """Verify a message-tag pair.
 
@@ -373,7 +703,7 @@ class ToeplitzAuthenticator:
         bool
             True if verification succeeds.
         """
-        is_valid = verify_auth_tag(message, tag, self._key, self.tag_bits)
+        is_valid = hmac.compare_digest(tag, self._generate_tag(message))
         self._message_counter += 1
         return is_valid
 
@@ -12,17 +12,62 @@ Usage:
     config = load_scenario("low_noise")
 """
 
+import copy
+import functools
 import os
 from pathlib import Path
 from typing import Any, Dict, List
 
 import yaml
 
+try:
+    # libyaml C parser, when PyYAML was built against it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 CONFIGS_DIR = Path(__file__).parent
 SCENARIOS_DIR = CONFIGS_DIR / "scenarios"
 NETWORKS_DIR = CONFIGS_DIR / "networks"
 
 
+@functools.lru_cache(maxsize=64)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file, memoized per path and modification time.
+
+    Parameters
+    ----------
+    path : str
+        Path to the YAML file.
+    mtime_ns : int
+        File modification time in nanoseconds. Part of the cache key only,
+        so an edited file is parsed again.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Parsed content (shared; callers must not modify it).
+    """
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_SafeLoader) or {}
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    """Load a YAML file through the parse cache.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the YAML file.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Parsed content as a fresh copy that the caller may modify.
+    """
+    return copy.deepcopy(_load_yaml_cached(str(path), path.stat().st_mtime_ns))
+
+
 def load_base_config() -> Dict[str, Any]:
     """Load the base configuration.
     
@@ -35,8 +80,7 @@ def load_base_config() -> Dict[str, Any]:
     if not base_path.exists():
         return {}
     
-    with open(base_path, "r") as f:
-        return yaml.safe_load(f) or {}
+    return _load_yaml(base_path)
 
 
 def load_scenario(name: str) -> Dict[str, Any]:
@@ -61,14 +105,13 @@ def load_scenario(name: str) -> Dict[str, Any]:
     if not scenario_path.exists():
         raise FileNotFoundError(f"Scenario not found: {scenario_path}")
     
-    # Start with base config
+    # Start with base config (a fresh copy, so it is merged in place)
     config = load_base_config()
     
     # Load and merge scenario
-    with open(scenario_path, "r") as f:
-        scenario = yaml.safe_load(f) or {}
+    scenario = _load_yaml(scenario_path)
     
-    return _deep_merge(config, scenario)
+    return _deep_merge(config, scenario, in_place=True)
 
 
 def load_network(name: str) -> Dict[str, Any]:
@@ -88,8 +131,7 @@ def load_network(name: str) -> Dict[str, Any]:
     if not network_path.exists():
         raise FileNotFoundError(f"Network not found: {network_path}")
     
-    with open(network_path, "r") as f:
-        return yaml.safe_load(f) or {}
+    return _load_yaml(network_path)
 
 
 def list_scenarios() -> List[str]:
@@ -118,7 +160,7 @@ def list_networks() -> List[str]:
     return sorted(f.stem for f in NETWORKS_DIR.glob("*.yaml"))
 
 
-def _deep_merge(base: Dict, override: Dict) -> Dict:
+def _deep_merge(base: Dict, override: Dict, in_place: bool = False) -> Dict:
     """Deep merge two dictionaries.
     
     Parameters
@@ -127,18 +169,30 @@ def _deep_merge(base: Dict, override: Dict) -> Dict:
         Base dictionary.
     override : Dict
         Override dictionary (values take precedence).
+    in_place : bool, optional
+        Merge into ``base`` itself, for callers that own a fresh copy.
+        Default False.
     
     Returns
     -------
     Dict
-        Merged dictionary.
+        Merged dictionary. Unless ``in_place`` is set, ``base`` is not
+        modified: only the dicts along the override paths are copied, and
+        the rest of the tree is shared with ``base``.
     """
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
-        else:
-            result[key] = value
+    # Merge level by level with an explicit stack instead of recursing
+    result = base if in_place else base.copy()
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                if not in_place:
+                    current = target[key] = current.copy()
+                stack.append((current, value))
+            else:
+                target[key] = value
     return result
 
 
@@ -27,6 +27,7 @@ from hackathon_challenge.core.protocol import (
     AliceProgram,
     BobProgram,
     QkdProgram,
+    PairArrays,
     PairInfo,
     create_qkd_programs,
 )
@@ -57,6 +58,7 @@ __all__ = [
     "AliceProgram",
     "BobProgram",
     "QkdProgram",
+    "PairArrays",
     "PairInfo",
     "create_qkd_programs",
 ]
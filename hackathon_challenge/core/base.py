@@ -4,7 +4,30 @@ Reference: implementation_plan.md §Phase 0
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from hackathon_challenge.core.constants import (
+    RESULT_ERROR,
+    RESULT_KEY_LENGTH,
+    RESULT_LEAKAGE,
+    RESULT_QBER,
+    RESULT_SECRET_KEY,
+    RESULT_SUCCESS,
+)
+from hackathon_challenge.utils.compat import DATACLASS_SLOTS
+
+# Result-dictionary keys and the QKDResult fields they map to
+_RESULT_FIELDS: Dict[str, str] = {
+    RESULT_SECRET_KEY: "secret_key",
+    RESULT_QBER: "qber",
+    RESULT_KEY_LENGTH: "key_length",
+    RESULT_LEAKAGE: "leakage",
+    RESULT_SUCCESS: "success",
+    RESULT_ERROR: "error",
+    "message": "error_message",
+}
 
 
 @dataclass
@@ -42,29 +65,84 @@ class PrivacyConfig:
     compression_factor: float = 0.8
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class QKDResult:
     """Result of a QKD protocol run.
 
+    Returned by ``AliceProgram.run`` and ``BobProgram.run``. For
+    compatibility with the former dictionary results it also supports
+    ``result[RESULT_*]``, ``key in result`` and ``result.get(key)``, where
+    fields that are None count as missing keys.
+
     Attributes
     ----------
-    secret_key : List[int]
+    secret_key : Union[List[int], np.ndarray]
         Final secret key bits.
-    qber : float
-        Estimated Quantum Bit Error Rate.
-    key_length : int
-        Length of the final secret key.
-    leakage : int
-        Total information leakage (EC + verification).
+    qber : Optional[float]
+        Estimated Quantum Bit Error Rate (None if not reached).
+    key_length : Optional[int]
+        Length of the final secret key (None if the run aborted).
+    leakage : Optional[int]
+        Total information leakage (EC + verification; None if the run
+        aborted).
     success : bool
         Whether the protocol completed successfully.
     error_message : Optional[str]
         Error message if protocol failed.
+    error : Optional[str]
+        Short error code if protocol failed.
     """
 
-    secret_key: List[int]
-    qber: float
-    key_length: int
-    leakage: int
+    secret_key: Union[List[int], np.ndarray]
+    qber: Optional[float]
+    key_length: Optional[int]
+    leakage: Optional[int]
     success: bool
     error_message: Optional[str] = None
+    error: Optional[str] = None
+
+    @classmethod
+    def failure(cls, error_code: str, message: str) -> "QKDResult":
+        """Create the result of an aborted run.
+
+        Parameters
+        ----------
+        error_code : str
+            Short error identifier.
+        message : str
+            Human-readable error message.
+
+        Returns
+        -------
+        QKDResult
+            Unsuccessful result with an empty key. QBER, key length and
+            leakage are None, so like the former error dictionary it only
+            has the secret key, success, error and message keys.
+        """
+        return cls(
+            secret_key=[],
+            qber=None,
+            key_length=None,
+            leakage=None,
+            success=False,
+            error_message=message,
+            error=error_code,
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, _RESULT_FIELDS[key])
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        field_name = _RESULT_FIELDS.get(key) if isinstance(key, str) else None
+        return field_name is not None and getattr(self, field_name) is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for a result key, or ``default`` if missing."""
+        return self[key] if key in self else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a dictionary keyed by the RESULT_* constants."""
+        return {key: self[key] for key in _RESULT_FIELDS if key in self}
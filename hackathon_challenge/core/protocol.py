@@ -30,10 +30,10 @@ Key SquidASM patterns:
 """
 
 import abc
-import random
 from dataclasses import dataclass
-from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+from typing import Any, Generator, List, Optional, Tuple, Union
 
+import numpy as np
 from netqasm.sdk.classical_communication.message import StructuredMessage
 from pydynaa import EventExpression
 from squidasm.sim.stack.program import Program, ProgramContext, ProgramMeta
@@ -50,22 +50,20 @@ from hackathon_challenge.core.constants import (
     MSG_ALL_MEASURED,
     MSG_PA_SEED,
     QBER_THRESHOLD,
-    RESULT_ERROR,
-    RESULT_KEY_LENGTH,
-    RESULT_LEAKAGE,
-    RESULT_QBER,
-    RESULT_SECRET_KEY,
-    RESULT_SUCCESS,
     SECURITY_PARAMETER,
 )
 from hackathon_challenge.privacy.amplifier import PrivacyAmplifier
 from hackathon_challenge.privacy.entropy import compute_final_key_length
 from hackathon_challenge.privacy.estimation import estimate_qber_from_cascade
-from hackathon_challenge.privacy.utils import generate_toeplitz_seed
+from hackathon_challenge.privacy.utils import generate_toeplitz_seed_array
 from hackathon_challenge.reconciliation.simple_cascade import SimpleCascadeReconciliator
+from hackathon_challenge.utils.compat import NUMBA_AVAILABLE
 from hackathon_challenge.utils.logging import get_logger
 from hackathon_challenge.verification.verifier import KeyVerifier
 
+if NUMBA_AVAILABLE:
+    from numba import njit
+
 
 # Module logger
 logger = get_logger(__name__)
@@ -102,6 +100,283 @@ class PairInfo:
     same_outcome: Optional[bool] = None
 
 
+@dataclass
+class PairArrays:
+    """Per-pair protocol state stored as parallel NumPy arrays.
+
+    Structure-of-arrays counterpart of a ``List[PairInfo]``: element ``i``
+    of every array describes pair ``i``, so sifting, sampling and key
+    extraction are vectorized operations instead of attribute scans.
+
+    Attributes
+    ----------
+    basis : np.ndarray
+        Measurement bases (uint8). 0 = Z, 1 = X.
+    outcome : np.ndarray
+        Measurement outcomes (uint8).
+    same_basis : np.ndarray
+        Whether the peer measured in the same basis (bool).
+    test_outcome : np.ndarray
+        Whether the pair is used for error estimation (bool).
+    same_outcome : np.ndarray
+        Whether outcomes match; only meaningful for test pairs (bool).
+    """
+
+    basis: np.ndarray
+    outcome: np.ndarray
+    same_basis: np.ndarray
+    test_outcome: np.ndarray
+    same_outcome: np.ndarray
+
+    @classmethod
+    def from_measurements(cls, basis: np.ndarray, outcome: np.ndarray) -> "PairArrays":
+        """Create arrays for freshly measured pairs.
+
+        Parameters
+        ----------
+        basis : np.ndarray
+            Measurement bases.
+        outcome : np.ndarray
+            Measurement outcomes.
+
+        Returns
+        -------
+        PairArrays
+            Arrays with all flags cleared.
+        """
+        n = len(basis)
+        return cls(
+            basis=np.asarray(basis, dtype=np.uint8),
+            outcome=np.asarray(outcome, dtype=np.uint8),
+            same_basis=np.zeros(n, dtype=bool),
+            test_outcome=np.zeros(n, dtype=bool),
+            same_outcome=np.zeros(n, dtype=bool),
+        )
+
+    @classmethod
+    def from_pair_info(cls, pairs: List[PairInfo]) -> "PairArrays":
+        """Convert a list of PairInfo records (unset flags become False).
+
+        Parameters
+        ----------
+        pairs : List[PairInfo]
+            Pairs ordered by index.
+
+        Returns
+        -------
+        PairArrays
+            Equivalent array representation.
+        """
+        n = len(pairs)
+        return cls(
+            basis=np.fromiter((p.basis for p in pairs), dtype=np.uint8, count=n),
+            outcome=np.fromiter((p.outcome for p in pairs), dtype=np.uint8, count=n),
+            same_basis=np.fromiter((bool(p.same_basis) for p in pairs), dtype=bool, count=n),
+            test_outcome=np.fromiter((bool(p.test_outcome) for p in pairs), dtype=bool, count=n),
+            same_outcome=np.fromiter((bool(p.same_outcome) for p in pairs), dtype=bool, count=n),
+        )
+
+    def to_pair_info(self) -> List[PairInfo]:
+        """Convert back to a list of PairInfo records.
+
+        Returns
+        -------
+        List[PairInfo]
+            One record per pair.
+        """
+        return [
+            PairInfo(
+                index=i,
+                basis=basis,
+                outcome=outcome,
+                same_basis=same_basis,
+                test_outcome=test_outcome,
+                same_outcome=same_outcome,
+            )
+            for i, (basis, outcome, same_basis, test_outcome, same_outcome) in enumerate(
+                zip(
+                    self.basis.tolist(),
+                    self.outcome.tolist(),
+                    self.same_basis.tolist(),
+                    self.test_outcome.tolist(),
+                    self.same_outcome.tolist(),
+                )
+            )
+        ]
+
+    def packed_bases(self) -> str:
+        """Encode the bases as a packed bitstring for the sifting message.
+
+        Returns
+        -------
+        str
+            Hex string of the bases packed eight per byte (see ``_pack_bits``).
+        """
+        return _pack_bits(self.basis)
+
+    def mark_test_pairs(self, indices: Any) -> np.ndarray:
+        """Flag exactly the given pairs as test pairs.
+
+        Parameters
+        ----------
+        indices : array_like of int
+            Pair indices selected for error estimation.
+
+        Returns
+        -------
+        np.ndarray
+            The indices as an integer array.
+
+        Raises
+        ------
+        ValueError
+            If an index is outside ``[0, len(self))``. Negative indices are
+            rejected rather than wrapped, since they arrive from the peer.
+        """
+        idx = np.asarray(indices, dtype=np.intp).reshape(-1)
+        if idx.size and (idx.min() < 0 or idx.max() >= len(self)):
+            raise ValueError(f"Test index out of range for {len(self)} pairs")
+        self.test_outcome = np.zeros(len(self), dtype=bool)
+        self.test_outcome[idx] = True
+        return idx
+
+    def __len__(self) -> int:
+        return len(self.basis)
+
+
+def _pack_bits(bits: Union[List[int], np.ndarray]) -> str:
+    """Encode a bit sequence as a compact, JSON-safe message payload.
+
+    Parameters
+    ----------
+    bits : Union[List[int], np.ndarray]
+        Bits (0/1) to encode.
+
+    Returns
+    -------
+    str
+        Hex string of the bits packed eight per byte, least significant
+        bit first (bit ``i`` is bit ``i % 8`` of byte ``i // 8``).
+    """
+    return np.packbits(np.asarray(bits, dtype=np.uint8), bitorder="little").tobytes().hex()
+
+
+def _decode_packed(payload: str, num_bits: int) -> np.ndarray:
+    """Decode a ``_pack_bits`` payload without unpacking the bits.
+
+    Parameters
+    ----------
+    payload : str
+        Hex-encoded packed bits received from the peer.
+    num_bits : int
+        Number of bits expected.
+
+    Returns
+    -------
+    np.ndarray
+        Packed bytes (uint8), eight bits per element.
+
+    Raises
+    ------
+    ValueError
+        If the payload does not encode exactly ``num_bits`` bits.
+    """
+    packed = np.frombuffer(bytes.fromhex(payload), dtype=np.uint8)
+    if len(packed) != (num_bits + 7) // 8:
+        raise ValueError(
+            f"Packed length mismatch: {len(packed)} bytes for {num_bits} bits"
+        )
+    return packed
+
+
+def _unpack_bits(payload: str, num_bits: int) -> np.ndarray:
+    """Decode a payload produced by ``_pack_bits``.
+
+    Parameters
+    ----------
+    payload : str
+        Hex-encoded packed bits received from the peer.
+    num_bits : int
+        Number of bits expected.
+
+    Returns
+    -------
+    np.ndarray
+        Bits as uint8 array of length ``num_bits``.
+
+    Raises
+    ------
+    ValueError
+        If the payload does not encode exactly ``num_bits`` bits.
+    """
+    packed = _decode_packed(payload, num_bits)
+    return np.unpackbits(packed, count=num_bits, bitorder="little")
+
+
+def _score_test_bits_numpy(
+    local_outs: np.ndarray,
+    remote_outs: np.ndarray,
+    test_idx: np.ndarray,
+    same_outcome: np.ndarray,
+) -> int:
+    """NumPy implementation of ``_score_test_bits``."""
+    matches = local_outs == remote_outs
+    same_outcome[test_idx] = matches
+    return len(matches) - int(np.count_nonzero(matches))
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _score_test_bits_jit(
+        local_outs: np.ndarray,
+        remote_outs: np.ndarray,
+        test_idx: np.ndarray,
+        same_outcome: np.ndarray,
+    ) -> int:
+        """Numba implementation of ``_score_test_bits``."""
+        num_errors = 0
+        for k in range(len(test_idx)):
+            match = local_outs[k] == remote_outs[k]
+            same_outcome[test_idx[k]] = match
+            if not match:
+                num_errors += 1
+        return num_errors
+
+
+def _score_test_bits(
+    local_outs: np.ndarray,
+    remote_outs: np.ndarray,
+    test_idx: np.ndarray,
+    same_outcome: np.ndarray,
+) -> int:
+    """Compare test outcomes, record matches and count errors.
+
+    Uses a Numba kernel when numba is installed, which does the compare,
+    the scatter into ``same_outcome`` and the count in one loop without
+    the intermediate match array.
+
+    Parameters
+    ----------
+    local_outs : np.ndarray
+        Local outcomes of the test pairs, in test-index order.
+    remote_outs : np.ndarray
+        Peer outcomes of the same pairs, in the same order.
+    test_idx : np.ndarray
+        Indices of the test pairs.
+    same_outcome : np.ndarray
+        Per-pair match flags (bool), updated in place at ``test_idx``.
+
+    Returns
+    -------
+    int
+        Number of test pairs whose outcomes differ.
+    """
+    if NUMBA_AVAILABLE:
+        return int(_score_test_bits_jit(local_outs, remote_outs, test_idx, same_outcome))
+    return _score_test_bits_numpy(local_outs, remote_outs, test_idx, same_outcome)
+
+
 class QkdProgram(Program, abc.ABC):
     """Base class for QKD protocol programs.
 
@@ -118,6 +393,8 @@ class QkdProgram(Program, abc.ABC):
         Shared RNG seed for Cascade permutations.
     auth_key : bytes, optional
         Pre-shared authentication key.
+    rng_seed : int, optional
+        Seed for this node's private RNG (bases, test sampling).
 
     Attributes
     ----------
@@ -125,6 +402,12 @@ class QkdProgram(Program, abc.ABC):
         Name of peer node (must be defined by subclass).
     _logger : logging.Logger
         Protocol logger instance.
+    _rng : np.random.Generator
+        Private RNG for basis choice and test-index sampling.
+    _verifier : KeyVerifier
+        Key verifier reused across runs.
+    _amplifier : PrivacyAmplifier
+        Privacy amplifier reused across runs.
 
     Notes
     -----
@@ -144,6 +427,7 @@ class QkdProgram(Program, abc.ABC):
         auth_key: Optional[bytes] = None,
         verification_tag_bits: int = DEFAULT_TAG_BITS,
         security_parameter: float = SECURITY_PARAMETER,
+        rng_seed: Optional[int] = None,
     ) -> None:
         """Initialize QKD program.
 
@@ -161,6 +445,10 @@ class QkdProgram(Program, abc.ABC):
             Hash tag bits for verification (64 or 128).
         security_parameter : float
             Security parameter for PA.
+        rng_seed : Optional[int]
+            Seed for the private RNG. None seeds from OS entropy. This is
+            deliberately separate from ``cascade_seed``: bases must stay
+            private, and must not coincide with the peer's choices.
         """
         self._num_epr_pairs = num_epr_pairs
         self._num_test_bits = num_test_bits if num_test_bits else num_epr_pairs // 4
@@ -168,6 +456,11 @@ class QkdProgram(Program, abc.ABC):
         self._auth_key = auth_key or b"default_shared_key_for_testing"
         self._verification_tag_bits = verification_tag_bits
         self._security_parameter = security_parameter
+        self._rng = np.random.default_rng(rng_seed)
+        # Stateless between runs (the verifier's leakage counter is reset
+        # per run), so build them once per program instance
+        self._verifier = KeyVerifier(tag_bits=verification_tag_bits)
+        self._amplifier = PrivacyAmplifier(epsilon_sec=security_parameter)
         self._logger = get_logger(self.__class__.__name__)
 
     @property
@@ -177,13 +470,13 @@ class QkdProgram(Program, abc.ABC):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def run(self, context: ProgramContext) -> Generator[EventExpression, None, Dict[str, Any]]:
+    def run(self, context: ProgramContext) -> Generator[EventExpression, None, QKDResult]:
         """Execute the QKD protocol."""
         raise NotImplementedError
 
     def _distribute_states(
         self, context: ProgramContext, is_initiator: bool
-    ) -> Generator[EventExpression, None, List[PairInfo]]:
+    ) -> Generator[EventExpression, None, PairArrays]:
         """Generate and measure EPR pairs in random bases.
 
         Parameters
@@ -200,52 +493,63 @@ class QkdProgram(Program, abc.ABC):
 
         Returns
         -------
-        List[PairInfo]
-            Information about each measured pair.
+        PairArrays
+            Bases and outcomes of every measured pair.
 
         Notes
         -----
         CRITICAL: Must call `yield from conn.flush()` after quantum ops.
         Reference: technical doc pitfall #2
+
+        Pairs are processed in batches of at most ``DEFAULT_MAX_QUBITS``
+        (the qubit budget declared in ``meta``), so the subroutine is
+        flushed ``ceil(N / DEFAULT_MAX_QUBITS)`` times instead of once per
+        pair. Measurement results are only read after the flush.
         """
         conn = context.connection
         epr_socket = context.epr_sockets[self.PEER]
 
-        results = []
+        num_pairs = self._num_epr_pairs
+        outcomes = np.empty(num_pairs, dtype=np.uint8)
 
-        for i in range(self._num_epr_pairs):
-            # Random basis: 0 = Z, 1 = X
-            basis = random.randint(0, 1)
+        # Draw every basis at once (0 = Z, 1 = X)
+        bases = self._rng.integers(0, 2, size=num_pairs, dtype=np.uint8)
+
+        for start in range(0, num_pairs, DEFAULT_MAX_QUBITS):
+            batch_size = min(DEFAULT_MAX_QUBITS, num_pairs - start)
 
             if is_initiator:
-                q = epr_socket.create_keep(1)[0]
+                qubits = epr_socket.create_keep(batch_size)
             else:
-                q = epr_socket.recv_keep(1)[0]
+                qubits = epr_socket.recv_keep(batch_size)
+
+            measurements = []
+            for q, basis in zip(qubits, bases[start:start + batch_size].tolist()):
+                # Apply Hadamard for X basis
+                if basis == 1:
+                    q.H()
 
-            # Apply Hadamard for X basis
-            if basis == 1:
-                q.H()
+                measurements.append(q.measure())
 
-            m = q.measure()
             yield from conn.flush()
 
-            results.append(PairInfo(index=i, outcome=int(m), basis=basis))
+            outcomes[start:start + batch_size] = [int(m) for m in measurements]
 
-        return results
+        return PairArrays.from_measurements(bases, outcomes)
 
     def _filter_bases(
         self,
         socket: Union[AuthenticatedSocket, "ClassicalSocket"],
-        pairs_info: List[PairInfo],
+        pairs: PairArrays,
         is_initiator: bool,
-    ) -> Generator[EventExpression, None, List[PairInfo]]:
+    ) -> Generator[EventExpression, None, PairArrays]:
         """Exchange bases and filter to matching pairs.
 
         Parameters
         ----------
         socket : AuthenticatedSocket or ClassicalSocket
             Socket for classical communication.
-        pairs_info : List[PairInfo]
+        pairs : PairArrays
             Pairs from distribution phase.
         is_initiator : bool
             True if this node sends first.
@@ -257,14 +561,19 @@ class QkdProgram(Program, abc.ABC):
 
         Returns
         -------
-        List[PairInfo]
-            Pairs with same_basis field populated.
+        PairArrays
+            Pairs with the same_basis mask populated.
 
         Notes
         -----
+        Bases are exchanged as a packed bitstring (see
+        ``PairArrays.packed_bases``) rather than a list of (index, basis)
+        tuples; both sides order pairs identically, so indices are implicit.
+        Matching XORs the two packed strings and unpacks only the result,
+        so the peer's bases are never expanded to one byte per pair.
         Reference: example_qkd.py _filter_bases
         """
-        bases = [(pair.index, pair.basis) for pair in pairs_info]
+        bases = pairs.packed_bases()
 
         if is_initiator:
             socket.send_structured(StructuredMessage("Bases", bases))
@@ -275,32 +584,35 @@ class QkdProgram(Program, abc.ABC):
             remote_bases = response.payload
             socket.send_structured(StructuredMessage("Bases", bases))
 
-        # Match bases
-        for (i, basis), (remote_i, remote_basis) in zip(bases, remote_bases):
-            assert i == remote_i, f"Index mismatch: {i} != {remote_i}"
-            pairs_info[i].same_basis = (basis == remote_basis)
+        # Match bases: a zero bit in the XOR means both used the same basis
+        diff = _decode_packed(bases, len(pairs)) ^ _decode_packed(remote_bases, len(pairs))
+        pairs.same_basis = np.unpackbits(diff, count=len(pairs), bitorder="little") == 0
 
-        return pairs_info
+        return pairs
 
     def _estimate_error_rate(
         self,
         socket: Union[AuthenticatedSocket, "ClassicalSocket"],
-        pairs_info: List[PairInfo],
+        pairs: PairArrays,
         num_test_bits: int,
         is_initiator: bool,
-    ) -> Generator[EventExpression, None, Tuple[List[PairInfo], float]]:
+        same_basis_indices: Optional[np.ndarray] = None,
+    ) -> Generator[EventExpression, None, Tuple[PairArrays, int, int]]:
         """Estimate QBER by comparing random sample of outcomes.
 
         Parameters
         ----------
         socket : AuthenticatedSocket or ClassicalSocket
             Socket for classical communication.
-        pairs_info : List[PairInfo]
+        pairs : PairArrays
             Pairs after basis sifting.
         num_test_bits : int
             Number of bits to sample.
         is_initiator : bool
             True if this node selects test indices.
+        same_basis_indices : Optional[np.ndarray]
+            ``np.flatnonzero(pairs.same_basis)`` if the caller already
+            has it; computed here otherwise. Only used by the initiator.
 
         Yields
         ------
@@ -309,8 +621,10 @@ class QkdProgram(Program, abc.ABC):
 
         Returns
         -------
-        Tuple[List[PairInfo], float]
-            Updated pairs and estimated error rate.
+        Tuple[PairArrays, int, int]
+            Updated pairs, number of mismatched test bits and number of
+            test bits compared. The counts are returned exactly rather than
+            as a rate so callers need not reconstruct them from a float.
 
         Notes
         -----
@@ -319,19 +633,21 @@ class QkdProgram(Program, abc.ABC):
         """
         if is_initiator:
             # Select random subset of same-basis pairs for testing
-            same_basis_indices = [pair.index for pair in pairs_info if pair.same_basis]
-            test_indices = random.sample(
-                same_basis_indices, min(num_test_bits, len(same_basis_indices))
+            if same_basis_indices is None:
+                same_basis_indices = np.flatnonzero(pairs.same_basis)
+            test_indices = self._rng.choice(
+                same_basis_indices,
+                size=min(num_test_bits, len(same_basis_indices)),
+                replace=False,
             )
 
             # Mark test pairs
-            for pair in pairs_info:
-                pair.test_outcome = pair.index in test_indices
-
-            test_outcomes = [(i, pairs_info[i].outcome) for i in test_indices]
+            test_idx = pairs.mark_test_pairs(test_indices)
+            local_test_outs = pairs.outcome[test_idx]
+            test_outcomes = list(zip(test_idx.tolist(), local_test_outs.tolist()))
 
             # Exchange test information
-            socket.send_structured(StructuredMessage("Test indices", test_indices))
+            socket.send_structured(StructuredMessage("Test indices", test_idx.tolist()))
             response = yield from socket.recv_structured()
             target_test_outcomes = response.payload
             socket.send_structured(StructuredMessage("Test outcomes", test_outcomes))
@@ -341,50 +657,41 @@ class QkdProgram(Program, abc.ABC):
             test_indices = response.payload
 
             # Mark test pairs
-            for pair in pairs_info:
-                pair.test_outcome = pair.index in test_indices
-
-            test_outcomes = [(i, pairs_info[i].outcome) for i in test_indices]
+            test_idx = pairs.mark_test_pairs(test_indices)
+            local_test_outs = pairs.outcome[test_idx]
+            test_outcomes = list(zip(test_idx.tolist(), local_test_outs.tolist()))
 
             # Exchange test outcomes
             socket.send_structured(StructuredMessage("Test outcomes", test_outcomes))
             response = yield from socket.recv_structured()
             target_test_outcomes = response.payload
 
-        # Count errors - sort both by index for consistent comparison
-        test_outcomes_sorted = sorted(test_outcomes, key=lambda x: x[0])
-        target_outcomes_sorted = sorted(target_test_outcomes, key=lambda x: x[0])
+        # Count errors - both sides list outcomes in the order of the
+        # test indices sent by the initiator, so no re-sorting is needed
+        remote = np.asarray(target_test_outcomes, dtype=np.int64).reshape(-1, 2)
+        assert np.array_equal(remote[:, 0], test_idx), "Test index mismatch"
 
-        num_errors = 0
-        for (i1, t1), (i2, t2) in zip(test_outcomes_sorted, target_outcomes_sorted):
-            assert i1 == i2, f"Test index mismatch: {i1} != {i2}"
-            if t1 != t2:
-                num_errors += 1
-                pairs_info[i1].same_outcome = False
-            else:
-                pairs_info[i1].same_outcome = True
+        num_errors = _score_test_bits(local_test_outs, remote[:, 1], test_idx, pairs.same_outcome)
 
-        error_rate = num_errors / max(1, len(test_outcomes))
-        return pairs_info, error_rate
+        return pairs, num_errors, len(test_idx)
 
-    def _extract_raw_key(self, pairs_info: List[PairInfo]) -> List[int]:
+    def _extract_raw_key(self, pairs: PairArrays) -> np.ndarray:
         """Extract raw key from sifted, non-test pairs.
 
         Parameters
         ----------
-        pairs_info : List[PairInfo]
+        pairs : PairArrays
             Pairs after sifting and error sampling.
 
         Returns
         -------
-        List[int]
-            Raw key bits.
+        np.ndarray
+            Raw key bits (uint8, one bit per element). The key stays an
+            array through reconciliation, verification and amplification.
         """
-        return [
-            pair.outcome
-            for pair in pairs_info
-            if pair.same_basis and not pair.test_outcome
-        ]
+        # For booleans ``a > b`` is ``a & ~b`` evaluated in one ufunc pass,
+        # without the temporary inverted test mask
+        return pairs.outcome[np.greater(pairs.same_basis, pairs.test_outcome)]
 
 
 class AliceProgram(QkdProgram):
@@ -420,14 +727,15 @@ class AliceProgram(QkdProgram):
 
     Returns
     -------
-    Dict[str, Any]
-        Protocol result with keys:
+    QKDResult
+        Protocol result, indexable by the keys:
         - "secret_key": Final key bits
         - "qber": Estimated QBER
         - "key_length": Final key length
         - "leakage": Total leakage
         - "success": Whether protocol succeeded
-        - "error": Error message (if failed)
+        - "error": Error code (if failed)
+        - "message": Error message (if failed)
 
     Reference: implementation_plan.md §Phase 5 (AliceProgram)
     """
@@ -457,7 +765,7 @@ class AliceProgram(QkdProgram):
 
     def run(
         self, context: ProgramContext
-    ) -> Generator[EventExpression, None, Dict[str, Any]]:
+    ) -> Generator[EventExpression, None, QKDResult]:
         """Execute Alice's QKD protocol.
 
         Parameters
@@ -472,8 +780,8 @@ class AliceProgram(QkdProgram):
 
         Returns
         -------
-        Dict[str, Any]
-            Protocol result dictionary.
+        QKDResult
+            Protocol result (also indexable by the RESULT_* keys).
 
         Notes
         -----
@@ -485,8 +793,8 @@ class AliceProgram(QkdProgram):
         self._logger.info("Authentication socket initialized")
 
         # ========== 2. Quantum Phase: EPR Distribution ==========
-        pairs_info = yield from self._distribute_states(context, is_initiator=True)
-        self._logger.info(f"Distributed {len(pairs_info)} EPR pairs")
+        pairs = yield from self._distribute_states(context, is_initiator=True)
+        self._logger.info(f"Distributed {len(pairs)} EPR pairs")
 
         # Wait for Bob's confirmation
         response = yield from auth_socket.recv_structured()
@@ -495,14 +803,19 @@ class AliceProgram(QkdProgram):
             return self._error_result("protocol_error", "Unexpected sync message")
 
         # ========== 3. Sifting ==========
-        pairs_info = yield from self._filter_bases(auth_socket, pairs_info, is_initiator=True)
-        same_basis_count = sum(1 for p in pairs_info if p.same_basis)
-        self._logger.info(f"Sifting complete: {same_basis_count} same-basis pairs")
+        pairs = yield from self._filter_bases(auth_socket, pairs, is_initiator=True)
+        same_basis_indices = np.flatnonzero(pairs.same_basis)
+        self._logger.info(f"Sifting complete: {len(same_basis_indices)} same-basis pairs")
 
         # ========== 4. QBER Estimation ==========
-        pairs_info, sample_qber = yield from self._estimate_error_rate(
-            auth_socket, pairs_info, self._num_test_bits, is_initiator=True
+        pairs, sample_errors, num_tests = yield from self._estimate_error_rate(
+            auth_socket,
+            pairs,
+            self._num_test_bits,
+            is_initiator=True,
+            same_basis_indices=same_basis_indices,
         )
+        sample_qber = sample_errors / max(1, num_tests)
         self._logger.info(f"Sample QBER: {sample_qber:.4f}")
 
         # Check QBER threshold
@@ -511,7 +824,7 @@ class AliceProgram(QkdProgram):
             return self._error_result("qber_too_high", f"QBER {sample_qber:.4f} > {QBER_THRESHOLD}")
 
         # ========== 5. Extract Raw Key ==========
-        raw_key = self._extract_raw_key(pairs_info)
+        raw_key = self._extract_raw_key(pairs)
         self._logger.info(f"Raw key length: {len(raw_key)}")
 
         if len(raw_key) < MIN_KEY_LENGTH:
@@ -527,7 +840,7 @@ class AliceProgram(QkdProgram):
             estimated_qber=sample_qber,
         )
         leakage_ec = yield from reconciler.reconcile()
-        reconciled_key = reconciler.get_key()
+        reconciled_key = reconciler.get_key_array()
         errors_corrected = reconciler.get_errors_corrected()
         self._logger.info(
             f"Reconciliation complete: {errors_corrected} errors corrected, "
@@ -535,7 +848,8 @@ class AliceProgram(QkdProgram):
         )
 
         # ========== 7. Verification ==========
-        verifier = KeyVerifier(tag_bits=self._verification_tag_bits)
+        verifier = self._verifier
+        verifier.reset_leakage()
         is_verified = yield from verifier.verify(
             auth_socket, reconciled_key, is_alice=True
         )
@@ -551,7 +865,7 @@ class AliceProgram(QkdProgram):
         # Combine sample QBER with Cascade correction data
         total_qber = estimate_qber_from_cascade(
             total_bits=len(raw_key),
-            sample_errors=int(sample_qber * self._num_test_bits),
+            sample_errors=sample_errors,
             cascade_errors=errors_corrected,
         )
 
@@ -583,13 +897,13 @@ class AliceProgram(QkdProgram):
         self._logger.info(f"Target final key length: {final_length}")
 
         # ========== 9. Privacy Amplification ==========
-        # Generate and share Toeplitz seed
-        toeplitz_seed = generate_toeplitz_seed(len(reconciled_key), final_length)
-        auth_socket.send_structured(StructuredMessage(MSG_PA_SEED, toeplitz_seed))
+        # Generate and share Toeplitz seed. Both the key and the seed reach
+        # the amplifier as uint8 arrays, so it never converts from lists.
+        toeplitz_seed = generate_toeplitz_seed_array(len(reconciled_key), final_length)
+        auth_socket.send_structured(StructuredMessage(MSG_PA_SEED, _pack_bits(toeplitz_seed)))
 
         # Apply privacy amplification
-        amplifier = PrivacyAmplifier(epsilon_sec=self._security_parameter)
-        final_key = amplifier.amplify(reconciled_key, toeplitz_seed, final_length)
+        final_key = self._amplifier.amplify(reconciled_key, toeplitz_seed, final_length)
 
         total_leakage = leakage_ec + leakage_ver
         self._logger.info(
@@ -597,16 +911,16 @@ class AliceProgram(QkdProgram):
             f"QBER={total_qber:.4f}, leakage={total_leakage}"
         )
 
-        return {
-            RESULT_SECRET_KEY: final_key,
-            RESULT_QBER: total_qber,
-            RESULT_KEY_LENGTH: len(final_key),
-            RESULT_LEAKAGE: total_leakage,
-            RESULT_SUCCESS: True,
-        }
+        return QKDResult(
+            secret_key=final_key.tolist(),
+            qber=total_qber,
+            key_length=len(final_key),
+            leakage=total_leakage,
+            success=True,
+        )
 
-    def _error_result(self, error_code: str, message: str) -> Dict[str, Any]:
-        """Create error result dictionary.
+    def _error_result(self, error_code: str, message: str) -> QKDResult:
+        """Create error result.
 
         Parameters
         ----------
@@ -617,15 +931,10 @@ class AliceProgram(QkdProgram):
 
         Returns
         -------
-        Dict[str, Any]
+        QKDResult
             Error result.
         """
-        return {
-            RESULT_ERROR: error_code,
-            "message": message,
-            RESULT_SECRET_KEY: [],
-            RESULT_SUCCESS: False,
-        }
+        return QKDResult.failure(error_code, message)
 
 
 class BobProgram(QkdProgram):
@@ -659,7 +968,7 @@ class BobProgram(QkdProgram):
 
     Returns
     -------
-    Dict[str, Any]
+    QKDResult
         Protocol result (same format as AliceProgram).
 
     Reference: implementation_plan.md §Phase 5 (BobProgram)
@@ -685,7 +994,7 @@ class BobProgram(QkdProgram):
 
     def run(
         self, context: ProgramContext
-    ) -> Generator[EventExpression, None, Dict[str, Any]]:
+    ) -> Generator[EventExpression, None, QKDResult]:
         """Execute Bob's QKD protocol.
 
         Parameters
@@ -700,8 +1009,8 @@ class BobProgram(QkdProgram):
 
         Returns
         -------
-        Dict[str, Any]
-            Protocol result dictionary.
+        QKDResult
+            Protocol result (also indexable by the RESULT_* keys).
         """
         # ========== 1. Setup Authentication ==========
         raw_socket = context.csockets[self.PEER]
@@ -709,21 +1018,22 @@ class BobProgram(QkdProgram):
         self._logger.info("Authentication socket initialized")
 
         # ========== 2. Quantum Phase: EPR Distribution ==========
-        pairs_info = yield from self._distribute_states(context, is_initiator=False)
-        self._logger.info(f"Received {len(pairs_info)} EPR pairs")
+        pairs = yield from self._distribute_states(context, is_initiator=False)
+        self._logger.info(f"Received {len(pairs)} EPR pairs")
 
         # Signal to Alice that measurement is complete
         auth_socket.send_structured(StructuredMessage(MSG_ALL_MEASURED, None))
 
         # ========== 3. Sifting ==========
-        pairs_info = yield from self._filter_bases(auth_socket, pairs_info, is_initiator=False)
-        same_basis_count = sum(1 for p in pairs_info if p.same_basis)
+        pairs = yield from self._filter_bases(auth_socket, pairs, is_initiator=False)
+        same_basis_count = int(np.count_nonzero(pairs.same_basis))
         self._logger.info(f"Sifting complete: {same_basis_count} same-basis pairs")
 
         # ========== 4. QBER Estimation ==========
-        pairs_info, sample_qber = yield from self._estimate_error_rate(
-            auth_socket, pairs_info, self._num_test_bits, is_initiator=False
+        pairs, sample_errors, num_tests = yield from self._estimate_error_rate(
+            auth_socket, pairs, self._num_test_bits, is_initiator=False
         )
+        sample_qber = sample_errors / max(1, num_tests)
         self._logger.info(f"Sample QBER: {sample_qber:.4f}")
 
         # Check QBER threshold
@@ -732,7 +1042,7 @@ class BobProgram(QkdProgram):
             return self._error_result("qber_too_high", f"QBER {sample_qber:.4f} > {QBER_THRESHOLD}")
 
         # ========== 5. Extract Raw Key ==========
-        raw_key = self._extract_raw_key(pairs_info)
+        raw_key = self._extract_raw_key(pairs)
         self._logger.info(f"Raw key length: {len(raw_key)}")
 
         if len(raw_key) < MIN_KEY_LENGTH:
@@ -748,7 +1058,7 @@ class BobProgram(QkdProgram):
             estimated_qber=sample_qber,
         )
         leakage_ec = yield from reconciler.reconcile()
-        reconciled_key = reconciler.get_key()
+        reconciled_key = reconciler.get_key_array()
         errors_corrected = reconciler.get_errors_corrected()
         self._logger.info(
             f"Reconciliation complete: {errors_corrected} errors corrected, "
@@ -756,7 +1066,8 @@ class BobProgram(QkdProgram):
         )
 
         # ========== 7. Verification ==========
-        verifier = KeyVerifier(tag_bits=self._verification_tag_bits)
+        verifier = self._verifier
+        verifier.reset_leakage()
         is_verified = yield from verifier.verify(
             auth_socket, reconciled_key, is_alice=False  # Bob is responder
         )
@@ -771,7 +1082,7 @@ class BobProgram(QkdProgram):
         # ========== 8. QBER + Final Key Length ==========
         total_qber = estimate_qber_from_cascade(
             total_bits=len(raw_key),
-            sample_errors=int(sample_qber * self._num_test_bits),
+            sample_errors=sample_errors,
             cascade_errors=errors_corrected,
         )
 
@@ -809,11 +1120,16 @@ class BobProgram(QkdProgram):
             self._logger.error(f"Expected PA_SEED, got {response.header}")
             return self._error_result("protocol_error", "Missing PA seed")
 
-        toeplitz_seed = response.payload
+        try:
+            toeplitz_seed = _unpack_bits(
+                response.payload, len(reconciled_key) + final_length - 1
+            )
+        except (TypeError, ValueError):
+            self._logger.error("Received PA seed does not match the agreed key lengths")
+            return self._error_result("protocol_error", "Invalid PA seed")
 
         # Apply privacy amplification with same seed
-        amplifier = PrivacyAmplifier(epsilon_sec=self._security_parameter)
-        final_key = amplifier.amplify(reconciled_key, toeplitz_seed, final_length)
+        final_key = self._amplifier.amplify(reconciled_key, toeplitz_seed, final_length)
 
         total_leakage = leakage_ec + leakage_ver
         self._logger.info(
@@ -821,16 +1137,16 @@ class BobProgram(QkdProgram):
             f"QBER={total_qber:.4f}, leakage={total_leakage}"
         )
 
-        return {
-            RESULT_SECRET_KEY: final_key,
-            RESULT_QBER: total_qber,
-            RESULT_KEY_LENGTH: len(final_key),
-            RESULT_LEAKAGE: total_leakage,
-            RESULT_SUCCESS: True,
-        }
+        return QKDResult(
+            secret_key=final_key.tolist(),
+            qber=total_qber,
+            key_length=len(final_key),
+            leakage=total_leakage,
+            success=True,
+        )
 
-    def _error_result(self, error_code: str, message: str) -> Dict[str, Any]:
-        """Create error result dictionary.
+    def _error_result(self, error_code: str, message: str) -> QKDResult:
+        """Create error result.
 
         Parameters
         ----------
@@ -841,15 +1157,10 @@ class BobProgram(QkdProgram):
 
         Returns
         -------
-        Dict[str, Any]
+        QKDResult
             Error result.
         """
-        return {
-            RESULT_ERROR: error_code,
-            "message": message,
-            RESULT_SECRET_KEY: [],
-            RESULT_SUCCESS: False,
-        }
+        return QKDResult.failure(error_code, message)
 
 
 # Convenience functions for protocol execution
@@ -8,14 +8,18 @@ Key Components
 --------------
 Entropy Functions (entropy.py):
     - binary_entropy: Binary entropy function h(p)
+    - binary_entropy_vec: Binary entropy evaluated over an array
     - inverse_binary_entropy: Inverse of binary entropy
     - secrecy_capacity: Compute secrecy capacity 1 - h(QBER)
+    - secrecy_capacity_tab: Table-interpolated secrecy capacity for sweeps
     - is_qber_secure: Check if QBER is below security threshold
     - compute_final_key_length: Devetak-Winter formula for final key length
+    - compute_final_key_length_batch: Final key lengths over a QBER grid
     - compute_final_key_length_detailed: Detailed key length with breakdown
 
 QBER Estimation (estimation.py):
     - estimate_qber_from_sample: Estimate QBER from bit comparison
+    - estimate_qber_packed: Estimate QBER from packed 64-bit sift buffers
     - estimate_qber_from_cascade: Estimate QBER from Cascade reconciliation data
     - estimate_qber_detailed: Detailed estimation with confidence intervals
     - compute_confidence_interval: Clopper-Pearson confidence interval
@@ -23,9 +27,15 @@ QBER Estimation (estimation.py):
 
 Toeplitz Utilities (utils.py):
     - generate_toeplitz_seed: Generate random seed for Toeplitz matrix
+    - generate_toeplitz_seed_array: Same, as a uint8 array
     - generate_toeplitz_seed_structured: Generate seed with metadata
     - validate_toeplitz_seed: Validate seed length and format
+    - validated_seed_array: Validate a seed and return it as a bit array
     - construct_toeplitz_matrix: Build Toeplitz matrix from seed
+    - toeplitz_multiply: Toeplitz matrix-vector product over GF(2)
+    - toeplitz_multiply_fft: FFT Toeplitz product straight from a seed
+    - toeplitz_multiply_batch_gpu: Batched FFT products on the GPU (CuPy)
+    - pack_bits_to_uint64: Pack bit rows into 64-bit words
     - compute_seed_length: Calculate required seed length
 
 Privacy Amplifier (amplifier.py):
@@ -61,12 +71,15 @@ from hackathon_challenge.privacy.entropy import (
     KeyLengthEstimate,
     binary_entropy,
     binary_entropy_derivative,
+    binary_entropy_vec,
     compute_final_key_length,
+    compute_final_key_length_batch,
     compute_final_key_length_detailed,
     compute_security_margin,
     inverse_binary_entropy,
     is_qber_secure,
     secrecy_capacity,
+    secrecy_capacity_tab,
 )
 
 # QBER estimation functions
@@ -76,9 +89,11 @@ from hackathon_challenge.privacy.estimation import (
     compute_confidence_interval,
     compute_optimal_sample_size,
     count_sample_errors,
+    count_sample_errors_packed,
     estimate_qber_detailed,
     estimate_qber_from_cascade,
     estimate_qber_from_sample,
+    estimate_qber_packed,
     estimate_qber_with_correction,
     is_qber_acceptable,
 )
@@ -93,9 +108,14 @@ from hackathon_challenge.privacy.utils import (
     construct_toeplitz_matrix_numpy,
     extract_toeplitz_components,
     generate_toeplitz_seed,
+    generate_toeplitz_seed_array,
     generate_toeplitz_seed_structured,
+    pack_bits_to_uint64,
     toeplitz_multiply,
+    toeplitz_multiply_batch_gpu,
+    toeplitz_multiply_fft,
     validate_toeplitz_seed,
+    validated_seed_array,
 )
 
 # Privacy amplifier
@@ -123,15 +143,20 @@ __all__ = [
     # Entropy functions
     "binary_entropy",
     "binary_entropy_derivative",
+    "binary_entropy_vec",
     "inverse_binary_entropy",
     "secrecy_capacity",
+    "secrecy_capacity_tab",
     "is_qber_secure",
     "compute_security_margin",
     "compute_final_key_length",
+    "compute_final_key_length_batch",
     "compute_final_key_length_detailed",
     # QBER estimation
     "estimate_qber_from_sample",
+    "estimate_qber_packed",
     "count_sample_errors",
+    "count_sample_errors_packed",
     "estimate_qber_from_cascade",
     "estimate_qber_detailed",
     "compute_confidence_interval",
@@ -141,11 +166,16 @@ __all__ = [
     # Toeplitz utilities
     "compute_seed_length",
     "generate_toeplitz_seed",
+    "generate_toeplitz_seed_array",
     "generate_toeplitz_seed_structured",
     "validate_toeplitz_seed",
+    "validated_seed_array",
     "construct_toeplitz_matrix",
     "construct_toeplitz_matrix_numpy",
     "toeplitz_multiply",
+    "toeplitz_multiply_fft",
+    "toeplitz_multiply_batch_gpu",
+    "pack_bits_to_uint64",
     "extract_toeplitz_components",
     "bits_to_bytes",
     "bytes_to_bits",
@@ -25,13 +25,13 @@ The security guarantee is:
 Typical security parameter: ε_sec = 10^-12
 """
 
+import functools
+import os
 from dataclasses import dataclass
-from typing import Generator, List, Optional, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
-from netqasm.sdk.classical_communication.message import StructuredMessage
-from pydynaa import EventExpression
-from scipy.linalg import toeplitz
+from scipy import fft as sp_fft
 
 from hackathon_challenge.privacy.entropy import (
     QBER_THRESHOLD,
@@ -39,16 +39,256 @@ from hackathon_challenge.privacy.entropy import (
     is_qber_secure,
 )
 from hackathon_challenge.privacy.utils import (
-    construct_toeplitz_matrix,
+    _load_cupy,
     generate_toeplitz_seed,
-    validate_toeplitz_seed,
+    toeplitz_multiply_batch_gpu,
+    validated_seed_array,
 )
+from hackathon_challenge.utils.compat import NUMBA_AVAILABLE
+from hackathon_challenge.utils.math import parity_u64
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
 
 
 # Message headers for privacy amplification protocol
 MSG_PA_SEED = "PA_SEED"
 MSG_PA_COMPLETE = "PA_COMPLETE"
 
+# Cost model choosing between the packed GF(2) kernel and the FFT, in
+# units of one FFT point (about 35 ns). Measured: a NumPy packed word
+# operation costs about 1/12 of a point and each of its up to 64 seed
+# offsets about 800 points; a Numba word operation about 1/50 of a point.
+_PACKED_OFFSET_COST = 800
+_PACKED_WORD_OPS_PER_POINT = 12
+_JIT_WORD_OPS_PER_POINT = 50
+
+# Upper bound on the (rows, words) block materialised by the packed kernel
+_PACKED_BLOCK_WORDS = 1 << 20
+
+# Environment variable that opts in to the CuPy path ("1" enables it), and
+# the smallest matrix (rows x columns) worth the host-device transfers
+GPU_ENV_VAR = "QKD_USE_GPU"
+_GPU_MIN_MATRIX_BITS = 10**8
+
+# Number of (input length, QBER, leakages, epsilon) output lengths memoized
+OUTPUT_LENGTH_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=OUTPUT_LENGTH_CACHE_SIZE)
+def _cached_output_length(
+    input_length: int,
+    qber: float,
+    leakage_ec: int,
+    leakage_ver: int,
+    epsilon_sec: float,
+) -> int:
+    """Memoized ``compute_final_key_length`` for the amplifier.
+
+    The QBER is used exactly as given; rounding it for better cache hits
+    could underestimate it and yield an insecurely long key.
+    """
+    return compute_final_key_length(
+        reconciled_length=input_length,
+        qber=qber,
+        leakage_ec=leakage_ec,
+        leakage_ver=leakage_ver,
+        epsilon_sec=epsilon_sec,
+    )
+
+
+def _pack_u64(bits: np.ndarray, num_words: int) -> np.ndarray:
+    """Pack a bit vector into little-endian 64-bit words.
+
+    Parameters
+    ----------
+    bits : np.ndarray
+        uint8 bit array (0 or 1). Bit ``j`` lands in bit ``j % 64`` of
+        word ``j // 64``.
+    num_words : int
+        Number of words to return; must hold all bits. Missing trailing
+        bits are zero.
+
+    Returns
+    -------
+    np.ndarray
+        uint64 array of length ``num_words``.
+    """
+    packed = np.zeros(num_words * 8, dtype=np.uint8)
+    packed_bits = np.packbits(bits, bitorder="little")
+    packed[: len(packed_bits)] = packed_bits
+    return packed.view("<u8")
+
+
+def _packed_is_cheaper(key_length: int, new_length: int) -> bool:
+    """Return True if ``_amplify_packed`` is expected to beat the FFT.
+
+    The packed kernel costs ``new_length * ceil(key_length / 64)`` word
+    operations plus a fixed cost per seed offset; the FFT costs roughly one
+    unit per point of its ``key_length + new_length`` transform. The packed
+    kernel therefore wins when the output is short compared to the key.
+    """
+    num_words = -(-key_length // 64)
+    if NUMBA_AVAILABLE:
+        packed_cost = new_length * num_words / _JIT_WORD_OPS_PER_POINT
+    else:
+        packed_cost = (
+            _PACKED_OFFSET_COST * min(new_length, 64)
+            + new_length * num_words / _PACKED_WORD_OPS_PER_POINT
+        )
+    return packed_cost < key_length + new_length
+
+
+def _toeplitz_diagonals(seed: np.ndarray, new_length: int) -> np.ndarray:
+    """Lay out the diagonals of the seed's Toeplitz matrix in order.
+
+    The matrix is the one built by ``construct_toeplitz_matrix``: its
+    diagonal ``d = j - i`` holds ``seed[-d]`` for ``d <= 0`` and
+    ``seed[new_length - 1 + d]`` for ``d > 0``. In the returned array row
+    ``i`` of the matrix is the window ``diag[w : w + num_cols]`` with
+    ``w = new_length - 1 - i``.
+
+    Parameters
+    ----------
+    seed : np.ndarray
+        Toeplitz seed bits (uint8).
+    new_length : int
+        Number of matrix rows.
+
+    Returns
+    -------
+    np.ndarray
+        Diagonal bits (uint8), same length as ``seed``.
+    """
+    return np.concatenate((seed[new_length - 1 : 0 : -1], seed[:1], seed[new_length:]))
+
+
+def _amplify_packed_numpy(
+    key_words: np.ndarray, diag: np.ndarray, new_length: int
+) -> np.ndarray:
+    """NumPy implementation of ``_amplify_packed``.
+
+    ``diag`` is packed once for each of the 64 bit offsets; every row
+    window then starts on a word boundary of one copy and is processed in
+    vectorized blocks of rows.
+    """
+    num_words = len(key_words)
+    offsets = np.arange(new_length - 1, -1, -1)  # window start of each row
+    shifts = offsets % 64
+    starts = offsets // 64
+    copy_words = -(-len(diag) // 64) + num_words
+    rows_per_block = max(1, _PACKED_BLOCK_WORDS // num_words)
+
+    result = np.empty(new_length, dtype=np.uint8)
+    for shift in range(min(64, new_length)):
+        rows = np.flatnonzero(shifts == shift)
+        windows = np.lib.stride_tricks.sliding_window_view(
+            _pack_u64(diag[shift:], copy_words), num_words
+        )
+        for block in range(0, len(rows), rows_per_block):
+            block_rows = rows[block : block + rows_per_block]
+            acc = np.bitwise_xor.reduce(windows[starts[block_rows]] & key_words, axis=1)
+            result[block_rows] = parity_u64(acc)
+    return result
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _amplify_packed_jit(
+        key_words: np.ndarray, diag_words: np.ndarray, new_length: int
+    ) -> np.ndarray:
+        """Numba implementation of ``_amplify_packed``.
+
+        Rows run in parallel. Each row window is read straight from the
+        single packed copy of the diagonals, shifting word pairs into
+        place, so no per-offset copies are built.
+        """
+        num_words = len(key_words)
+        result = np.empty(new_length, dtype=np.uint8)
+        for i in prange(new_length):
+            offset = new_length - 1 - i
+            start = offset >> 6
+            shift = np.uint64(offset & 63)
+            acc = np.uint64(0)
+            for j in range(num_words):
+                word = diag_words[start + j] >> shift
+                if shift:
+                    word |= diag_words[start + j + 1] << (np.uint64(64) - shift)
+                acc ^= word & key_words[j]
+            for fold in (32, 16, 8, 4, 2, 1):
+                acc ^= acc >> np.uint64(fold)
+            result[i] = acc & np.uint64(1)
+        return result
+
+
+def _amplify_packed(key: np.ndarray, seed: np.ndarray, new_length: int) -> np.ndarray:
+    """Toeplitz product over GF(2) on bit-packed 64-bit words.
+
+    Output bit ``i`` is the parity of row ``i`` of the Toeplitz matrix
+    (see ``_toeplitz_diagonals``) AND the key, costing
+    ``ceil(len(key) / 64)`` AND/XOR word operations. Uses a parallel
+    Numba kernel when numba is installed.
+
+    Parameters
+    ----------
+    key : np.ndarray
+        Key bits (uint8).
+    seed : np.ndarray
+        Toeplitz seed bits (uint8), length ``len(key) + new_length - 1``.
+    new_length : int
+        Number of output bits.
+
+    Returns
+    -------
+    np.ndarray
+        Output bits (uint8).
+    """
+    num_words = -(-len(key) // 64)
+    key_words = _pack_u64(key, num_words)
+    diag = _toeplitz_diagonals(seed, new_length)
+
+    if NUMBA_AVAILABLE:
+        # One spare word so every window can read its successor word
+        diag_words = _pack_u64(diag, -(-len(diag) // 64) + 1)
+        return _amplify_packed_jit(key_words, diag_words, new_length)
+    return _amplify_packed_numpy(key_words, diag, new_length)
+
+
+def _gpu_is_enabled(key_length: int, new_length: int) -> bool:
+    """Return True if ``_amplify_gpu`` should handle this product.
+
+    The GPU is only used when the user opted in via ``QKD_USE_GPU=1``, the
+    matrix is large enough to amortise copying the key and seed to the
+    device and CuPy imports. CuPy is checked last, so it is only loaded
+    once the other conditions hold.
+    """
+    return (
+        os.environ.get(GPU_ENV_VAR) == "1"
+        and key_length * new_length > _GPU_MIN_MATRIX_BITS
+        and _load_cupy() is not None
+    )
+
+
+def _amplify_gpu(key: np.ndarray, seed: np.ndarray, new_length: int) -> np.ndarray:
+    """Toeplitz product mod 2 on the GPU, as a batch of one key.
+
+    Parameters
+    ----------
+    key : np.ndarray
+        Key bits (uint8).
+    seed : np.ndarray
+        Toeplitz seed bits (uint8), length ``len(key) + new_length - 1``.
+    new_length : int
+        Number of output bits.
+
+    Returns
+    -------
+    np.ndarray
+        Output bits (uint8), copied back to the host.
+    """
+    return toeplitz_multiply_batch_gpu(seed, key[None, :], new_length, len(key))[0]
+
 
 @dataclass
 class AmplificationResult:
@@ -56,8 +296,9 @@ class AmplificationResult:
 
     Attributes
     ----------
-    secret_key : List[int]
-        Final secret key bits.
+    secret_key : np.ndarray
+        Final secret key bits (dtype uint8). Use ``secret_key_list`` for
+        a plain list.
     input_length : int
         Length of input (reconciled) key.
     output_length : int
@@ -80,7 +321,7 @@ class AmplificationResult:
         Epsilon security parameter.
     """
 
-    secret_key: List[int]
+    secret_key: np.ndarray
     input_length: int
     output_length: int
     compression_ratio: float
@@ -92,6 +333,11 @@ class AmplificationResult:
     qber: float = 0.0
     security_parameter: float = 1e-12
 
+    @property
+    def secret_key_list(self) -> List[int]:
+        """Final secret key bits as a list of ints."""
+        return self.secret_key.tolist()
+
 
 class PrivacyAmplifier:
     """Toeplitz-matrix-based privacy amplification.
@@ -144,6 +390,9 @@ class PrivacyAmplifier:
 
         self.epsilon_sec = epsilon_sec
         self._rng_seed = rng_seed
+        # Spectrum of the last seed used by the FFT path, keyed by
+        # (len(key), new_length, seed bytes); see _fft_product
+        self._seed_fft_cache: Optional[Tuple[Tuple[int, int, bytes], np.ndarray]] = None
 
     def compute_output_length(
         self,
@@ -169,13 +418,15 @@ class PrivacyAmplifier:
         -------
         int
             Optimal output key length.
+
+        Notes
+        -----
+        Results are memoized per argument tuple (see
+        ``_cached_output_length``), which helps parameter sweeps that
+        amplify many blocks with the same settings.
         """
-        return compute_final_key_length(
-            reconciled_length=input_length,
-            qber=qber,
-            leakage_ec=leakage_ec,
-            leakage_ver=leakage_ver,
-            epsilon_sec=self.epsilon_sec,
+        return _cached_output_length(
+            input_length, qber, leakage_ec, leakage_ver, self.epsilon_sec
         )
 
     def generate_seed(
@@ -205,25 +456,26 @@ class PrivacyAmplifier:
 
     def amplify(
         self,
-        key: List[int],
-        toeplitz_seed: List[int],
+        key: Union[List[int], np.ndarray],
+        toeplitz_seed: Union[List[int], np.ndarray],
         new_length: int,
-    ) -> List[int]:
+    ) -> np.ndarray:
         """Apply Toeplitz hashing for privacy amplification.
 
         Parameters
         ----------
-        key : List[int]
-            Reconciled and verified key bits.
-        toeplitz_seed : List[int]
+        key : Union[List[int], np.ndarray]
+            Reconciled and verified key bits. A uint8 array is used as is.
+        toeplitz_seed : Union[List[int], np.ndarray]
             Random seed defining the Toeplitz matrix.
         new_length : int
             Desired output key length.
 
         Returns
         -------
-        List[int]
-            Final secret key bits.
+        np.ndarray
+            Final secret key bits (uint8). Callers that need a list convert
+            once at their boundary (see ``amplify_with_result``).
 
         Raises
         ------
@@ -234,9 +486,17 @@ class PrivacyAmplifier:
         -----
         Computes K_sec = T × K_ver where T is a Toeplitz matrix.
         Matrix multiplication is performed modulo 2.
+
+        T is never materialised. Products with an output short compared to
+        the key run on bit-packed 64-bit words (``_amplify_packed``), exact
+        GF(2) arithmetic. The others use an FFT (``_fft_product``) in
+        O((n + m) log(n + m)) time and O(n + m) memory; the exact integer
+        products are at most len(key), so rounding the float64 result before
+        reducing mod 2 is exact. Large FFT products move to the GPU
+        (``_amplify_gpu``) when CuPy is installed and ``QKD_USE_GPU=1``.
         """
         # Validate inputs
-        if not key:
+        if len(key) == 0:
             raise ValueError("Key cannot be empty")
         if new_length <= 0:
             raise ValueError(f"Output length must be positive, got {new_length}")
@@ -251,19 +511,59 @@ class PrivacyAmplifier:
                 f"Seed length must be {expected_seed_length}, got {len(toeplitz_seed)}"
             )
 
-        key_arr = np.array(key, dtype=np.uint8)
+        key_arr = np.asarray(key, dtype=np.uint8)
+        seed_arr = np.asarray(toeplitz_seed, dtype=np.uint8)
+
+        if _packed_is_cheaper(len(key), new_length):
+            return _amplify_packed(key_arr, seed_arr, new_length)
+        if _gpu_is_enabled(len(key), new_length):
+            return _amplify_gpu(key_arr, seed_arr, new_length)
 
-        # Construct Toeplitz matrix from seed
-        # scipy.linalg.toeplitz(c, r) creates a Toeplitz matrix where:
-        # - c is the first column
-        # - r is the first row (first element of r is ignored, using c[0] instead)
-        col = toeplitz_seed[:new_length]
-        row = toeplitz_seed[new_length - 1 : new_length - 1 + len(key)]
-        T = toeplitz(col, row).astype(np.uint8)
+        # Matrix multiplication mod 2 (parity via bitwise AND on the rounded sums)
+        product = self._fft_product(key_arr, seed_arr, new_length)
+        return np.bitwise_and(np.rint(product).astype(np.int64), 1).astype(np.uint8)
+
+    def _fft_product(
+        self, key: np.ndarray, seed: np.ndarray, new_length: int
+    ) -> np.ndarray:
+        """Integer Toeplitz product ``T @ key`` computed with real FFTs.
+
+        Row ``i`` of T is ``diag[w : w + len(key)]`` with
+        ``w = new_length - 1 - i`` (see ``_toeplitz_diagonals``), so the
+        product is a correlation of ``diag`` with the key, taken as a
+        circular convolution with the reversed key at ``next_fast_len``.
+        The spectrum of ``diag`` only depends on the seed and is cached,
+        so amplifying further keys with the same seed costs two FFTs
+        instead of three.
+
+        Parameters
+        ----------
+        key : np.ndarray
+            Key bits (uint8).
+        seed : np.ndarray
+            Toeplitz seed bits (uint8).
+        new_length : int
+            Number of output bits.
+
+        Returns
+        -------
+        np.ndarray
+            float64 products, exact integers up to rounding error.
+        """
+        key_length = len(key)
+        size = sp_fft.next_fast_len(key_length + new_length - 1, real=True)
+
+        cache_key = (key_length, new_length, seed.tobytes())
+        if self._seed_fft_cache is not None and self._seed_fft_cache[0] == cache_key:
+            seed_spectrum = self._seed_fft_cache[1]
+        else:
+            diag = _toeplitz_diagonals(seed, new_length).astype(np.float64)
+            seed_spectrum = sp_fft.rfft(diag, n=size, workers=-1)
+            self._seed_fft_cache = (cache_key, seed_spectrum)
 
-        # Matrix multiplication mod 2
-        result = (T @ key_arr) % 2
-        return result.astype(int).tolist()
+        key_spectrum = sp_fft.rfft(key[::-1].astype(np.float64), n=size, workers=-1)
+        correlation = sp_fft.irfft(seed_spectrum * key_spectrum, n=size, workers=-1)
+        return correlation[key_length - 1 : key_length - 1 + new_length][::-1]
 
     def amplify_with_result(
         self,
@@ -307,7 +607,7 @@ class PrivacyAmplifier:
         # Check security threshold
         if not is_qber_secure(qber, QBER_THRESHOLD):
             return AmplificationResult(
-                secret_key=[],
+                secret_key=np.empty(0, dtype=np.uint8),
                 input_length=input_length,
                 output_length=0,
                 compression_ratio=0.0,
@@ -330,7 +630,7 @@ class PrivacyAmplifier:
 
         if output_length <= 0:
             return AmplificationResult(
-                secret_key=[],
+                secret_key=np.empty(0, dtype=np.uint8),
                 input_length=input_length,
                 output_length=0,
                 compression_ratio=0.0,
@@ -346,10 +646,12 @@ class PrivacyAmplifier:
         # Generate or validate seed
         if toeplitz_seed is None:
             toeplitz_seed = self.generate_seed(input_length, output_length)
+            seed_bits = toeplitz_seed
         else:
-            if not validate_toeplitz_seed(toeplitz_seed, input_length, output_length):
+            seed_bits = validated_seed_array(toeplitz_seed, input_length, output_length)
+            if seed_bits is None:
                 return AmplificationResult(
-                    secret_key=[],
+                    secret_key=np.empty(0, dtype=np.uint8),
                     input_length=input_length,
                     output_length=output_length,
                     compression_ratio=0.0,
@@ -364,10 +666,10 @@ class PrivacyAmplifier:
 
         # Apply amplification
         try:
-            secret_key = self.amplify(key, toeplitz_seed, output_length)
+            secret_key = self.amplify(key, seed_bits, output_length)
         except Exception as e:
             return AmplificationResult(
-                secret_key=[],
+                secret_key=np.empty(0, dtype=np.uint8),
                 input_length=input_length,
                 output_length=output_length,
                 compression_ratio=0.0,
@@ -424,7 +726,7 @@ class PrivacyAmplifier:
         if toeplitz_seed is None:
             toeplitz_seed = self.generate_seed(len(key), output_length)
 
-        secret_key = self.amplify(key, toeplitz_seed, output_length)
+        secret_key = self.amplify(key, toeplitz_seed, output_length).tolist()
         return secret_key, toeplitz_seed
 
 
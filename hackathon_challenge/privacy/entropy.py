@@ -18,10 +18,18 @@ The Shor-Preskill bound establishes that secure key distribution
 is impossible when QBER > 11% (unconditional security).
 """
 
+import functools
+import math
 from dataclasses import dataclass
-from typing import Optional
+from typing import Tuple, Union
 
 import numpy as np
+from scipy.special import xlogy
+
+from hackathon_challenge.utils.compat import DATACLASS_SLOTS, NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from numba import float64, njit, vectorize
 
 # Security thresholds
 QBER_THRESHOLD = 0.11  # Shor-Preskill bound (11%)
@@ -29,8 +37,29 @@ DEFAULT_EPSILON_SEC = 1e-12  # Default security parameter
 MIN_EFFICIENCY_FACTOR = 0.0
 MAX_EFFICIENCY_FACTOR = 1.0
 
+# 1 / ln(2): converts natural logarithms to bits
+_INV_LN2 = 1.0 / math.log(2.0)
+
+# Number of distinct probabilities whose binary entropy is memoized
+ENTROPY_CACHE_SIZE = 8192
+
+# Arrays at least this long use the multi-threaded Numba entropy ufunc
+_PARALLEL_ENTROPY_MIN_SIZE = 1 << 18
+
+
+@functools.lru_cache(maxsize=ENTROPY_CACHE_SIZE)
+def _binary_entropy_cached(p: float) -> float:
+    """Memoized h(p) for 0 < p < 1.
 
-@dataclass
+    Keyed on the exact probability: QBER estimates are ratios of small
+    integers and repeat exactly across sweeps, while rounding p could
+    underestimate h and lengthen the key.
+    """
+    # math.log/log1p avoid ufunc dispatch on a scalar; log1p keeps 1-p exact
+    return -(p * math.log(p) + (1 - p) * math.log1p(-p)) * _INV_LN2
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class KeyLengthEstimate:
     """Result of key length estimation.
 
@@ -101,7 +130,66 @@ def binary_entropy(p: float) -> float:
     if p <= 0 or p >= 1:
         return 0.0
 
-    return float(-p * np.log2(p) - (1 - p) * np.log2(1 - p))
+    return _binary_entropy_cached(float(p))
+
+
+def binary_entropy_vec(p: np.ndarray) -> np.ndarray:
+    """Compute binary entropy h(p) elementwise over an array.
+
+    Parameters
+    ----------
+    p : np.ndarray
+        Probabilities (0 ≤ p ≤ 1), any shape.
+
+    Returns
+    -------
+    np.ndarray
+        float64 array of h(p), same shape as p.
+
+    Raises
+    ------
+    ValueError
+        If any element of p is not in [0, 1].
+
+    Notes
+    -----
+    With numba installed this is a single fused ufunc (multi-threaded for
+    large arrays). Otherwise ``scipy.special.xlogy`` returns 0 for
+    0*log(0), so h(0) = h(1) = 0 without a branch. Use this instead of
+    calling ``binary_entropy`` in a loop when evaluating many QBER values.
+
+    Examples
+    --------
+    >>> binary_entropy_vec(np.array([0.5, 0.5])).tolist()
+    [1.0, 1.0]
+    """
+    p = np.asarray(p, dtype=np.float64)
+    if not np.all((p >= 0) & (p <= 1)):
+        raise ValueError("Probabilities must be in [0, 1]")
+
+    if NUMBA_AVAILABLE:
+        return _binary_entropy_ufunc(p.size >= _PARALLEL_ENTROPY_MIN_SIZE)(p)
+
+    q = 1.0 - p
+    return (xlogy(p, p) + xlogy(q, q)) * -_INV_LN2
+
+
+def _binary_entropy_kernel(p: float) -> float:
+    """Scalar h(p) for the Numba ufunc; 0 outside (0, 1)."""
+    if p <= 0.0 or p >= 1.0:
+        return 0.0
+    return -(p * math.log(p) + (1.0 - p) * math.log1p(-p)) * 1.4426950408889634
+
+
+@functools.lru_cache(maxsize=None)
+def _binary_entropy_ufunc(parallel: bool):
+    """Compile the fused entropy ufunc on first use.
+
+    Building it lazily keeps the compilation (or cache load) out of module
+    import. fastmath is off so results match ``binary_entropy`` exactly.
+    """
+    target = "parallel" if parallel else "cpu"
+    return vectorize([float64(float64)], target=target, cache=True)(_binary_entropy_kernel)
 
 
 def binary_entropy_derivative(p: float) -> float:
@@ -130,7 +218,38 @@ def binary_entropy_derivative(p: float) -> float:
     if p <= 0 or p >= 1:
         raise ValueError(f"Probability must be in (0, 1) for derivative, got {p}")
 
-    return float(np.log2((1 - p) / p))
+    return (math.log1p(-p) - math.log(p)) * _INV_LN2
+
+
+def _inverse_entropy_newton(
+    h_val: float, p: float, tolerance: float, max_iterations: int
+) -> float:
+    """Newton-Raphson solve of h(p) = h_val from the initial guess p.
+
+    Written with ``math`` only so that Numba can compile it unchanged.
+    """
+    inv_ln2 = 1.4426950408889634
+    for _ in range(max_iterations):
+        log_p = math.log(p)
+        log_q = math.log1p(-p)
+        error = -(p * log_p + (1 - p) * log_q) * inv_ln2 - h_val
+
+        if abs(error) < tolerance:
+            break
+
+        h_prime = (log_q - log_p) * inv_ln2
+        if abs(h_prime) < 1e-15:
+            break
+
+        p = p - error / h_prime
+        # Keep in valid range
+        p = max(1e-15, min(1 - 1e-15, p))
+
+    return p
+
+
+if NUMBA_AVAILABLE:
+    _inverse_entropy_newton_jit = njit(cache=True)(_inverse_entropy_newton)
 
 
 def inverse_binary_entropy(h_val: float, branch: str = "lower") -> float:
@@ -161,7 +280,8 @@ def inverse_binary_entropy(h_val: float, branch: str = "lower") -> float:
     Binary entropy is symmetric around p=0.5, so there are two solutions
     for any h_val in (0, 1): p and 1-p.
 
-    Uses Newton-Raphson iteration: p_{n+1} = p_n - (h(p_n) - h_val) / h'(p_n)
+    Uses Newton-Raphson iteration: p_{n+1} = p_n - (h(p_n) - h_val) / h'(p_n),
+    compiled with Numba when it is installed.
     """
     if h_val < 0 or h_val > 1:
         raise ValueError(f"Entropy value must be in [0, 1], got {h_val}")
@@ -175,27 +295,24 @@ def inverse_binary_entropy(h_val: float, branch: str = "lower") -> float:
     if abs(h_val - 1.0) < 1e-15:
         return 0.5
 
-    # Initial guess
-    p = 0.1 if branch == "lower" else 0.9
+    # Initial guess on the lower branch: the small-h asymptote
+    # p ~ h / (log2(1/h) + 1), or the expansion h ~ 1 - 2(p - 1/2)^2 / ln 2
+    # around the maximum; either leaves Newton a handful of iterations
+    if h_val < 0.5:
+        p = h_val / (1.0 - math.log(h_val) * _INV_LN2)
+    else:
+        p = 0.5 - math.sqrt((1.0 - h_val) * math.log(2.0) / 2.0)
+    if branch == "upper":
+        p = 1.0 - p
 
     # Newton-Raphson iteration
     max_iterations = 100
     tolerance = 1e-12
 
-    for _ in range(max_iterations):
-        h_p = binary_entropy(p)
-        error = h_p - h_val
-
-        if abs(error) < tolerance:
-            break
-
-        h_prime = binary_entropy_derivative(p)
-        if abs(h_prime) < 1e-15:
-            break
-
-        p = p - error / h_prime
-        # Keep in valid range
-        p = max(1e-15, min(1 - 1e-15, p))
+    if NUMBA_AVAILABLE:
+        p = _inverse_entropy_newton_jit(float(h_val), p, tolerance, max_iterations)
+    else:
+        p = _inverse_entropy_newton(float(h_val), p, tolerance, max_iterations)
 
     return float(p)
 
@@ -232,6 +349,57 @@ def secrecy_capacity(qber: float) -> float:
     return 1.0 - binary_entropy(qber)
 
 
+# Number of intervals in the secrecy capacity table over QBER in [0, 0.5]
+SECRECY_TABLE_INTERVALS = 4096
+
+
+@functools.lru_cache(maxsize=1)
+def _secrecy_capacity_table() -> Tuple[np.ndarray, np.ndarray]:
+    """Build (and keep) the QBER grid and its secrecy capacities."""
+    grid = np.linspace(0.0, 0.5, SECRECY_TABLE_INTERVALS + 1)
+    capacities = 1.0 - binary_entropy_vec(grid)
+    grid.setflags(write=False)
+    capacities.setflags(write=False)
+    return grid, capacities
+
+
+def secrecy_capacity_tab(qber: np.ndarray) -> np.ndarray:
+    """Approximate secrecy capacity 1 - h(qber) by table interpolation.
+
+    Parameters
+    ----------
+    qber : np.ndarray
+        Quantum Bit Error Rates (≥ 0), any shape.
+
+    Returns
+    -------
+    np.ndarray
+        float64 approximations of ``secrecy_capacity``, same shape as qber;
+        0 for qber ≥ 0.5.
+
+    Raises
+    ------
+    ValueError
+        If any QBER is negative.
+
+    Notes
+    -----
+    Linearly interpolates a table of 4097 points built on first use, for
+    plots and coarse parameter sweeps. The error is below 3e-7 for
+    qber ≥ 0.01 but grows to about 1e-4 in the first grid intervals, where
+    h has an unbounded slope. Because 1 - h is convex the interpolant
+    lies above the true value, i.e. it overestimates the key rate: use
+    ``secrecy_capacity`` or ``compute_final_key_length_batch`` for key
+    lengths.
+    """
+    qber = np.asarray(qber, dtype=np.float64)
+    if np.any(qber < 0):
+        raise ValueError("QBER must be non-negative")
+
+    grid, capacities = _secrecy_capacity_table()
+    return np.interp(qber, grid, capacities, right=0.0)
+
+
 def is_qber_secure(qber: float, threshold: float = QBER_THRESHOLD) -> bool:
     """Check if QBER is below security threshold.
 
@@ -276,7 +444,42 @@ def compute_security_margin(epsilon_sec: float) -> float:
     if epsilon_sec <= 0 or epsilon_sec > 1:
         raise ValueError(f"Security parameter must be in (0, 1], got {epsilon_sec}")
 
-    return float(2 * np.log2(1 / epsilon_sec))
+    return -2.0 * math.log(epsilon_sec) * _INV_LN2
+
+
+def _validate_key_length_parameters(
+    reconciled_length: int,
+    epsilon_sec: float,
+    efficiency_factor: float,
+) -> None:
+    """Raise ValueError for invalid scalar inputs shared by the key length functions."""
+    if reconciled_length < 0:
+        raise ValueError(f"Reconciled length must be non-negative, got {reconciled_length}")
+    if epsilon_sec <= 0 or epsilon_sec > 1:
+        raise ValueError(f"Security parameter must be in (0, 1], got {epsilon_sec}")
+    if efficiency_factor <= MIN_EFFICIENCY_FACTOR or efficiency_factor > MAX_EFFICIENCY_FACTOR:
+        raise ValueError(
+            f"Efficiency factor must be in ({MIN_EFFICIENCY_FACTOR}, {MAX_EFFICIENCY_FACTOR}], "
+            f"got {efficiency_factor}"
+        )
+
+
+def _validate_final_key_inputs(
+    reconciled_length: int,
+    qber: float,
+    leakage_ec: int,
+    leakage_ver: int,
+    epsilon_sec: float,
+    efficiency_factor: float,
+) -> None:
+    """Raise ValueError if key length inputs are out of their valid ranges."""
+    _validate_key_length_parameters(reconciled_length, epsilon_sec, efficiency_factor)
+    if qber < 0 or qber > 0.5:
+        raise ValueError(f"QBER must be in [0, 0.5], got {qber}")
+    if leakage_ec < 0:
+        raise ValueError(f"EC leakage must be non-negative, got {leakage_ec}")
+    if leakage_ver < 0:
+        raise ValueError(f"Verification leakage must be non-negative, got {leakage_ver}")
 
 
 def compute_final_key_length(
@@ -323,33 +526,71 @@ def compute_final_key_length(
 
     Reference: theoretical doc Step 2 §3.3
     """
-    # Validate inputs
-    if reconciled_length < 0:
-        raise ValueError(f"Reconciled length must be non-negative, got {reconciled_length}")
-    if qber < 0 or qber > 0.5:
-        raise ValueError(f"QBER must be in [0, 0.5], got {qber}")
-    if leakage_ec < 0:
-        raise ValueError(f"EC leakage must be non-negative, got {leakage_ec}")
-    if leakage_ver < 0:
-        raise ValueError(f"Verification leakage must be non-negative, got {leakage_ver}")
-    if epsilon_sec <= 0 or epsilon_sec > 1:
-        raise ValueError(f"Security parameter must be in (0, 1], got {epsilon_sec}")
-    if efficiency_factor <= MIN_EFFICIENCY_FACTOR or efficiency_factor > MAX_EFFICIENCY_FACTOR:
-        raise ValueError(
-            f"Efficiency factor must be in ({MIN_EFFICIENCY_FACTOR}, {MAX_EFFICIENCY_FACTOR}], "
-            f"got {efficiency_factor}"
-        )
+    return _final_key_core(
+        reconciled_length, qber, leakage_ec, leakage_ver, epsilon_sec, efficiency_factor
+    ).final_length
 
-    # Check security threshold
-    if not is_qber_secure(qber):
-        return 0
 
-    # Devetak-Winter formula
+def compute_final_key_length_batch(
+    reconciled_length: int,
+    qber: np.ndarray,
+    leakage_ec: Union[int, np.ndarray],
+    leakage_ver: Union[int, np.ndarray],
+    epsilon_sec: float = DEFAULT_EPSILON_SEC,
+    efficiency_factor: float = 1.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute final key lengths over a grid of QBER and leakage values.
+
+    Vectorized counterpart of ``compute_final_key_length`` for parameter
+    sweeps; the leakages broadcast against ``qber``.
+
+    Parameters
+    ----------
+    reconciled_length : int
+        Length of reconciled key after error correction.
+    qber : np.ndarray
+        Quantum Bit Error Rates, each in [0, 0.5].
+    leakage_ec : Union[int, np.ndarray]
+        Information leakage from error correction (bits).
+    leakage_ver : Union[int, np.ndarray]
+        Information leakage from verification (bits).
+    epsilon_sec : float, optional
+        Security parameter (default 1e-12).
+    efficiency_factor : float, optional
+        Protocol efficiency factor (0 < f ≤ 1). Default 1.0.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        (final_lengths, is_secure): int64 key lengths and a bool mask that
+        is True where the QBER is below threshold and the length positive.
+
+    Raises
+    ------
+    ValueError
+        If parameters are out of valid ranges.
+    """
+    qber = np.asarray(qber, dtype=np.float64)
+    leakage_ec = np.asarray(leakage_ec)
+    leakage_ver = np.asarray(leakage_ver)
+
+    _validate_key_length_parameters(reconciled_length, epsilon_sec, efficiency_factor)
+    if not np.all((qber >= 0) & (qber <= 0.5)):
+        raise ValueError("QBER must be in [0, 0.5]")
+    if np.any(leakage_ec < 0):
+        raise ValueError("EC leakage must be non-negative")
+    if np.any(leakage_ver < 0):
+        raise ValueError("Verification leakage must be non-negative")
+
+    # Devetak-Winter formula, one pass over the grid
     security_margin = compute_security_margin(epsilon_sec)
-    available = reconciled_length * secrecy_capacity(qber) * efficiency_factor
-    final_length = available - leakage_ec - leakage_ver - security_margin
+    capacity = 1.0 - binary_entropy_vec(qber)
+    available = reconciled_length * capacity * efficiency_factor
+    raw_length = available - leakage_ec - leakage_ver - security_margin
 
-    return max(0, int(np.floor(final_length)))
+    secure_qber = qber < QBER_THRESHOLD
+    final_lengths = np.where(secure_qber, np.maximum(0, np.floor(raw_length)), 0).astype(np.int64)
+    return final_lengths, secure_qber & (final_lengths > 0)
 
 
 def compute_final_key_length_detailed(
@@ -387,21 +628,30 @@ def compute_final_key_length_detailed(
     Use this function when you need diagnostic information about
     the key length calculation for debugging or reporting.
     """
-    # Validate inputs (reuse validation from simple function)
-    if reconciled_length < 0:
-        raise ValueError(f"Reconciled length must be non-negative, got {reconciled_length}")
-    if qber < 0 or qber > 0.5:
-        raise ValueError(f"QBER must be in [0, 0.5], got {qber}")
-    if leakage_ec < 0:
-        raise ValueError(f"EC leakage must be non-negative, got {leakage_ec}")
-    if leakage_ver < 0:
-        raise ValueError(f"Verification leakage must be non-negative, got {leakage_ver}")
-    if epsilon_sec <= 0 or epsilon_sec > 1:
-        raise ValueError(f"Security parameter must be in (0, 1], got {epsilon_sec}")
+    return _final_key_core(
+        reconciled_length, qber, leakage_ec, leakage_ver, epsilon_sec, efficiency_factor
+    )
+
+
+def _final_key_core(
+    reconciled_length: int,
+    qber: float,
+    leakage_ec: int,
+    leakage_ver: int,
+    epsilon_sec: float,
+    efficiency_factor: float,
+) -> KeyLengthEstimate:
+    """Validate the inputs and evaluate the Devetak-Winter formula once.
 
-    is_secure = is_qber_secure(qber)
+    Shared by ``compute_final_key_length`` and
+    ``compute_final_key_length_detailed`` so both report the same length.
+    """
+    _validate_final_key_inputs(
+        reconciled_length, qber, leakage_ec, leakage_ver, epsilon_sec, efficiency_factor
+    )
 
-    if not is_secure:
+    # Check security threshold
+    if not is_qber_secure(qber):
         return KeyLengthEstimate(
             final_length=0,
             raw_length=0.0,
@@ -412,19 +662,18 @@ def compute_final_key_length_detailed(
             security_parameter=epsilon_sec,
         )
 
+    # Devetak-Winter formula
     security_margin = compute_security_margin(epsilon_sec)
-    capacity = secrecy_capacity(qber) * efficiency_factor
-    available = reconciled_length * capacity
-    total_leakage = leakage_ec + leakage_ver + security_margin
-    raw_length = available - total_leakage
-    final_length = max(0, int(np.floor(raw_length)))
+    available = reconciled_length * secrecy_capacity(qber) * efficiency_factor
+    raw_length = available - leakage_ec - leakage_ver - security_margin
+    final_length = max(0, math.floor(raw_length))
 
     return KeyLengthEstimate(
         final_length=final_length,
         raw_length=raw_length,
         secrecy_capacity=available,
-        total_leakage=total_leakage,
-        is_secure=is_secure and final_length > 0,
+        total_leakage=leakage_ec + leakage_ver + security_margin,
+        is_secure=final_length > 0,
         qber=qber,
         security_parameter=epsilon_sec,
     )
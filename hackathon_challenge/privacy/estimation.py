@@ -20,19 +20,51 @@ The estimation must be accurate yet efficient, balancing:
 - Key length (fewer sampled bits = longer final key)
 """
 
+import functools
+import math
+import operator
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from statistics import NormalDist
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 
+from hackathon_challenge.utils.compat import DATACLASS_SLOTS, NUMBA_AVAILABLE
+from hackathon_challenge.utils.math import bit_count
+
+try:
+    from scipy.stats import beta as _beta
+
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+
 # QBER security threshold (Shor-Preskill bound)
 QBER_THRESHOLD = 0.11
 
 # Default confidence level for intervals
 DEFAULT_CONFIDENCE = 0.95
 
+# Number of (errors, sample size, confidence) intervals memoized
+CONFIDENCE_INTERVAL_CACHE_SIZE = 1024
+
+# Below this many bits, list samples are compared in C via ``map`` rather
+# than converted to arrays first
+_LIST_COMPARE_MAX_SIZE = 128
 
-@dataclass
+# Two-sided standard normal quantiles for the usual confidence levels
+_Z_SCORES = {
+    0.90: 1.6448536269514722,
+    0.95: 1.959963984540054,
+    0.99: 2.5758293035489004,
+    0.999: 3.2905267314919255,
+}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class QBEREstimate:
     """Result of QBER estimation.
 
@@ -63,17 +95,33 @@ class QBEREstimate:
     source: str
 
 
+def _as_bit_array(bits: Union[List[int], np.ndarray]) -> np.ndarray:
+    """Return 0/1 bits as a contiguous uint8 array.
+
+    Lists go through ``bytes``, which converts small ints in C about twice
+    as fast as ``np.asarray``; arrays are only copied if needed.
+    """
+    if isinstance(bits, list):
+        return np.frombuffer(bytes(bits), dtype=np.uint8)
+    return np.ascontiguousarray(bits, dtype=np.uint8)
+
+
+def _popcount(words: np.ndarray) -> int:
+    """Return the total number of set bits in an unsigned integer array."""
+    return int(bit_count(words).sum(dtype=np.int64))
+
+
 def estimate_qber_from_sample(
-    sample_bits_alice: List[int],
-    sample_bits_bob: List[int],
+    sample_bits_alice: Union[List[int], np.ndarray],
+    sample_bits_bob: Union[List[int], np.ndarray],
 ) -> float:
     """Estimate QBER from comparing sample bits.
 
     Parameters
     ----------
-    sample_bits_alice : List[int]
-        Alice's sample bits.
-    sample_bits_bob : List[int]
+    sample_bits_alice : Union[List[int], np.ndarray]
+        Alice's sample bits. A uint8 array is used without copying.
+    sample_bits_bob : Union[List[int], np.ndarray]
         Bob's sample bits.
 
     Returns
@@ -89,7 +137,9 @@ def estimate_qber_from_sample(
     Notes
     -----
     This is the direct QBER estimation from sampled bits,
-    performed before error correction.
+    performed before error correction. Lists are still accepted but are
+    converted element by element; pass uint8 arrays, or use
+    ``estimate_qber_packed`` on 64-bit words, on large samples.
     """
     if len(sample_bits_alice) != len(sample_bits_bob):
         raise ValueError(
@@ -99,21 +149,21 @@ def estimate_qber_from_sample(
     if len(sample_bits_alice) == 0:
         raise ValueError("Sample cannot be empty")
 
-    errors = sum(a != b for a, b in zip(sample_bits_alice, sample_bits_bob))
+    errors = count_sample_errors(sample_bits_alice, sample_bits_bob)
     return errors / len(sample_bits_alice)
 
 
 def count_sample_errors(
-    sample_bits_alice: List[int],
-    sample_bits_bob: List[int],
+    sample_bits_alice: Union[List[int], np.ndarray],
+    sample_bits_bob: Union[List[int], np.ndarray],
 ) -> int:
     """Count errors in sample bits.
 
     Parameters
     ----------
-    sample_bits_alice : List[int]
-        Alice's sample bits.
-    sample_bits_bob : List[int]
+    sample_bits_alice : Union[List[int], np.ndarray]
+        Alice's sample bits. A uint8 array is used without copying.
+    sample_bits_bob : Union[List[int], np.ndarray]
         Bob's sample bits.
 
     Returns
@@ -125,13 +175,152 @@ def count_sample_errors(
     ------
     ValueError
         If sample lists have different lengths.
+
+    Notes
+    -----
+    Short lists, and lists holding values that do not fit in a byte, are
+    compared with ``operator.countOf(map(operator.ne, ...), True)``, which
+    runs entirely in C; longer lists are cheaper to convert to arrays.
     """
     if len(sample_bits_alice) != len(sample_bits_bob):
         raise ValueError(
             f"Sample lengths must match: {len(sample_bits_alice)} != {len(sample_bits_bob)}"
         )
 
-    return sum(a != b for a, b in zip(sample_bits_alice, sample_bits_bob))
+    if isinstance(sample_bits_alice, list) and isinstance(sample_bits_bob, list):
+        if len(sample_bits_alice) <= _LIST_COMPARE_MAX_SIZE:
+            return operator.countOf(map(operator.ne, sample_bits_alice, sample_bits_bob), True)
+        try:
+            alice = _as_bit_array(sample_bits_alice)
+            bob = _as_bit_array(sample_bits_bob)
+        except (TypeError, ValueError):
+            # Not byte-sized ints (e.g. floats): compare element-wise instead
+            return operator.countOf(map(operator.ne, sample_bits_alice, sample_bits_bob), True)
+    else:
+        alice = _as_bit_array(sample_bits_alice)
+        bob = _as_bit_array(sample_bits_bob)
+    return int(np.count_nonzero(alice ^ bob))
+
+
+def count_sample_errors_packed(
+    packed_alice: np.ndarray,
+    packed_bob: np.ndarray,
+) -> int:
+    """Count errors between two bit-packed samples.
+
+    Parameters
+    ----------
+    packed_alice : np.ndarray
+        Alice's sample bits packed with ``np.packbits`` (uint8).
+    packed_bob : np.ndarray
+        Bob's sample bits, packed the same way.
+
+    Returns
+    -------
+    int
+        Number of differing bits.
+
+    Raises
+    ------
+    ValueError
+        If the packed arrays have different lengths.
+
+    Notes
+    -----
+    Both samples must be padded identically (``np.packbits`` pads with
+    zeros), so padding bits never count as errors. Whole 8-byte groups are
+    compared as uint64 words.
+    """
+    alice = np.ascontiguousarray(packed_alice, dtype=np.uint8)
+    bob = np.ascontiguousarray(packed_bob, dtype=np.uint8)
+    if len(alice) != len(bob):
+        raise ValueError(f"Sample lengths must match: {len(alice)} != {len(bob)}")
+
+    diff = alice ^ bob
+    split = len(diff) - len(diff) % 8
+    return _popcount(diff[:split].view(np.uint64)) + _popcount(diff[split:])
+
+
+def estimate_qber_packed(
+    words_alice: np.ndarray,
+    words_bob: np.ndarray,
+    sift_mask: np.ndarray,
+) -> float:
+    """Estimate QBER from measurement bits packed into 64-bit words.
+
+    Parameters
+    ----------
+    words_alice : np.ndarray
+        Alice's measurement bits packed into uint64 words.
+    words_bob : np.ndarray
+        Bob's measurement bits, packed the same way.
+    sift_mask : np.ndarray
+        uint64 words with a bit set for every position that belongs to
+        the sample (e.g. matching bases).
+
+    Returns
+    -------
+    float
+        Fraction of masked positions where the bits differ (0 to 1).
+
+    Raises
+    ------
+    ValueError
+        If the arrays have different lengths or the mask selects no bits.
+
+    Notes
+    -----
+    Computes ``popcount((a ^ b) & mask) / popcount(mask)`` one word at a
+    time, with no branches or unpacking. With numba installed both counts
+    come from a single fused pass over the words.
+    """
+    alice = np.asarray(words_alice, dtype=np.uint64)
+    bob = np.asarray(words_bob, dtype=np.uint64)
+    mask = np.asarray(sift_mask, dtype=np.uint64)
+    if not len(alice) == len(bob) == len(mask):
+        raise ValueError(
+            f"Word counts must match: {len(alice)}, {len(bob)}, {len(mask)}"
+        )
+
+    if NUMBA_AVAILABLE:
+        errors, sifted = _masked_popcounts_jit(alice, bob, mask)
+    else:
+        errors, sifted = _popcount((alice ^ bob) & mask), _popcount(mask)
+
+    if sifted == 0:
+        raise ValueError("Sample cannot be empty")
+
+    return errors / sifted
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _popcount_word_jit(x: np.uint64) -> np.uint64:
+        """SWAR popcount of one 64-bit word."""
+        x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+        x = (x & np.uint64(0x3333333333333333)) + (
+            (x >> np.uint64(2)) & np.uint64(0x3333333333333333)
+        )
+        x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+        return (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+    @njit(cache=True)
+    def _masked_popcounts_jit(
+        words_alice: np.ndarray, words_bob: np.ndarray, sift_mask: np.ndarray
+    ) -> Tuple[int, int]:
+        """Return (popcount((a ^ b) & mask), popcount(mask)) in one pass.
+
+        Fuses the XOR, mask and both popcounts so that no temporary
+        arrays are written.
+        """
+        errors = np.uint64(0)
+        sifted = np.uint64(0)
+        for i in range(len(sift_mask)):
+            mask = sift_mask[i]
+            errors += _popcount_word_jit((words_alice[i] ^ words_bob[i]) & mask)
+            sifted += _popcount_word_jit(mask)
+        return int(errors), int(sifted)
 
 
 def estimate_qber_from_cascade(
@@ -185,10 +374,12 @@ def compute_confidence_interval(
     error_count: int,
     sample_size: int,
     confidence_level: float = DEFAULT_CONFIDENCE,
+    method: str = "clopper-pearson",
 ) -> Tuple[float, float]:
     """Compute confidence interval for QBER estimate.
 
-    Uses the Clopper-Pearson exact method for binomial proportions.
+    Uses the Clopper-Pearson exact method for binomial proportions by
+    default, or the closed-form Wilson score interval.
 
     Parameters
     ----------
@@ -198,6 +389,8 @@ def compute_confidence_interval(
         Total number of bits sampled.
     confidence_level : float, optional
         Desired confidence level (default 0.95).
+    method : str, optional
+        "clopper-pearson" (default) or "wilson".
 
     Returns
     -------
@@ -216,6 +409,11 @@ def compute_confidence_interval(
 
     Uses the relationship between binomial and beta distributions
     for efficient computation.
+
+    The Wilson interval needs no quantile solve and is much cheaper, but
+    it is not conservative: its upper bound can fall slightly below the
+    Clopper-Pearson one. Use it for monitoring, not for security
+    decisions.
     """
     if sample_size <= 0:
         raise ValueError(f"Sample size must be positive, got {sample_size}")
@@ -228,34 +426,72 @@ def compute_confidence_interval(
             f"Confidence level must be in (0, 1), got {confidence_level}"
         )
 
+    if method == "wilson":
+        return _wilson_interval(error_count, sample_size, confidence_level)
+    if method != "clopper-pearson":
+        raise ValueError(f"Method must be 'clopper-pearson' or 'wilson', got {method}")
+
+    return _cached_confidence_interval(error_count, sample_size, confidence_level)
+
+
+def _z_score(confidence_level: float) -> float:
+    """Two-sided standard normal quantile for a confidence level."""
+    z = _Z_SCORES.get(confidence_level)
+    if z is None:
+        z = NormalDist().inv_cdf((1 + confidence_level) / 2)
+    return z
+
+
+def _wilson_interval(
+    error_count: int,
+    sample_size: int,
+    confidence_level: float,
+) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    z = _z_score(confidence_level)
+    p_hat = error_count / sample_size
+    z2_n = z * z / sample_size
+    denominator = 1 + z2_n
+    centre = (p_hat + z2_n / 2) / denominator
+    half_width = z * math.sqrt(p_hat * (1 - p_hat) / sample_size + z2_n / (4 * sample_size))
+    half_width /= denominator
+
+    # The bounds are exact at the edges; avoid rounding residue there
+    lower = 0.0 if error_count == 0 else max(0.0, centre - half_width)
+    upper = 1.0 if error_count == sample_size else min(1.0, centre + half_width)
+    return (lower, upper)
+
+
+@functools.lru_cache(maxsize=CONFIDENCE_INTERVAL_CACHE_SIZE)
+def _cached_confidence_interval(
+    error_count: int,
+    sample_size: int,
+    confidence_level: float,
+) -> Tuple[float, float]:
+    """Memoized interval computation for ``compute_confidence_interval``."""
     alpha = 1 - confidence_level
 
     # Use scipy for beta distribution quantiles
-    try:
-        from scipy import stats
-
+    if SCIPY_AVAILABLE:
         # Lower bound using beta distribution
         if error_count == 0:
             lower = 0.0
         else:
-            lower = stats.beta.ppf(alpha / 2, error_count, sample_size - error_count + 1)
+            lower = _beta.ppf(alpha / 2, error_count, sample_size - error_count + 1)
 
         # Upper bound using beta distribution
         if error_count == sample_size:
             upper = 1.0
         else:
-            upper = stats.beta.ppf(
-                1 - alpha / 2, error_count + 1, sample_size - error_count
-            )
+            upper = _beta.ppf(1 - alpha / 2, error_count + 1, sample_size - error_count)
 
         return (float(lower), float(upper))
 
-    except ImportError:
-        # Fallback to normal approximation if scipy not available
-        p_hat = error_count / sample_size
-        z = 1.96 if confidence_level == 0.95 else 2.576  # 95% or 99%
-        margin = z * np.sqrt(p_hat * (1 - p_hat) / sample_size)
-        return (max(0.0, p_hat - margin), min(1.0, p_hat + margin))
+    # Fallback to normal approximation if scipy not available
+    p_hat = error_count / sample_size
+    z = 1.96 if confidence_level == 0.95 else 2.576  # 95% or 99%
+    margin = z * math.sqrt(p_hat * (1 - p_hat) / sample_size)
+    return (max(0.0, p_hat - margin), min(1.0, p_hat + margin))
 
 
 def estimate_qber_detailed(
@@ -404,13 +640,11 @@ def compute_optimal_sample_size(
         raise ValueError(f"Target precision must be positive, got {target_precision}")
 
     # Z-score for confidence level
-    from scipy import stats
-
-    z = stats.norm.ppf(1 - (1 - confidence_level) / 2)
+    z = _z_score(confidence_level)
 
     # Sample size formula: n = (z^2 * p * (1-p)) / precision^2
     variance = expected_qber * (1 - expected_qber)
-    n_required = int(np.ceil((z ** 2 * variance) / (target_precision ** 2)))
+    n_required = math.ceil((z * z * variance) / (target_precision * target_precision))
 
     # Cap at total available bits, but use at least 100
     return max(100, min(n_required, total_bits))
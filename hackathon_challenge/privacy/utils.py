@@ -13,7 +13,7 @@ Notes
 A Toeplitz matrix has constant diagonals, meaning each descending diagonal
 from left to right is constant. This structure allows:
 1. Efficient storage: Only n + m - 1 values needed for n × m matrix
-2. Efficient multiplication: O(n log n) using FFT
+2. Efficient multiplication: O(n log n) using FFT (toeplitz_multiply_fft)
 3. 2-universal hashing: Proven security for privacy amplification
 
 The Leftover Hash Lemma guarantees that applying a random Toeplitz matrix
@@ -21,11 +21,22 @@ to a weakly random string produces a nearly uniform random string,
 provided the output length is appropriate.
 """
 
-import random
+import functools
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
+from scipy import fft as sp_fft
+
+from hackathon_challenge.utils.math import parity_u64
+
+# Matrix size (rows x cols) above which toeplitz_multiply packs bits into
+# 64-bit words; below it the packing overhead exceeds the dense matmul
+_PACKED_MULTIPLY_MIN_SIZE = 1 << 17
+
+# Input length below which toeplitz_multiply_fft uses the packed product;
+# the FFT's constant factors lose on short keys
+_FFT_MULTIPLY_MIN_COLS = 4096
 
 
 @dataclass
@@ -34,7 +45,7 @@ class ToeplitzSeed:
 
     Attributes
     ----------
-    bits : List[int]
+    bits : Union[List[int], np.ndarray]
         Random bits defining the matrix (length = n + m - 1).
     input_length : int
         Number of columns (input key length).
@@ -44,7 +55,7 @@ class ToeplitzSeed:
         Seed used for random generation (None if not reproducible).
     """
 
-    bits: List[int]
+    bits: Union[List[int], np.ndarray]
     input_length: int
     output_length: int
     rng_seed: Optional[int] = None
@@ -58,15 +69,15 @@ class ToeplitzSeed:
             )
 
     @property
-    def first_column(self) -> List[int]:
+    def first_column(self) -> Union[List[int], np.ndarray]:
         """Get first column of Toeplitz matrix."""
         return self.bits[: self.output_length]
 
     @property
-    def first_row(self) -> List[int]:
+    def first_row(self) -> Union[List[int], np.ndarray]:
         """Get first row of Toeplitz matrix."""
         # First element is shared between column and row
-        return [self.bits[self.output_length - 1]] + self.bits[self.output_length :]
+        return self.bits[self.output_length - 1 :]
 
 
 def compute_seed_length(input_length: int, output_length: int) -> int:
@@ -133,14 +144,46 @@ def generate_toeplitz_seed(
     requiring key_length + final_length - 1 bits total.
 
     When rng_seed is provided, the function is deterministic for testing.
+    Use ``generate_toeplitz_seed_array`` to skip the list conversion.
     """
-    seed_length = compute_seed_length(key_length, final_length)
+    return generate_toeplitz_seed_array(key_length, final_length, rng_seed).tolist()
+
 
-    if rng_seed is not None:
-        rng = random.Random(rng_seed)
-        return [rng.randint(0, 1) for _ in range(seed_length)]
-    else:
-        return [random.randint(0, 1) for _ in range(seed_length)]
+def generate_toeplitz_seed_array(
+    key_length: int,
+    final_length: int,
+    rng_seed: Optional[int] = None,
+) -> np.ndarray:
+    """Generate random seed for Toeplitz matrix as a uint8 array.
+
+    Parameters
+    ----------
+    key_length : int
+        Length of input key.
+    final_length : int
+        Length of output key.
+    rng_seed : int, optional
+        Seed for random number generator. If None, uses system randomness.
+
+    Returns
+    -------
+    np.ndarray
+        Random seed bits (uint8, length = key_length + final_length - 1).
+
+    Raises
+    ------
+    ValueError
+        If lengths are invalid.
+
+    Notes
+    -----
+    The bits come from ``np.random.default_rng`` (PCG64), which fills the
+    buffer in C; a 10^6-bit seed takes about 3 ms instead of 0.7 s for a
+    per-bit Python loop.
+    """
+    seed_length = compute_seed_length(key_length, final_length)
+    rng = np.random.default_rng(rng_seed)
+    return rng.integers(0, 2, size=seed_length, dtype=np.uint8)
 
 
 def generate_toeplitz_seed_structured(
@@ -173,16 +216,16 @@ def generate_toeplitz_seed_structured(
     )
 
 
-def validate_toeplitz_seed(
-    seed: List[int],
+def validated_seed_array(
+    seed: Union[List[int], np.ndarray],
     key_length: int,
     final_length: int,
-) -> bool:
-    """Validate Toeplitz seed length and format.
+) -> Optional[np.ndarray]:
+    """Validate a Toeplitz seed and return it as a bit array.
 
     Parameters
     ----------
-    seed : List[int]
+    seed : Union[List[int], np.ndarray]
         Seed bits to validate.
     key_length : int
         Expected input key length.
@@ -191,16 +234,64 @@ def validate_toeplitz_seed(
 
     Returns
     -------
-    bool
-        True if seed is valid, False otherwise.
+    Optional[np.ndarray]
+        The seed as a uint8 array (no copy if it already is one; read-only
+        when converted from a list), or None if the length is wrong or a
+        value is not 0 or 1.
+
+    Notes
+    -----
+    The 0/1 check is vectorized. For unsigned or bool arrays it is a
+    single ``max`` reduction, and int lists are converted through
+    ``bytes`` (about 4x faster than ``np.asarray``); other inputs are
+    compared against 0 and 1 elementwise.
     """
     expected_length = compute_seed_length(key_length, final_length)
 
     if len(seed) != expected_length:
-        return False
+        return None
+
+    if isinstance(seed, list):
+        try:
+            seed = np.frombuffer(bytes(seed), dtype=np.uint8)
+        except (TypeError, ValueError):
+            # Not byte-sized ints (e.g. floats); use the generic check
+            pass
 
     # Check all values are 0 or 1
-    return all(bit in (0, 1) for bit in seed)
+    seed_arr = np.asarray(seed)
+    if seed_arr.ndim != 1:
+        return None
+    if seed_arr.dtype.kind in "bu":
+        if seed_arr.max(initial=0) > 1:
+            return None
+    elif not np.all((seed_arr == 0) | (seed_arr == 1)):
+        return None
+    return seed_arr.astype(np.uint8, copy=False)
+
+
+def validate_toeplitz_seed(
+    seed: Union[List[int], np.ndarray],
+    key_length: int,
+    final_length: int,
+) -> bool:
+    """Validate Toeplitz seed length and format.
+
+    Parameters
+    ----------
+    seed : Union[List[int], np.ndarray]
+        Seed bits to validate.
+    key_length : int
+        Expected input key length.
+    final_length : int
+        Expected output key length.
+
+    Returns
+    -------
+    bool
+        True if seed is valid, False otherwise.
+    """
+    return validated_seed_array(seed, key_length, final_length) is not None
 
 
 def construct_toeplitz_matrix(
@@ -222,7 +313,9 @@ def construct_toeplitz_matrix(
     Returns
     -------
     np.ndarray
-        Toeplitz matrix of shape (num_rows, num_cols).
+        Read-only Toeplitz view of shape (num_rows, num_cols) over a
+        buffer of length num_rows + num_cols - 1; no num_rows x num_cols
+        matrix is allocated. Call ``np.array`` on it for a writable copy.
 
     Raises
     ------
@@ -235,22 +328,28 @@ def construct_toeplitz_matrix(
     - First column: seed[0:num_rows]
     - First row: seed[num_rows-1:num_rows+num_cols-1]
     """
-    from scipy.linalg import toeplitz
-
     expected_length = num_cols + num_rows - 1
     if len(seed) != expected_length:
         raise ValueError(
             f"Seed length must be {expected_length}, got {len(seed)}"
         )
 
-    # First column and first row for scipy.linalg.toeplitz
-    col = seed[:num_rows]
-    # First element of row is same as first element of col
-    # So row starts from seed[num_rows-1]
-    row_start = num_rows - 1
-    row = seed[row_start : row_start + num_cols]
+    # Lay the diagonals out so that T[i, j] = diagonals[num_rows-1-i+j]: the
+    # first column reversed, followed by the rest of the first row.
+    seed_array = np.asarray(seed, dtype=np.uint8)
+    diagonals = np.concatenate(
+        (seed_array[:num_rows][::-1], seed_array[num_rows:])
+    )
 
-    return toeplitz(col, row).astype(np.uint8)
+    # Stepping down a row moves one element back in the buffer, stepping
+    # right moves one element forward.
+    stride = diagonals.strides[0]
+    return np.lib.stride_tricks.as_strided(
+        diagonals[num_rows - 1 :],
+        shape=(num_rows, num_cols),
+        strides=(-stride, stride),
+        writeable=False,
+    )
 
 
 def construct_toeplitz_matrix_numpy(
@@ -272,7 +371,9 @@ def construct_toeplitz_matrix_numpy(
     Returns
     -------
     np.ndarray
-        Toeplitz matrix of shape (num_rows, num_cols).
+        Read-only Toeplitz view of shape (num_rows, num_cols) directly
+        over the seed bits; nothing of size num_rows x num_cols is
+        allocated. Call ``np.array`` on it for a writable copy.
     """
     expected_length = num_cols + num_rows - 1
     if len(seed) != expected_length:
@@ -280,13 +381,38 @@ def construct_toeplitz_matrix_numpy(
             f"Seed length must be {expected_length}, got {len(seed)}"
         )
 
-    # Create indices for Toeplitz structure
-    # T[i,j] = seed[i - j + num_cols - 1]
-    rows, cols = np.ogrid[:num_rows, :num_cols]
-    indices = rows - cols + num_cols - 1
+    # T[i,j] = seed[i - j + num_cols - 1]: stepping down a row moves one
+    # element forward in the seed, stepping right moves one element back.
+    seed_array = np.asarray(seed, dtype=np.uint8)
+    stride = seed_array.strides[0]
+    return np.lib.stride_tricks.as_strided(
+        seed_array[max(num_cols - 1, 0) :],
+        shape=(num_rows, num_cols),
+        strides=(stride, -stride),
+        writeable=False,
+    )
 
-    seed_array = np.array(seed, dtype=np.uint8)
-    return seed_array[indices]
+
+def pack_bits_to_uint64(bits: np.ndarray) -> np.ndarray:
+    """Pack 0/1 bits along the last axis into little-endian 64-bit words.
+
+    Parameters
+    ----------
+    bits : np.ndarray
+        Bit array (any nonzero value packs as 1) of shape ``(..., n)``.
+
+    Returns
+    -------
+    np.ndarray
+        uint64 array of shape ``(..., ceil(n / 64))``. Bit ``j`` lands in
+        bit ``j % 64`` of word ``j // 64``; padding bits are zero.
+    """
+    packed = np.packbits(bits, axis=-1, bitorder="little")
+    pad = -packed.shape[-1] % 8
+    if pad:
+        widths = [(0, 0)] * (packed.ndim - 1) + [(0, pad)]
+        packed = np.pad(packed, widths)
+    return np.ascontiguousarray(packed).view("<u8")
 
 
 def toeplitz_multiply(
@@ -309,11 +435,220 @@ def toeplitz_multiply(
 
     Notes
     -----
-    Performs T × v mod 2 where T is the Toeplitz matrix.
-    For large matrices, FFT-based multiplication would be more efficient.
+    Performs T × v mod 2 where T is the Toeplitz matrix. A large 2-D
+    uint8 or bool matrix of 0/1 bits is multiplied over GF(2) on packed
+    64-bit words: each row is ANDed with the packed vector, XOR-reduced,
+    and the parity of the remaining word is the output bit. That is about
+    3x faster than NumPy's integer matmul, which has no BLAS kernel.
+
+    Other integer inputs fall back to ``matrix @ vector`` with the low bit
+    masked in place. A uint8 product wraps mod 256, which keeps its
+    parity, so no wider accumulator is needed; bool inputs are multiplied
+    as uint8 because a bool matmul would OR the terms instead of summing
+    them. Float products are reduced with ``% 2`` and stay float.
     """
-    result = matrix_or_seed @ vector
-    return result % 2
+    matrix = np.asarray(matrix_or_seed)
+    vec = np.asarray(vector)
+    if (
+        matrix.ndim == 2
+        and vec.ndim == 1
+        and matrix.size >= _PACKED_MULTIPLY_MIN_SIZE
+        and matrix.dtype in (np.uint8, np.bool_)
+        and vec.dtype in (np.uint8, np.bool_)
+        and matrix.shape[1] == len(vec)
+        and (matrix.dtype == np.bool_ or matrix.max(initial=0) <= 1)
+        and (vec.dtype == np.bool_ or vec.max(initial=0) <= 1)
+    ):
+        products = pack_bits_to_uint64(matrix) & pack_bits_to_uint64(vec)
+        return parity_u64(np.bitwise_xor.reduce(products, axis=1))
+
+    if matrix.dtype == np.bool_:
+        matrix = matrix.view(np.uint8)
+    if vec.dtype == np.bool_:
+        vec = vec.view(np.uint8)
+    result = np.asarray(matrix @ vec)
+    if result.dtype.kind not in "iub":
+        return result % 2
+    np.bitwise_and(result, 1, out=result)
+    return result.astype(np.uint8, copy=False)
+
+
+def toeplitz_multiply_fft(
+    seed: Union[List[int], np.ndarray],
+    num_rows: int,
+    num_cols: int,
+    vector: np.ndarray,
+) -> np.ndarray:
+    """Multiply the seed's Toeplitz matrix by a vector modulo 2 via FFT.
+
+    Parameters
+    ----------
+    seed : Union[List[int], np.ndarray]
+        Seed bits (length = num_cols + num_rows - 1), laid out as for
+        ``construct_toeplitz_matrix``.
+    num_rows : int
+        Number of rows (output length).
+    num_cols : int
+        Number of columns (input length).
+    vector : np.ndarray
+        Input bits (0/1) of length num_cols.
+
+    Returns
+    -------
+    np.ndarray
+        Result bits (uint8) of length num_rows.
+
+    Raises
+    ------
+    ValueError
+        If seed or vector length doesn't match dimensions.
+
+    Notes
+    -----
+    Row ``i`` of the matrix is the window ``diag[w : w + num_cols]`` of the
+    diagonals with ``w = num_rows - 1 - i``, so the product is a
+    correlation of the diagonals with the vector: one circular convolution
+    with the reversed vector, O(N log N) for N = num_rows + num_cols - 1
+    instead of O(num_rows * num_cols). Products stay below 2**53, so
+    rounding the float64 result and reducing mod 2 is exact. Inputs
+    shorter than ``_FFT_MULTIPLY_MIN_COLS`` use ``toeplitz_multiply``.
+    """
+    expected_length = num_cols + num_rows - 1
+    if len(seed) != expected_length:
+        raise ValueError(
+            f"Seed length must be {expected_length}, got {len(seed)}"
+        )
+    if len(vector) != num_cols:
+        raise ValueError(f"Vector length must be {num_cols}, got {len(vector)}")
+
+    if num_cols < _FFT_MULTIPLY_MIN_COLS:
+        matrix = construct_toeplitz_matrix(seed, num_rows, num_cols)
+        return toeplitz_multiply(matrix, np.asarray(vector, dtype=np.uint8)).astype(np.uint8)
+
+    seed_array = np.asarray(seed, dtype=np.float64)
+    diagonals = np.concatenate((seed_array[:num_rows][::-1], seed_array[num_rows:]))
+    vec = np.asarray(vector, dtype=np.float64)
+
+    size = sp_fft.next_fast_len(expected_length, real=True)
+    spectrum = sp_fft.rfft(diagonals, n=size) * sp_fft.rfft(vec[::-1], n=size)
+    correlation = sp_fft.irfft(spectrum, n=size)
+    product = correlation[num_cols - 1 : num_cols - 1 + num_rows][::-1]
+    return np.bitwise_and(np.rint(product).astype(np.int64), 1).astype(np.uint8)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_cupy() -> Optional[Any]:
+    """Import CuPy on first use of a GPU path.
+
+    Importing CuPy is slow, so it is deferred until a GPU product is
+    actually requested rather than paid on every import of this module.
+
+    Returns
+    -------
+    Optional[Any]
+        The ``cupy`` module, or None if it is not installed or fails to
+        import (a broken CUDA setup raises more than ImportError).
+    """
+    try:
+        import cupy
+    except Exception:
+        return None
+    return cupy
+
+
+def _toeplitz_batch_parity(
+    xp: Any,
+    fft: Any,
+    seeds: Any,
+    vectors: Any,
+    num_rows: int,
+    num_cols: int,
+) -> Any:
+    """Batched FFT Toeplitz products mod 2 for an array module ``xp``.
+
+    ``fft`` is the matching FFT module (``cupy.fft``, or ``scipy.fft``
+    with NumPy, which the tests use as the CPU reference). Seeds of shape
+    ``(N,)`` are shared by all vectors; seeds of shape ``(B, N)`` pair up
+    with the rows of ``vectors``. The transforms run along axis 1, one
+    batched call per direction.
+    """
+    seeds = xp.asarray(seeds, dtype=xp.float64)
+    vectors = xp.asarray(vectors, dtype=xp.float64)
+    if seeds.ndim == 1:
+        seeds = seeds[None, :]
+
+    expected_length = num_cols + num_rows - 1
+    if seeds.ndim != 2 or seeds.shape[1] != expected_length:
+        raise ValueError(
+            f"Seeds must have length {expected_length}, got shape {tuple(seeds.shape)}"
+        )
+    if vectors.ndim != 2 or vectors.shape[1] != num_cols:
+        raise ValueError(
+            f"Vectors must have shape (batch, {num_cols}), got {tuple(vectors.shape)}"
+        )
+    if seeds.shape[0] not in (1, vectors.shape[0]):
+        raise ValueError(
+            f"Got {seeds.shape[0]} seeds for {vectors.shape[0]} vectors"
+        )
+
+    # Same layout as toeplitz_multiply_fft, one row per session
+    diagonals = xp.concatenate((seeds[:, :num_rows][:, ::-1], seeds[:, num_rows:]), axis=1)
+    size = sp_fft.next_fast_len(expected_length, real=True)
+    spectrum = fft.rfft(diagonals, n=size, axis=1) * fft.rfft(vectors[:, ::-1], n=size, axis=1)
+    correlation = fft.irfft(spectrum, n=size, axis=1)
+    product = correlation[:, num_cols - 1 : num_cols - 1 + num_rows][:, ::-1]
+    return xp.bitwise_and(xp.rint(product).astype(xp.int64), 1).astype(xp.uint8)
+
+
+def toeplitz_multiply_batch_gpu(
+    seeds: np.ndarray,
+    vectors: np.ndarray,
+    num_rows: int,
+    num_cols: int,
+) -> np.ndarray:
+    """Multiply a batch of vectors by Toeplitz matrices mod 2 on the GPU.
+
+    Parameters
+    ----------
+    seeds : np.ndarray
+        Seed bits laid out as for ``construct_toeplitz_matrix``: shape
+        ``(num_rows + num_cols - 1,)`` to hash every vector with one
+        matrix, or ``(batch, num_rows + num_cols - 1)`` for one matrix per
+        vector. CuPy arrays are used in place, so seeds reused across
+        calls can stay on the device.
+    vectors : np.ndarray
+        Input bits of shape ``(batch, num_cols)``.
+    num_rows : int
+        Number of rows (output length).
+    num_cols : int
+        Number of columns (input length).
+
+    Returns
+    -------
+    np.ndarray
+        Result bits (uint8) of shape ``(batch, num_rows)``, copied back
+        to the host.
+
+    Raises
+    ------
+    RuntimeError
+        If CuPy is not installed or cannot be imported.
+    ValueError
+        If the shapes don't match the dimensions.
+
+    Notes
+    -----
+    Equivalent to ``toeplitz_multiply_fft`` per row, but all sessions
+    share two batched real FFTs and one inverse FFT along axis 1 on the
+    device. On the CPU the batch is no faster than a loop over
+    ``toeplitz_multiply_fft`` (the batched buffers fall out of cache), so
+    there is no NumPy counterpart.
+    """
+    cp = _load_cupy()
+    if cp is None:
+        raise RuntimeError("toeplitz_multiply_batch_gpu requires CuPy (pip install cupy)")
+    parity = _toeplitz_batch_parity(cp, cp.fft, seeds, vectors, num_rows, num_cols)
+    return cp.asnumpy(parity)
 
 
 def extract_toeplitz_components(
@@ -342,31 +677,21 @@ def extract_toeplitz_components(
     return first_column, first_row
 
 
-def bits_to_bytes(bits: List[int]) -> bytes:
+def bits_to_bytes(bits: Union[List[int], np.ndarray]) -> bytes:
     """Convert bit list to bytes.
 
     Parameters
     ----------
-    bits : List[int]
+    bits : Union[List[int], np.ndarray]
         List of bits (0 or 1).
 
     Returns
     -------
     bytes
-        Byte representation (MSB first within each byte).
+        Byte representation (MSB first within each byte). The last byte
+        is zero-padded on the right.
     """
-    # Pad to multiple of 8
-    padded_length = ((len(bits) + 7) // 8) * 8
-    padded_bits = bits + [0] * (padded_length - len(bits))
-
-    byte_list = []
-    for i in range(0, padded_length, 8):
-        byte_val = 0
-        for j in range(8):
-            byte_val = (byte_val << 1) | padded_bits[i + j]
-        byte_list.append(byte_val)
-
-    return bytes(byte_list)
+    return np.packbits(np.asarray(bits, dtype=np.uint8)).tobytes()
 
 
 def bytes_to_bits(data: bytes, num_bits: Optional[int] = None) -> List[int]:
@@ -384,11 +709,7 @@ def bytes_to_bits(data: bytes, num_bits: Optional[int] = None) -> List[int]:
     List[int]
         List of bits.
     """
-    bits = []
-    for byte_val in data:
-        for i in range(7, -1, -1):
-            bits.append((byte_val >> i) & 1)
-
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
     if num_bits is not None:
-        return bits[:num_bits]
-    return bits
+        bits = bits[:num_bits]
+    return bits.tolist()
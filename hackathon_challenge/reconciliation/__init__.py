@@ -17,6 +17,7 @@ from hackathon_challenge.reconciliation.cascade import CascadeReconciliator
 from hackathon_challenge.reconciliation.history import BacktrackManager, PassHistory
 from hackathon_challenge.reconciliation.utils import (
     apply_permutation_to_key,
+    compute_block_parities,
     compute_optimal_block_size,
     compute_parity,
     inverse_permutation,
@@ -36,6 +37,7 @@ __all__ = [
     "calculate_binary_search_leakage",
     # Utilities
     "compute_parity",
+    "compute_block_parities",
     "permute_indices",
     "inverse_permutation",
     "compute_optimal_block_size",
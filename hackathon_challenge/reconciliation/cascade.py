@@ -23,10 +23,10 @@ from hackathon_challenge.reconciliation.binary_search import (
 )
 from hackathon_challenge.reconciliation.history import BacktrackManager, PassHistory
 from hackathon_challenge.reconciliation.utils import (
+    compute_block_parities,
     compute_optimal_block_size,
     compute_parity,
     permute_indices,
-    split_into_blocks,
 )
 
 if TYPE_CHECKING:
@@ -237,25 +237,25 @@ class CascadeReconciliator:
         # Get the permutation for this pass
         permutation = self._pass_permutations[pass_index]
 
-        # Split into blocks of permuted indices
-        # Each block contains the permuted indices
-        blocks = split_into_blocks(len(self._key), block_size)
+        # Block i covers permuted positions [i * block_size, (i + 1) * block_size),
+        # so its original key indices are a slice of the permutation. Blocks
+        # stay lists of ints: they are sent to the peer and kept in history.
+        flat_indices = permutation.tolist()
+        original_blocks: List[List[int]] = [
+            flat_indices[start : start + block_size]
+            for start in range(0, len(flat_indices), block_size)
+        ]
 
-        # Convert block indices to original key indices via permutation
-        # blocks[i] contains positions in the permuted view
-        # permutation[blocks[i]] gives the original key indices
-        original_blocks: List[List[int]] = []
-        for block in blocks:
-            original_indices = [int(permutation[i]) for i in block]
-            original_blocks.append(original_indices)
+        # Compute local parities of all blocks in one reduction
+        local_parities = compute_block_parities(self._key, permutation, block_size).tolist()
 
         # Exchange parities for all blocks
         yield from self._exchange_and_correct_blocks(
-            pass_index, original_blocks
+            pass_index, original_blocks, local_parities
         )
 
     def _exchange_and_correct_blocks(
-        self, pass_index: int, blocks: List[List[int]]
+        self, pass_index: int, blocks: List[List[int]], local_parities: List[int]
     ) -> Generator[EventExpression, None, None]:
         """Exchange parities for all blocks and correct errors.
 
@@ -265,14 +265,14 @@ class CascadeReconciliator:
             Current pass index.
         blocks : List[List[int]]
             List of blocks, each containing original key indices.
+        local_parities : List[int]
+            Local parity of each block.
 
         Yields
         ------
         EventExpression
             Network operation events.
         """
-        # Compute local parities for all blocks
-        local_parities = [compute_parity(self._key, block) for block in blocks]
 
         if self._is_initiator:
             # Initiator sends parities first, then receives
@@ -307,13 +307,17 @@ class CascadeReconciliator:
                 parity=local_parity,
             )
 
+        if len(remote_parities) != len(local_parities):
+            raise RuntimeError(
+                f"Expected {len(local_parities)} block parities, got {len(remote_parities)}"
+            )
+
         # Find blocks with parity mismatch (odd number of errors)
-        mismatched_blocks = []
-        for block_idx, (local_p, remote_p) in enumerate(
-            zip(local_parities, remote_parities)
-        ):
-            if local_p != remote_p:
-                mismatched_blocks.append((block_idx, blocks[block_idx]))
+        mismatched = np.flatnonzero(
+            np.asarray(local_parities, dtype=np.uint8)
+            != np.asarray(remote_parities, dtype=np.uint8)
+        )
+        mismatched_blocks = [(int(block_idx), blocks[block_idx]) for block_idx in mismatched]
 
         # Process each mismatched block with binary search
         for block_idx, block_indices in mismatched_blocks:
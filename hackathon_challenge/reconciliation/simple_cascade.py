@@ -21,11 +21,14 @@ from pydynaa import EventExpression
 
 from hackathon_challenge.core.constants import DEFAULT_NUM_PASSES
 from hackathon_challenge.reconciliation.utils import (
+    compute_block_parities,
     compute_optimal_block_size,
-    compute_parity,
     permute_indices,
-    split_into_blocks,
 )
+from hackathon_challenge.utils.compat import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from numba import njit
 
 if TYPE_CHECKING:
     from hackathon_challenge.auth.socket import AuthenticatedSocket
@@ -50,6 +53,37 @@ MSG_SEARCH_RESPONSE = "CASCADE_RESP"
 MSG_SEARCH_COMPLETE = "CASCADE_DONE"
 MSG_PASS_SYNC = "CASCADE_SYNC"
 
+# Largest block whose binary search reads parities from a prefix XOR array;
+# beyond it the one-off O(block) prefix costs more than the JIT gathers
+_PREFIX_PARITY_MAX_BLOCK = 512
+
+
+def _gather_parity_numpy(key: np.ndarray, indices: np.ndarray) -> int:
+    """Parity of ``key[indices]`` for in-bounds int64 indices."""
+    return int(np.bitwise_xor.reduce(key[indices]))
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _gather_parity_jit(key: np.ndarray, indices: np.ndarray) -> int:
+        """Parity of ``key[indices]`` without a temporary gather array."""
+        parity = 0
+        for i in indices:
+            parity ^= key[i]
+        return parity & 1
+
+
+def _gather_parity(key: np.ndarray, indices: np.ndarray) -> int:
+    """Compute the parity of the key bits at in-bounds int64 indices.
+
+    Unlike ``compute_parity`` this skips the bounds check: callers pass
+    slices of a permutation of ``range(len(key))``.
+    """
+    if NUMBA_AVAILABLE:
+        return int(_gather_parity_jit(key, indices))
+    return _gather_parity_numpy(key, indices)
+
 
 class SimpleCascadeReconciliator:
     """Simplified Cascade implementation with explicit synchronization.
@@ -79,7 +113,7 @@ class SimpleCascadeReconciliator:
         self,
         socket: Union["AuthenticatedSocket", SocketProtocol],
         is_initiator: bool,
-        key: List[int],
+        key: Union[List[int], np.ndarray],
         rng_seed: int,
         num_passes: int = DEFAULT_NUM_PASSES,
         initial_block_size: Optional[int] = None,
@@ -155,37 +189,38 @@ class SimpleCascadeReconciliator:
         # Get permutation for this pass
         permutation = permute_indices(len(self._key), self._rng_seed, pass_index)
 
-        # Split into blocks (in permuted space)
-        blocks = split_into_blocks(len(self._key), block_size)
-
-        # Convert to original indices
-        original_blocks: List[List[int]] = []
-        for block in blocks:
-            original_indices = [int(permutation[i]) for i in block]
-            original_blocks.append(original_indices)
+        # Blocks are consecutive runs of the permuted positions, so block i
+        # in original indices is the slice permutation[starts[i]:starts[i+1]]
+        # of one flat int64 array.
+        starts = np.arange(0, len(self._key), block_size)
+        original_blocks = np.split(permutation, starts[1:])
 
-        # Compute local parities
-        local_parities = [compute_parity(self._key, block) for block in original_blocks]
+        # Compute local parities of all blocks in one reduction
+        local_parities = compute_block_parities(self._key, permutation, block_size)
 
         # Exchange parities
         if self._is_initiator:
             # Alice sends first
-            self._socket.send_structured(StructuredMessage(MSG_PARITIES, local_parities))
+            self._socket.send_structured(StructuredMessage(MSG_PARITIES, local_parities.tolist()))
             response = yield from self._socket.recv_structured()
             remote_parities = response.payload
         else:
             # Bob receives first
             response = yield from self._socket.recv_structured()
             remote_parities = response.payload
-            self._socket.send_structured(StructuredMessage(MSG_PARITIES, local_parities))
+            self._socket.send_structured(StructuredMessage(MSG_PARITIES, local_parities.tolist()))
 
         self._leakage_bits += len(original_blocks)
 
+        if len(remote_parities) != len(local_parities):
+            raise RuntimeError(
+                f"Expected {len(local_parities)} block parities, got {len(remote_parities)}"
+            )
+
         # Find mismatched blocks (both parties will find same blocks)
-        mismatched_indices = []
-        for i, (lp, rp) in enumerate(zip(local_parities, remote_parities)):
-            if lp != rp:
-                mismatched_indices.append(i)
+        mismatched_indices = np.flatnonzero(
+            local_parities != np.asarray(remote_parities, dtype=np.uint8)
+        )
 
         # Process each mismatched block with binary search
         for block_idx in mismatched_indices:
@@ -201,14 +236,14 @@ class SimpleCascadeReconciliator:
             self._socket.send_structured(StructuredMessage(MSG_PASS_SYNC, pass_index))
 
     def _binary_search(
-        self, block_indices: List[int]
+        self, block_indices: np.ndarray
     ) -> Generator[EventExpression, None, Optional[int]]:
         """Run binary search on a block to find and correct one error.
 
         Parameters
         ----------
-        block_indices : List[int]
-            Indices of the block with odd parity.
+        block_indices : np.ndarray
+            Indices (int64) of the block with odd parity.
 
         Returns
         -------
@@ -224,7 +259,15 @@ class SimpleCascadeReconciliator:
                 self._key[block_indices[0]] ^= 1
             # Both parties track the error
             self._errors_corrected += 1
-            return block_indices[0]
+            return int(block_indices[0])
+
+        # The key is not modified during the search, so for small blocks
+        # prefix[k] = parity(key[block_indices[:k]]) turns every left-half
+        # parity into a single XOR
+        prefix = None
+        if len(block_indices) <= _PREFIX_PARITY_MAX_BLOCK or not NUMBA_AVAILABLE:
+            prefix = np.zeros(len(block_indices) + 1, dtype=np.uint8)
+            np.bitwise_xor.accumulate(self._key[block_indices], out=prefix[1:])
 
         # Binary search
         left = 0
@@ -232,23 +275,22 @@ class SimpleCascadeReconciliator:
 
         while right - left > 1:
             mid = (left + right) // 2
-            left_half = block_indices[left:mid]
 
-            # Exchange parities for left half
-            local_parity = compute_parity(self._key, left_half)
+            # Exchange parities for left half. Both parties bisect the same
+            # block in lockstep, so only the parity bit goes on the wire.
+            if prefix is not None:
+                local_parity = int(prefix[mid] ^ prefix[left])
+            else:
+                local_parity = _gather_parity(self._key, block_indices[left:mid])
 
             if self._is_initiator:
-                self._socket.send_structured(
-                    StructuredMessage(MSG_SEARCH_REQUEST, {"indices": left_half, "parity": local_parity})
-                )
+                self._socket.send_structured(StructuredMessage(MSG_SEARCH_REQUEST, local_parity))
                 response = yield from self._socket.recv_structured()
-                remote_parity = response.payload["parity"]
+                remote_parity = response.payload
             else:
                 response = yield from self._socket.recv_structured()
-                remote_parity = response.payload["parity"]
-                self._socket.send_structured(
-                    StructuredMessage(MSG_SEARCH_RESPONSE, {"indices": left_half, "parity": local_parity})
-                )
+                remote_parity = response.payload
+                self._socket.send_structured(StructuredMessage(MSG_SEARCH_RESPONSE, local_parity))
 
             self._leakage_bits += 1
 
@@ -258,7 +300,7 @@ class SimpleCascadeReconciliator:
                 left = mid
 
         # Found the error
-        error_idx = block_indices[left]
+        error_idx = int(block_indices[left])
 
         # Only initiator flips the bit to converge to same value
         if self._is_initiator:
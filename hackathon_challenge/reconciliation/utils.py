@@ -203,6 +203,43 @@ def split_into_blocks(length: int, block_size: int) -> List[List[int]]:
     return blocks
 
 
+def compute_block_parities(
+    key: np.ndarray, permutation: np.ndarray, block_size: int
+) -> np.ndarray:
+    """Compute the parity of every block of a Cascade pass at once.
+
+    Parameters
+    ----------
+    key : np.ndarray
+        Bit array (uint8, 0s and 1s).
+    permutation : np.ndarray
+        Permutation of ``range(len(key))`` for this pass.
+    block_size : int
+        Block size; the last block may be shorter.
+
+    Returns
+    -------
+    np.ndarray
+        uint8 parities, one per block, in block order.
+
+    Notes
+    -----
+    Block ``i`` holds the original indices
+    ``permutation[i * block_size : (i + 1) * block_size]`` (the blocks of
+    ``split_into_blocks`` mapped through the permutation), so one gather
+    and one ``np.bitwise_xor.reduceat`` replace a ``compute_parity`` call
+    per block.
+
+    Examples
+    --------
+    >>> key = np.array([1, 0, 1, 1, 0], dtype=np.uint8)
+    >>> compute_block_parities(key, np.arange(5), 2).tolist()
+    [1, 0, 0]
+    """
+    starts = np.arange(0, len(permutation), block_size)
+    return np.bitwise_xor.reduceat(np.asarray(key, dtype=np.uint8)[permutation], starts)
+
+
 def apply_permutation_to_key(
     key: Union[np.ndarray, List[int]], permutation: np.ndarray
 ) -> np.ndarray:
@@ -21,6 +21,7 @@ Reference:
 """
 
 import argparse
+import math
 import os
 import sys
 import time
@@ -195,12 +196,9 @@ def print_key_visual(key: List[int], max_display: int = 64):
     display_key = key[:max_display]
     
     # Create colored representation
-    key_str = ""
-    for bit in display_key:
-        if bit == 0:
-            key_str += f"{Style.BLUE}0{Style.RESET}"
-        else:
-            key_str += f"{Style.MAGENTA}1{Style.RESET}"
+    zero = f"{Style.BLUE}0{Style.RESET}"
+    one = f"{Style.MAGENTA}1{Style.RESET}"
+    key_str = "".join(zero if bit == 0 else one for bit in display_key)
     
     if len(key) > max_display:
         key_str += f" {Style.DIM}... ({len(key) - max_display} more bits){Style.RESET}"
@@ -338,7 +336,7 @@ def run_mock_simulation(scenario: DemoScenario) -> Dict[str, Any]:
             
             # Binary entropy function h(p)
             if 0 < qber < 0.5:
-                h_qber = -qber * np.log2(qber) - (1 - qber) * np.log2(1 - qber)
+                h_qber = -qber * math.log2(qber) - (1 - qber) * math.log2(1 - qber)
             else:
                 h_qber = 0
             
@@ -352,7 +350,7 @@ def run_mock_simulation(scenario: DemoScenario) -> Dict[str, Any]:
             
             # Security margin: 2 * log2(1/epsilon)
             # Use scenario's security_param (e.g., 1e-10 -> ~33 bits)
-            security_bits = int(np.ceil(2 * np.log2(1 / scenario.security_param)))
+            security_bits = math.ceil(2 * math.log2(1 / scenario.security_param))
             
             # Final key length = secrecy_capacity - leakage - security_margin
             available_bits = raw_key_length * secrecy_rate
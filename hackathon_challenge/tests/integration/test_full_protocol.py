@@ -18,6 +18,7 @@ from hackathon_challenge.core.protocol import (
     AliceProgram,
     BobProgram,
     QkdProgram,
+    PairArrays,
     PairInfo,
     create_qkd_programs,
 )
@@ -220,7 +221,7 @@ class TestComponentIntegration:
         bob_final = amplifier.amplify(bob_key, toeplitz_seed, final_length)
         
         # Keys must match
-        assert alice_final == bob_final
+        assert np.array_equal(alice_final, bob_final)
 
     def test_full_post_processing_pipeline(self, matching_raw_keys):
         """Test complete post-processing: verification + privacy amplification."""
@@ -251,7 +252,7 @@ class TestComponentIntegration:
         alice_final = amplifier.amplify(alice_key, toeplitz_seed, final_length)
         bob_final = amplifier.amplify(bob_key, toeplitz_seed, final_length)
         
-        assert alice_final == bob_final
+        assert np.array_equal(alice_final, bob_final)
         assert len(alice_final) == final_length
 
 
@@ -366,7 +367,7 @@ class TestProtocolDeterminism:
         result1 = amplifier.amplify(key, toeplitz_seed, 50)
         result2 = amplifier.amplify(key, toeplitz_seed, 50)
         
-        assert result1 == result2
+        assert np.array_equal(result1, result2)
 
 
 class TestProgramCreation:
@@ -679,8 +680,8 @@ class TestRegressions:
             for i in range(10)
         ]
         
-        raw_key = alice._extract_raw_key(pairs)
-        assert raw_key == []
+        raw_key = alice._extract_raw_key(PairArrays.from_pair_info(pairs))
+        assert raw_key.tolist() == []
 
     def test_all_test_bits_handling(self):
         """Test handling when all bits are used for testing."""
@@ -692,8 +693,8 @@ class TestRegressions:
             for i in range(10)
         ]
         
-        raw_key = alice._extract_raw_key(pairs)
-        assert raw_key == []
+        raw_key = alice._extract_raw_key(PairArrays.from_pair_info(pairs))
+        assert raw_key.tolist() == []
 
     def test_consistent_qber_calculation(self):
         """Test QBER calculation is consistent between methods."""
@@ -13,12 +13,17 @@ from collections import OrderedDict
 from typing import Any, Generator, List
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from hackathon_challenge.auth.exceptions import IntegrityError, SecurityError
 from hackathon_challenge.auth.socket import (
+    CRYPTOGRAPHY_AVAILABLE,
+    MAC_CMAC_AES,
     AuthenticatedSocket,
     _compute_hmac,
+    _deserialize_payload,
+    _fingerprint_payload,
     _serialize_payload,
 )
 from hackathon_challenge.auth.wegman_carter import (
@@ -27,6 +32,12 @@ from hackathon_challenge.auth.wegman_carter import (
     _bits_to_bytes,
     _bytes_to_bits,
     _construct_toeplitz_matrix,
+    _derive_toeplitz_seed,
+    NUMBA_AVAILABLE,
+    _gf2_matvec,
+    _gf2_matvec_numpy,
+    _message_words,
+    _pack_words,
     generate_auth_tag,
     generate_toeplitz_seed_bits,
     verify_auth_tag,
@@ -43,18 +54,18 @@ class TestBitConversion:
 
     def test_bytes_to_bits_single_byte(self):
         """Test conversion of single byte to bits."""
-        result = _bytes_to_bits(b"\x00")
+        result = _bytes_to_bits(b"\x00").tolist()
         assert result == [0, 0, 0, 0, 0, 0, 0, 0]
 
-        result = _bytes_to_bits(b"\xff")
+        result = _bytes_to_bits(b"\xff").tolist()
         assert result == [1, 1, 1, 1, 1, 1, 1, 1]
 
-        result = _bytes_to_bits(b"\xaa")  # 10101010
+        result = _bytes_to_bits(b"\xaa").tolist()  # 10101010
         assert result == [1, 0, 1, 0, 1, 0, 1, 0]
 
     def test_bytes_to_bits_multiple_bytes(self):
         """Test conversion of multiple bytes to bits."""
-        result = _bytes_to_bits(b"\x00\xff")
+        result = _bytes_to_bits(b"\x00\xff").tolist()
         assert result == [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1]
 
     def test_bits_to_bytes_single_byte(self):
@@ -75,6 +86,11 @@ class TestBitConversion:
         recovered = _bits_to_bytes(bits)
         assert recovered == original
 
+    def test_bits_to_bytes_pads_partial_byte(self):
+        """Test that a partial trailing byte is zero-padded on the right."""
+        assert _bits_to_bytes([1, 0, 1]) == b"\xa0"
+        assert _bits_to_bytes(np.array([1] * 9, dtype=np.uint8)) == b"\xff\x80"
+
 
 class TestToeplitzMatrix:
     """Tests for Toeplitz matrix construction."""
@@ -104,6 +120,65 @@ class TestToeplitzMatrix:
             _construct_toeplitz_matrix(seed, rows=3, cols=5)
 
 
+class TestToeplitzSeed:
+    """Tests for counter-mode Toeplitz seed derivation."""
+
+    def test_seed_matches_concatenated_hmac_blocks(self, auth_key):
+        """Test that the seed equals the concatenated counter-mode HMAC blocks."""
+        import hmac
+
+        message_bits, tag_bits = 8 * 1000, 64
+        seed = _derive_toeplitz_seed(auth_key, message_bits, tag_bits)
+
+        needed = (message_bits + tag_bits - 1 + 7) // 8 + 1
+        blocks = b"".join(
+            hmac.new(auth_key, f"toeplitz_seed_{i}".encode(), "sha256").digest()
+            for i in range(needed // 32 + 1)
+        )
+        assert _bits_to_bytes(seed) == blocks[:needed]
+
+
+class TestPackedGF2:
+    """Tests for the bit-packed GF(2) matrix-vector product."""
+
+    def test_matches_dense_product(self):
+        """Test that the packed product equals (T @ m) mod 2."""
+        rng = np.random.default_rng(7)
+        message = rng.integers(0, 256, size=13, dtype=np.uint8).tobytes()
+        seed = rng.integers(0, 2, size=64 + 13 * 8 - 1).tolist()
+        matrix = _construct_toeplitz_matrix(seed, rows=64, cols=13 * 8)
+
+        message_bits = np.unpackbits(np.frombuffer(message, dtype=np.uint8))
+        expected = (matrix.astype(int) @ message_bits) % 2
+
+        result = _gf2_matvec(_pack_words(matrix), _message_words(message))
+        assert result.tolist() == expected.tolist()
+
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+    def test_jit_matches_numpy(self):
+        """Test that the Numba kernel agrees with the NumPy implementation."""
+        from hackathon_challenge.auth.wegman_carter import _gf2_matvec_jit
+
+        rng = np.random.default_rng(11)
+        rows = rng.integers(0, 2**63, size=(64, 5), dtype=np.uint64)
+        message = rng.integers(0, 2**63, size=5, dtype=np.uint64)
+        assert _gf2_matvec_jit(rows, message).tolist() == _gf2_matvec_numpy(rows, message).tolist()
+
+    @pytest.mark.parametrize("use_numba", [False, NUMBA_AVAILABLE])
+    def test_matmat_blocks_match_matvec(self, monkeypatch, use_numba):
+        """Test that the blocked batch product matches per-vector products."""
+        from hackathon_challenge.auth import wegman_carter
+
+        monkeypatch.setattr(wegman_carter, "NUMBA_AVAILABLE", use_numba)
+        monkeypatch.setattr(wegman_carter, "_MATMAT_BLOCK_WORDS", 64 * 5 * 3)
+        rng = np.random.default_rng(12)
+        rows = rng.integers(0, 2**63, size=(64, 5), dtype=np.uint64)
+        messages = rng.integers(0, 2**63, size=(10, 5), dtype=np.uint64)
+        result = wegman_carter._gf2_matmat(rows, messages)
+        for k, message in enumerate(messages):
+            assert result[:, k].tolist() == _gf2_matvec_numpy(rows, message).tolist()
+
+
 class TestWegmanCarterAuth:
     """Tests for Wegman-Carter authentication functions."""
 
@@ -172,6 +247,20 @@ class TestWegmanCarterAuth:
         tag = generate_auth_tag(message, auth_key)
         assert verify_auth_tag(message, tag, auth_key) is True
 
+    def test_memoryview_message(self, auth_key):
+        """Test that a memoryview message gives the same tag as bytes."""
+        message = b"Test message"
+        tag = generate_auth_tag(memoryview(message), auth_key)
+        assert tag == generate_auth_tag(message, auth_key)
+        assert verify_auth_tag(memoryview(message), tag, auth_key) is True
+
+    def test_bytearray_key(self, auth_key):
+        """Test that a bytearray key gives the same tag as the bytes key."""
+        message = b"Test message"
+        tag = generate_auth_tag(message, bytearray(auth_key))
+        assert tag == generate_auth_tag(message, auth_key)
+        assert verify_auth_tag(message, tag, bytearray(auth_key)) is True
+
     def test_custom_tag_bits(self, auth_key):
         """Test with custom tag bit length."""
         message = b"Test message"
@@ -227,6 +316,38 @@ class TestToeplitzAuthenticator:
         authenticator.authenticate(b"Message 2")
         assert authenticator._message_counter == 2
 
+    def test_cached_matrix_matches_stateless_tag(self, auth_key):
+        """Test that tags from the cached matrix equal generate_auth_tag."""
+        authenticator = ToeplitzAuthenticator(auth_key)
+        for message in (b"Message A", b"Message B", b"Longer message", b""):
+            _, tag = authenticator.authenticate(message)
+            assert tag == generate_auth_tag(message, auth_key)
+            assert authenticator.verify(message, tag) is True
+
+        # One matrix per distinct non-empty message length
+        assert sorted(authenticator._toeplitz_cache) == [72, 112]
+
+    def test_toeplitz_cache_is_bounded(self, auth_key, monkeypatch):
+        """Test that the least recently used message length is evicted."""
+        from hackathon_challenge.auth import wegman_carter
+
+        monkeypatch.setattr(wegman_carter, "TOEPLITZ_CACHE_SIZE", 2)
+        authenticator = ToeplitzAuthenticator(auth_key)
+        for message in (b"a", b"bb", b"a", b"ccc"):
+            _, tag = authenticator.authenticate(message)
+            assert tag == generate_auth_tag(message, auth_key)
+
+        assert list(authenticator._toeplitz_cache) == [8, 24]
+
+    def test_batch_authenticate_matches_individual_tags(self, auth_key):
+        """Test that batched tags equal per-message tags, in order."""
+        authenticator = ToeplitzAuthenticator(auth_key)
+        messages = [b"short", b"a longer message", b"", b"other", b"a longer messagf"]
+        tags = authenticator.batch_authenticate(messages)
+
+        assert tags == [generate_auth_tag(m, auth_key) for m in messages]
+        assert authenticator._message_counter == len(messages)
+
 
 class TestGenerateToeplitzSeedBits:
     """Tests for random seed generation."""
@@ -288,6 +409,50 @@ class TestSerialization:
         assert _serialize_payload(True) == b"true"
         assert _serialize_payload(None) == b"null"
 
+    def test_serialize_scalar_fast_path_matches_json(self):
+        """Test that scalar fast paths produce the same bytes as JSON."""
+        import json
+
+        for payload in (0, -7, 10**30, 1e-300, -0.0, float("nan"), "quote\"\\", "héllo\n"):
+            expected = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+            assert _serialize_payload(payload) == expected
+
+
+    def test_serialize_roundtrip(self):
+        """Test that container payloads decode back to equal values."""
+        payload = {"indices": [3, 1, 2], "parity": 1, "big": 2**80, "nested": {"b": None}}
+        assert _deserialize_payload(_serialize_payload(payload)) == payload
+
+
+    def test_serialize_numpy_values_roundtrip(self):
+        """Test that NumPy scalars and arrays decode as numbers and lists."""
+        payload = {
+            "count": np.int64(5),
+            "rate": np.float64(0.25),
+            "flag": np.bool_(True),
+            "bits": np.array([1, 0], dtype=np.uint8),
+        }
+        decoded = _deserialize_payload(_serialize_payload(payload))
+        assert decoded == {"count": 5, "rate": 0.25, "flag": True, "bits": [1, 0]}
+        assert type(decoded["count"]) is int
+        assert _deserialize_payload(_serialize_payload(np.array([[1, 2]]))) == [[1, 2]]
+
+    def test_serialize_nan_in_container_roundtrip(self):
+        """Test that non-finite floats in containers are not decoded as None."""
+        decoded = _deserialize_payload(_serialize_payload([float("nan"), None]))
+        assert np.isnan(decoded[0]) and decoded[1] is None
+
+    @pytest.mark.parametrize("payload", [object(), {"key": {1, 2}}, [b"bytes"]])
+    def test_serialize_rejects_non_json(self, payload):
+        """Test that non-JSON payloads raise instead of being stringified."""
+        with pytest.raises(TypeError):
+            _serialize_payload(payload)
+
+    def test_fingerprint_follows_canonical_form(self):
+        """Test that fingerprints ignore dict ordering and track content."""
+        assert _fingerprint_payload({"b": 1, "a": 2}) == _fingerprint_payload({"a": 2, "b": 1})
+        assert _fingerprint_payload([0, 1, 1]) != _fingerprint_payload([0, 1, 0])
+
 
 class TestComputeHMAC:
     """Tests for HMAC computation."""
@@ -321,6 +486,13 @@ class TestComputeHMAC:
         hmac2 = _compute_hmac(b"key2", data)
         assert hmac1 != hmac2
 
+    def test_hmac_chunks_equal_concatenation(self):
+        """Test that chunked input hashes the same as the joined bytes."""
+        key = b"secret"
+        assert _compute_hmac(key, b"HEADER", b"|", b"payload") == _compute_hmac(
+            key, b"HEADER|payload"
+        )
+
 
 # =============================================================================
 # AuthenticatedSocket Tests
@@ -376,6 +548,63 @@ class TestAuthenticatedSocket:
         with pytest.raises(ValueError, match="cannot be empty"):
             AuthenticatedSocket(mock_socket, b"")
 
+    def test_precomputed_hmac_matches_stateless(self, auth_key):
+        """Test that the cached HMAC state yields the same tags every call."""
+        auth_socket = AuthenticatedSocket(MockClassicalSocket(), auth_key)
+        for data in (b"first", b"second", b"first"):
+            assert auth_socket._compute_tag(b"H", b"|", data) == _compute_hmac(
+                auth_key, b"H|" + data
+            )
+
+    def test_hmac_backends_agree(self, auth_key):
+        """Test that the stdlib fallback produces the same tags."""
+        fast = AuthenticatedSocket(MockClassicalSocket(), auth_key)
+        with patch("hackathon_challenge.auth.socket.CRYPTOGRAPHY_AVAILABLE", False):
+            fallback = AuthenticatedSocket(MockClassicalSocket(), auth_key)
+        chunks = (b"H", b"|", memoryview(b"payload"))
+        assert fast._compute_tag(*chunks) == fallback._compute_tag(*chunks)
+        assert fallback._compute_tag(*chunks) == _compute_hmac(auth_key, b"H|payload")
+
+    def test_unknown_mac_algorithm_raises(self, auth_key):
+        """Test that an unsupported MAC name is rejected."""
+        with pytest.raises(ValueError, match="Unknown MAC algorithm"):
+            AuthenticatedSocket(MockClassicalSocket(), auth_key, mac_algorithm="md5")
+
+    @pytest.mark.skipif(not CRYPTOGRAPHY_AVAILABLE, reason="cryptography not installed")
+    def test_cmac_roundtrip(self, auth_key):
+        """Test that AES-CMAC tagged messages verify with a matching peer."""
+        from netqasm.sdk.classical_communication.message import StructuredMessage
+
+        mock_socket = MockClassicalSocket()
+        sender = AuthenticatedSocket(mock_socket, auth_key, mac_algorithm=MAC_CMAC_AES)
+        receiver = AuthenticatedSocket(mock_socket, auth_key, mac_algorithm=MAC_CMAC_AES)
+
+        sender.send_structured(StructuredMessage("DATA", [1, 0, 1]))
+        envelope = mock_socket._sent_messages[0]
+        assert len(envelope.payload[1]) == 16
+
+        mock_socket.queue_message(envelope)
+        gen = receiver.recv_structured()
+        with pytest.raises(StopIteration) as exc_info:
+            while True:
+                next(gen)
+        assert exc_info.value.value.payload == [1, 0, 1]
+
+    @pytest.mark.skipif(not CRYPTOGRAPHY_AVAILABLE, reason="cryptography not installed")
+    def test_cmac_peer_rejects_hmac_tag(self, auth_key):
+        """Test that peers using different MACs do not interoperate."""
+        from netqasm.sdk.classical_communication.message import StructuredMessage
+
+        mock_socket = MockClassicalSocket()
+        AuthenticatedSocket(mock_socket, auth_key).send_structured(StructuredMessage("DATA", 1))
+        mock_socket.queue_message(mock_socket._sent_messages[0])
+
+        receiver = AuthenticatedSocket(mock_socket, auth_key, mac_algorithm=MAC_CMAC_AES)
+        gen = receiver.recv_structured()
+        with pytest.raises(SecurityError, match="Invalid tag length"):
+            while True:
+                next(gen)
+
     def test_peer_name_property(self, auth_key):
         """Test peer_name property."""
         mock_socket = MockClassicalSocket()
@@ -399,7 +628,7 @@ class TestAuthenticatedSocket:
         assert isinstance(envelope.payload, tuple)
         assert len(envelope.payload) == 2
         payload, tag = envelope.payload
-        assert payload == {"key": "value"}
+        assert payload == _serialize_payload({"key": "value"})
         assert isinstance(tag, bytes)
         assert len(tag) == 32  # HMAC-SHA256
 
@@ -442,7 +671,7 @@ class TestAuthenticatedSocket:
         envelope = mock_socket._sent_messages[0]
         
         # Tamper with the payload
-        tampered_payload = {"value": 999}  # Changed value
+        tampered_payload = _serialize_payload({"value": 999})  # Changed value
         tampered_envelope = StructuredMessage(
             envelope.header,
             (tampered_payload, envelope.payload[1])  # Keep original tag
@@ -500,6 +729,58 @@ class TestAuthenticatedSocket:
                 except StopIteration:
                     break
 
+    def test_memoryview_payload_accepted(self, auth_key):
+        """Test that a serialized payload delivered as a buffer view verifies."""
+        from netqasm.sdk.classical_communication.message import StructuredMessage
+        
+        mock_socket = MockClassicalSocket()
+        auth_socket = AuthenticatedSocket(mock_socket, auth_key)
+        auth_socket.send_structured(StructuredMessage("DATA", {"value": 42}))
+        payload_bytes, tag = mock_socket._sent_messages[0].payload
+        mock_socket.queue_message(StructuredMessage("DATA", (memoryview(payload_bytes), tag)))
+        
+        gen = auth_socket.recv_structured()
+        try:
+            next(gen)
+        except StopIteration as e:
+            assert e.value.payload == {"value": 42}
+
+    def test_wrong_tag_length_rejected(self, auth_key):
+        """Test that a truncated tag is rejected before comparison."""
+        from netqasm.sdk.classical_communication.message import StructuredMessage
+        
+        mock_socket = MockClassicalSocket()
+        auth_socket = AuthenticatedSocket(mock_socket, auth_key)
+        auth_socket.send_structured(StructuredMessage("DATA", {"value": 42}))
+        payload_bytes, tag = mock_socket._sent_messages[0].payload
+        mock_socket.queue_message(StructuredMessage("DATA", (payload_bytes, tag[:16])))
+        
+        gen = auth_socket.recv_structured()
+        with pytest.raises(SecurityError, match="Invalid tag length"):
+            while True:
+                try:
+                    next(gen)
+                except StopIteration:
+                    break
+
+    def test_unserialized_payload_rejected(self, auth_key):
+        """Test that an envelope carrying a raw object payload is rejected."""
+        from netqasm.sdk.classical_communication.message import StructuredMessage
+        
+        mock_socket = MockClassicalSocket()
+        auth_socket = AuthenticatedSocket(mock_socket, auth_key)
+        
+        tag = _compute_hmac(auth_key, b"DATA|", _serialize_payload({"value": 42}))
+        mock_socket.queue_message(StructuredMessage("DATA", ({"value": 42}, tag)))
+        
+        gen = auth_socket.recv_structured()
+        with pytest.raises(SecurityError, match="Invalid payload type"):
+            while True:
+                try:
+                    next(gen)
+                except StopIteration:
+                    break
+
     def test_send_and_recv_int(self, auth_key):
         """Test send_int and recv_int."""
         from netqasm.sdk.classical_communication.message import StructuredMessage
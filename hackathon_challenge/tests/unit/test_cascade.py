@@ -13,6 +13,11 @@ from hackathon_challenge.reconciliation.binary_search import (
 )
 from hackathon_challenge.reconciliation.cascade import CascadeReconciliator
 from hackathon_challenge.reconciliation.history import BacktrackManager, PassHistory
+from hackathon_challenge.reconciliation.simple_cascade import (
+    SimpleCascadeReconciliator,
+    _gather_parity,
+    _gather_parity_numpy,
+)
 from hackathon_challenge.reconciliation.utils import (
     compute_parity,
     permute_indices,
@@ -612,3 +617,66 @@ class TestEdgeCases:
         run_generator_pair(gen_alice, gen_bob)
 
         assert alice.get_key() == bob.get_key()
+
+
+class TestSimpleCascadeReconciliator:
+    """Test suite for SimpleCascadeReconciliator."""
+
+    def test_gather_parity_matches_compute_parity(self):
+        """Test the unchecked parity helpers against compute_parity."""
+        rng = np.random.default_rng(11)
+        key = rng.integers(0, 2, 200, dtype=np.uint8)
+        for size in (1, 2, 37, 200):
+            indices = rng.permutation(200)[:size]
+            expected = compute_parity(key, indices.tolist())
+            assert _gather_parity(key, indices) == expected
+            assert _gather_parity_numpy(key, indices) == expected
+
+    @pytest.mark.parametrize("initial_block_size", [None, 1024])
+    def test_reconcile_random_errors(self, mock_socket_pair, initial_block_size):
+        """Test that both parties agree on corrections and leakage.
+
+        Blocks of 1024 bits exceed the prefix-parity limit, so the second
+        case searches with per-step gathers.
+        """
+        rng = np.random.default_rng(12)
+        key_a = rng.integers(0, 2, 3000, dtype=np.uint8)
+        key_b = key_a.copy()
+        key_b[rng.choice(3000, 20, replace=False)] ^= 1
+
+        alice = SimpleCascadeReconciliator(
+            socket=mock_socket_pair.alice,
+            is_initiator=True,
+            key=key_a,
+            rng_seed=42,
+            initial_block_size=initial_block_size,
+            estimated_qber=0.02,
+        )
+        bob = SimpleCascadeReconciliator(
+            socket=mock_socket_pair.bob,
+            is_initiator=False,
+            key=key_b,
+            rng_seed=42,
+            initial_block_size=initial_block_size,
+            estimated_qber=0.02,
+        )
+
+        leak_alice, leak_bob = run_generator_pair(alice.reconcile(), bob.reconcile())
+
+        assert leak_alice == leak_bob > 0
+        assert alice.get_errors_corrected() == bob.get_errors_corrected() > 0
+        assert np.count_nonzero(alice.get_key_array() != bob.get_key_array()) < 20
+
+    def test_parity_count_mismatch_raises(self, mock_socket):
+        """Test that a wrong number of remote block parities is rejected."""
+        reconciliator = SimpleCascadeReconciliator(
+            socket=mock_socket,
+            is_initiator=False,
+            key=[0, 1] * 8,
+            rng_seed=42,
+            initial_block_size=4,
+        )
+        mock_socket.queue_message("CASCADE_PARITIES", [0])
+        with pytest.raises(RuntimeError, match="block parities"):
+            for _ in reconciliator.reconcile():
+                pass
@@ -12,6 +12,7 @@ import random
 
 import numpy as np
 import pytest
+from scipy import fft as sp_fft
 from scipy import stats
 
 from hackathon_challenge.privacy.entropy import (
@@ -20,26 +21,33 @@ from hackathon_challenge.privacy.entropy import (
     KeyLengthEstimate,
     binary_entropy,
     binary_entropy_derivative,
+    binary_entropy_vec,
     compute_final_key_length,
+    compute_final_key_length_batch,
     compute_final_key_length_detailed,
     compute_security_margin,
     inverse_binary_entropy,
     is_qber_secure,
     secrecy_capacity,
+    secrecy_capacity_tab,
 )
 from hackathon_challenge.privacy.estimation import (
     QBEREstimate,
     compute_confidence_interval,
     compute_optimal_sample_size,
     count_sample_errors,
+    count_sample_errors_packed,
     estimate_qber_detailed,
     estimate_qber_from_cascade,
     estimate_qber_from_sample,
+    estimate_qber_packed,
     estimate_qber_with_correction,
     is_qber_acceptable,
 )
 from hackathon_challenge.privacy.utils import (
     ToeplitzSeed,
+    _load_cupy,
+    _toeplitz_batch_parity,
     bits_to_bytes,
     bytes_to_bits,
     compute_seed_length,
@@ -47,13 +55,25 @@ from hackathon_challenge.privacy.utils import (
     construct_toeplitz_matrix_numpy,
     extract_toeplitz_components,
     generate_toeplitz_seed,
+    generate_toeplitz_seed_array,
     generate_toeplitz_seed_structured,
+    pack_bits_to_uint64,
     toeplitz_multiply,
+    toeplitz_multiply_batch_gpu,
+    toeplitz_multiply_fft,
     validate_toeplitz_seed,
+    validated_seed_array,
 )
 from hackathon_challenge.privacy.amplifier import (
+    GPU_ENV_VAR,
+    NUMBA_AVAILABLE,
     AmplificationResult,
     PrivacyAmplifier,
+    _amplify_packed,
+    _amplify_packed_numpy,
+    _gpu_is_enabled,
+    _pack_u64,
+    _toeplitz_diagonals,
     apply_privacy_amplification,
 )
 
@@ -144,6 +164,37 @@ class TestBinaryEntropy:
         # Should approach 0 as p → 1
         assert binary_entropy(1 - 1e-10) == pytest.approx(0.0, abs=1e-8)
 
+    def test_repeated_qber_is_memoized(self):
+        """Test that repeated probabilities hit the entropy cache."""
+        from hackathon_challenge.privacy.entropy import _binary_entropy_cached
+
+        _binary_entropy_cached.cache_clear()
+        first = binary_entropy(0.0375)
+        assert binary_entropy(0.0375) == first
+        assert _binary_entropy_cached.cache_info().hits == 1
+
+    def test_vectorized_matches_scalar(self):
+        """Test that binary_entropy_vec agrees with the scalar function."""
+        values = np.array([0.0, 1e-12, 0.01, 0.1, 0.11, 0.5, 0.9, 1.0])
+        expected = [binary_entropy(float(p)) for p in values]
+        result = binary_entropy_vec(values)
+        assert result.shape == values.shape
+        np.testing.assert_allclose(result, expected, atol=1e-12)
+
+    def test_vectorized_xlogy_fallback(self, monkeypatch):
+        """Test that the scipy xlogy path agrees with the scalar function."""
+        from hackathon_challenge.privacy import entropy
+
+        monkeypatch.setattr(entropy, "NUMBA_AVAILABLE", False)
+        values = np.array([0.0, 0.01, 0.11, 0.5, 1.0])
+        expected = [binary_entropy(float(p)) for p in values]
+        np.testing.assert_allclose(binary_entropy_vec(values), expected, atol=1e-12)
+
+    def test_vectorized_invalid_values(self):
+        """Test that binary_entropy_vec rejects out-of-range probabilities."""
+        with pytest.raises(ValueError, match="must be in"):
+            binary_entropy_vec(np.array([0.1, 1.2]))
+
 
 class TestBinaryEntropyDerivative:
     """Test suite for binary entropy derivative."""
@@ -197,6 +248,15 @@ class TestInverseBinaryEntropy:
             recovered = inverse_binary_entropy(h, "upper")
             assert recovered == pytest.approx(p, abs=1e-8)
 
+    def test_inverse_roundtrip_extreme_values(self):
+        """Test roundtrip for entropies near 0 and near 1 on both branches."""
+        for h in [1e-12, 1e-6, 0.49, 0.51, 0.999, 1 - 1e-9]:
+            lower = inverse_binary_entropy(h, "lower")
+            upper = inverse_binary_entropy(h, "upper")
+            assert lower <= 0.5 <= upper
+            assert binary_entropy(lower) == pytest.approx(h, abs=1e-10)
+            assert binary_entropy(upper) == pytest.approx(h, abs=1e-10)
+
     def test_inverse_invalid_entropy(self):
         """Test that invalid entropy values raise error."""
         with pytest.raises(ValueError):
@@ -209,6 +269,20 @@ class TestInverseBinaryEntropy:
         with pytest.raises(ValueError):
             inverse_binary_entropy(0.5, "middle")
 
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+    def test_jit_newton_matches_python(self):
+        """Test that the Numba Newton solver agrees with the Python one."""
+        from hackathon_challenge.privacy.entropy import (
+            _inverse_entropy_newton,
+            _inverse_entropy_newton_jit,
+        )
+
+        for h_val in [0.01, 0.3, 0.5, 0.99]:
+            for p0 in [0.1, 0.9]:
+                assert _inverse_entropy_newton_jit(h_val, p0, 1e-12, 100) == pytest.approx(
+                    _inverse_entropy_newton(h_val, p0, 1e-12, 100), abs=1e-12
+                )
+
 
 class TestSecrecyCapacity:
     """Test suite for secrecy capacity function."""
@@ -246,6 +320,27 @@ class TestSecrecyCapacity:
             assert capacities[i] > capacities[i + 1]
 
 
+class TestSecrecyCapacityTab:
+    """Test suite for the table-interpolated secrecy capacity."""
+
+    def test_close_to_exact_and_never_below(self):
+        """Test accuracy and that the interpolant does not underestimate."""
+        qbers = np.linspace(0.0, 0.5, 5001)
+        exact = np.array([secrecy_capacity(float(q)) for q in qbers])
+        approx = secrecy_capacity_tab(qbers)
+        assert np.all(approx >= exact - 1e-12)
+        assert np.max(np.abs(approx - exact)[qbers >= 0.01]) < 1e-6
+
+    def test_zero_above_half(self):
+        """Test that QBER at or above 0.5 has zero capacity."""
+        assert secrecy_capacity_tab(np.array([0.5, 0.7])).tolist() == [0.0, 0.0]
+
+    def test_negative_qber(self):
+        """Test that negative QBER raises error."""
+        with pytest.raises(ValueError):
+            secrecy_capacity_tab(np.array([-0.01]))
+
+
 class TestIsQberSecure:
     """Test suite for QBER security check."""
 
@@ -386,9 +481,50 @@ class TestKeyLengthCalculation:
         assert half < full
 
 
+class TestKeyLengthBatch:
+    """Test suite for the vectorized key length calculation."""
+
+    def test_matches_scalar_function(self):
+        """Test that the batch lengths equal the scalar computation."""
+        qbers = np.array([0.0, 0.01, 0.03, 0.05, 0.08, 0.1, 0.109, 0.11, 0.2, 0.5])
+        lengths, secure = compute_final_key_length_batch(10000, qbers, 500, 64)
+        expected = [compute_final_key_length(10000, float(q), 500, 64) for q in qbers]
+        assert lengths.tolist() == expected
+        assert secure.tolist() == [length > 0 for length in expected]
+
+    def test_leakage_broadcasts(self):
+        """Test that per-point leakages broadcast against the QBER grid."""
+        qbers = np.full(3, 0.05)
+        leakage_ec = np.array([0, 500, 100000])
+        lengths, secure = compute_final_key_length_batch(10000, qbers, leakage_ec, 64)
+        expected = [compute_final_key_length(10000, 0.05, int(ec), 64) for ec in leakage_ec]
+        assert lengths.tolist() == expected
+        assert secure.tolist() == [True, True, False]
+
+    def test_invalid_qber(self):
+        """Test that out-of-range QBER values raise error."""
+        with pytest.raises(ValueError, match="QBER"):
+            compute_final_key_length_batch(1000, np.array([0.05, 0.6]), 0, 0)
+
+
 class TestKeyLengthDetailed:
     """Test suite for detailed key length calculation."""
 
+    def test_estimate_is_frozen_and_hashable(self):
+        """Test that estimates cannot be mutated and can be hashed."""
+        result = compute_final_key_length_detailed(10000, 0.05, 700, 64)
+        with pytest.raises(AttributeError):
+            result.final_length = 0
+        assert hash(result) == hash(compute_final_key_length_detailed(10000, 0.05, 700, 64))
+
+    def test_matches_simple_function(self):
+        """Test that the detailed length equals compute_final_key_length."""
+        for qber in [0.0, 0.02, 0.05, 0.1, 0.12]:
+            for efficiency in [0.8, 1.0]:
+                args = (10000, qber, 700, 64, 1e-10, efficiency)
+                detailed = compute_final_key_length_detailed(*args)
+                assert detailed.final_length == compute_final_key_length(*args)
+
     def test_detailed_result_structure(self):
         """Test that detailed result has all fields."""
         result = compute_final_key_length_detailed(
@@ -477,6 +613,88 @@ class TestCountSampleErrors:
         """Test counting with some errors."""
         assert count_sample_errors([0, 1, 0, 1], [0, 0, 1, 1]) == 2
 
+    def test_array_inputs(self):
+        """Test counting on uint8 arrays."""
+        alice = np.array([0, 1, 1, 0, 1], dtype=np.uint8)
+        bob = np.array([1, 1, 0, 0, 1], dtype=np.uint8)
+        assert count_sample_errors(alice, bob) == 2
+
+    def test_list_paths_agree(self):
+        """Test that short lists, long lists and arrays count alike."""
+        rng = np.random.default_rng(5)
+        for length in (10, 128, 129, 1000):
+            alice = rng.integers(0, 2, length, dtype=np.uint8)
+            bob = rng.integers(0, 2, length, dtype=np.uint8)
+            assert count_sample_errors(alice.tolist(), bob.tolist()) == count_sample_errors(
+                alice, bob
+            )
+
+    def test_non_byte_list_values(self):
+        """Test that long lists of floats fall back to element-wise compare."""
+        alice = [0.0, 1.0] * 100
+        bob = [1.0, 1.0] * 100
+        assert count_sample_errors(alice, bob) == 100
+
+    def test_packed_matches_unpacked(self):
+        """Test that the packed variant agrees with the unpacked count."""
+        rng = np.random.default_rng(4)
+        for length in (1, 7, 64, 100, 1001):
+            alice = rng.integers(0, 2, length, dtype=np.uint8)
+            bob = rng.integers(0, 2, length, dtype=np.uint8)
+            assert count_sample_errors_packed(
+                np.packbits(alice), np.packbits(bob)
+            ) == count_sample_errors(alice, bob)
+
+    def test_packed_length_mismatch(self):
+        """Test that packed samples of different lengths raise error."""
+        with pytest.raises(ValueError):
+            count_sample_errors_packed(np.zeros(2, dtype=np.uint8), np.zeros(3, dtype=np.uint8))
+
+
+class TestQBERPacked:
+    """Test suite for QBER estimation on packed 64-bit words."""
+
+    def test_matches_unpacked_estimate(self):
+        """Test that the packed estimate equals the sifted unpacked one."""
+        rng = np.random.default_rng(5)
+        alice = rng.integers(0, 2, 1000, dtype=np.uint8)
+        bob = alice ^ (rng.random(1000) < 0.07).astype(np.uint8)
+        sift = rng.integers(0, 2, 1000, dtype=np.uint8).astype(bool)
+
+        def pack(bits):
+            return _pack_u64(np.asarray(bits, dtype=np.uint8), 16)
+
+        expected = estimate_qber_from_sample(alice[sift].tolist(), bob[sift].tolist())
+        assert estimate_qber_packed(pack(alice), pack(bob), pack(sift)) == pytest.approx(expected)
+
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+    def test_jit_kernel_matches_numpy(self):
+        """Test that the fused Numba popcounts equal the NumPy ones."""
+        from hackathon_challenge.privacy.estimation import _masked_popcounts_jit, _popcount
+
+        rng = np.random.default_rng(6)
+        alice, bob, mask = (rng.integers(0, 2**63, 257, dtype=np.uint64) for _ in range(3))
+        mask[0] = np.uint64(2**64 - 1)
+        assert _masked_popcounts_jit(alice, bob, mask) == (
+            _popcount((alice ^ bob) & mask),
+            _popcount(mask),
+        )
+
+    def test_empty_mask(self):
+        """Test that a mask selecting no bits raises error."""
+        words = np.zeros(2, dtype=np.uint64)
+        with pytest.raises(ValueError, match="empty"):
+            estimate_qber_packed(words, words, words)
+
+    def test_length_mismatch(self):
+        """Test that arrays of different word counts raise error."""
+        with pytest.raises(ValueError):
+            estimate_qber_packed(
+                np.zeros(2, dtype=np.uint64),
+                np.zeros(3, dtype=np.uint64),
+                np.ones(2, dtype=np.uint64),
+            )
+
 
 class TestQBERFromCascade:
     """Test suite for combined QBER estimation."""
@@ -519,6 +737,28 @@ class TestConfidenceInterval:
         point = 50 / 1000
         assert lower <= point <= upper
 
+    def test_repeated_interval_is_memoized(self):
+        """Test that identical requests reuse the cached interval."""
+        from hackathon_challenge.privacy.estimation import _cached_confidence_interval
+
+        _cached_confidence_interval.cache_clear()
+        first = compute_confidence_interval(37, 1200, 0.95)
+        assert compute_confidence_interval(37, 1200, 0.95) == first
+        assert _cached_confidence_interval.cache_info().hits == 1
+
+    def test_wilson_matches_scipy(self):
+        """Test the Wilson interval against scipy's implementation."""
+        for errors, size, level in [(0, 1000, 0.95), (50, 1000, 0.95), (110, 2000, 0.99), (7, 40, 0.9)]:
+            expected = stats.binomtest(errors, size).proportion_ci(level, method="wilson")
+            lower, upper = compute_confidence_interval(errors, size, level, method="wilson")
+            assert lower == pytest.approx(expected.low, abs=1e-12)
+            assert upper == pytest.approx(expected.high, abs=1e-12)
+
+    def test_invalid_method(self):
+        """Test that unknown interval methods raise error."""
+        with pytest.raises(ValueError, match="Method"):
+            compute_confidence_interval(50, 1000, method="wald")
+
     def test_interval_width_increases_with_confidence(self):
         """Test that higher confidence gives wider interval."""
         ci_95 = compute_confidence_interval(50, 1000, 0.95)
@@ -675,6 +915,13 @@ class TestGenerateToeplitzSeed:
         seed2 = generate_toeplitz_seed(100, 50, rng_seed=43)
         assert seed1 != seed2
 
+    def test_array_variant(self):
+        """Test that the array variant matches the list variant."""
+        seed = generate_toeplitz_seed_array(100, 50, rng_seed=42)
+        assert seed.dtype == np.uint8
+        assert seed.shape == (149,)
+        assert seed.tolist() == generate_toeplitz_seed(100, 50, rng_seed=42)
+
 
 class TestToeplitzSeedStructured:
     """Test suite for structured Toeplitz seed."""
@@ -698,6 +945,14 @@ class TestToeplitzSeedStructured:
         seed = generate_toeplitz_seed_structured(100, 50, rng_seed=42)
         assert len(seed.first_row) == 100  # Input length
 
+    def test_array_bits(self):
+        """Test that the first row and column slice array bits alike."""
+        bits = generate_toeplitz_seed_array(100, 50, rng_seed=42)
+        array_seed = ToeplitzSeed(bits=bits, input_length=100, output_length=50)
+        list_seed = ToeplitzSeed(bits=bits.tolist(), input_length=100, output_length=50)
+        assert array_seed.first_column.tolist() == list_seed.first_column
+        assert array_seed.first_row.tolist() == list_seed.first_row
+
 
 class TestValidateToeplitzSeed:
     """Test suite for Toeplitz seed validation."""
@@ -717,6 +972,26 @@ class TestValidateToeplitzSeed:
         seed = [0, 1, 2] + [0] * 146
         assert validate_toeplitz_seed(seed, 100, 50) is False
 
+    def test_validated_seed_array(self):
+        """Test that a valid seed comes back as a uint8 array."""
+        seed = generate_toeplitz_seed(100, 50)
+        seed_arr = validated_seed_array(seed, 100, 50)
+        assert seed_arr.dtype == np.uint8
+        assert seed_arr.tolist() == seed
+
+        packed = np.asarray(seed, dtype=np.uint8)
+        assert validated_seed_array(packed, 100, 50) is packed
+        assert validated_seed_array([0, 1, 2] + [0] * 146, 100, 50) is None
+
+    def test_validated_seed_array_input_types(self):
+        """Test the 0/1 check across list and array input types."""
+        assert validated_seed_array([0.0, 1.0, 1.0], 2, 2).tolist() == [0, 1, 1]
+        assert validated_seed_array([-1, 0, 1], 2, 2) is None
+        assert validated_seed_array([0, 1, 300], 2, 2) is None
+        assert validated_seed_array(np.array([1, 0, 1], dtype=bool), 2, 2).tolist() == [1, 0, 1]
+        assert validated_seed_array(np.array([0, 1, 2], dtype=np.uint16), 2, 2) is None
+        assert validated_seed_array(np.array([0, -1, 1], dtype=np.int64), 2, 2) is None
+
 
 class TestConstructToeplitzMatrix:
     """Test suite for Toeplitz matrix construction."""
@@ -747,6 +1022,26 @@ class TestConstructToeplitzMatrix:
         with pytest.raises(ValueError):
             construct_toeplitz_matrix(seed, 5, 10)
 
+    def test_matches_indexed_construction(self):
+        """Test that the strided view equals the explicitly indexed matrix."""
+        for num_rows, num_cols in [(1, 1), (1, 8), (8, 8), (5, 10), (37, 64)]:
+            seed = generate_toeplitz_seed(num_cols, num_rows, rng_seed=7)
+            # First column is seed[:num_rows], first row is seed[num_rows-1:]
+            expected = [
+                [seed[i - j] if i >= j else seed[num_rows - 1 + j - i] for j in range(num_cols)]
+                for i in range(num_rows)
+            ]
+            np.testing.assert_array_equal(
+                construct_toeplitz_matrix(seed, num_rows, num_cols), expected
+            )
+
+    def test_matrix_is_read_only_view(self):
+        """Test that the matrix is a read-only view, not a dense copy."""
+        seed = generate_toeplitz_seed(10, 5, rng_seed=42)
+        matrix = construct_toeplitz_matrix(seed, 5, 10)
+        assert not matrix.flags.writeable
+        assert matrix.base is not None
+
 
 class TestConstructToeplitzMatrixNumpy:
     """Test suite for pure NumPy Toeplitz construction."""
@@ -773,6 +1068,19 @@ class TestConstructToeplitzMatrixNumpy:
             if len(diagonal) > 1:
                 assert all(diagonal == diagonal[0]), f"Diagonal {d} not constant"
 
+    def test_strided_view_layout(self):
+        """Test that the view maps T[i, j] to seed[i - j + num_cols - 1]."""
+        rng = np.random.default_rng(3)
+        for num_rows, num_cols in ((1, 1), (5, 10), (8, 8), (12, 3)):
+            seed = rng.integers(0, 2, num_rows + num_cols - 1, dtype=np.uint8)
+            expected = np.array(
+                [[seed[i - j + num_cols - 1] for j in range(num_cols)] for i in range(num_rows)],
+                dtype=np.uint8,
+            )
+            matrix = construct_toeplitz_matrix_numpy(seed, num_rows, num_cols)
+            np.testing.assert_array_equal(matrix, expected)
+            assert not matrix.flags.writeable
+
 
 class TestToeplitzMultiply:
     """Test suite for Toeplitz matrix multiplication."""
@@ -785,6 +1093,22 @@ class TestToeplitzMultiply:
         # [1*1 + 1*1, 1*1 + 0*1] = [2, 1] mod 2 = [0, 1]
         np.testing.assert_array_equal(result, [0, 1])
 
+    def test_small_bool_inputs_sum_mod_2(self):
+        """Test that small bool inputs are summed, not OR-ed."""
+        matrix = np.array([[1, 1], [1, 0]], dtype=bool)
+        vector = np.array([1, 1], dtype=bool)
+        result = toeplitz_multiply(matrix, vector)
+        assert result.dtype == np.uint8
+        np.testing.assert_array_equal(result, [0, 1])
+
+    def test_float_inputs_mod_2(self):
+        """Test that float inputs are reduced with % 2 and stay float."""
+        matrix = np.array([[1.0, 0.0], [1.0, 1.0]])
+        vector = np.array([1.0, 1.0])
+        result = toeplitz_multiply(matrix, vector)
+        assert result.dtype == np.float64
+        np.testing.assert_array_equal(result, [1.0, 0.0])
+
     def test_result_binary(self):
         """Test that result contains only 0s and 1s."""
         seed = generate_toeplitz_seed(10, 5, rng_seed=42)
@@ -793,6 +1117,84 @@ class TestToeplitzMultiply:
         result = toeplitz_multiply(matrix, vector)
         assert all(r in (0, 1) for r in result)
 
+    def test_packed_path_matches_dense(self):
+        """Test that the packed GF(2) product matches int64 matmul."""
+        rng = np.random.default_rng(8)
+        num_rows, num_cols = 300, 700  # above the packing threshold
+        seed = rng.integers(0, 2, num_rows + num_cols - 1, dtype=np.uint8)
+        matrix = construct_toeplitz_matrix(seed, num_rows, num_cols)
+        vector = rng.integers(0, 2, num_cols, dtype=np.uint8)
+        expected = (matrix.astype(np.int64) @ vector) % 2
+        result = toeplitz_multiply(matrix, vector)
+        assert result.dtype == np.uint8
+        np.testing.assert_array_equal(result, expected)
+        np.testing.assert_array_equal(
+            toeplitz_multiply(matrix.astype(bool), vector.astype(bool)), expected
+        )
+
+    @pytest.mark.parametrize("num_rows,num_cols", [(7, 30), (3000, 5000), (1, 4096)])
+    def test_fft_matches_dense(self, num_rows, num_cols):
+        """Test that the FFT product matches the dense product."""
+        rng = np.random.default_rng(num_rows)
+        seed = rng.integers(0, 2, num_rows + num_cols - 1, dtype=np.uint8)
+        vector = rng.integers(0, 2, num_cols, dtype=np.uint8)
+        expected = toeplitz_multiply(construct_toeplitz_matrix(seed, num_rows, num_cols), vector)
+        result = toeplitz_multiply_fft(seed, num_rows, num_cols, vector)
+        assert result.dtype == np.uint8
+        np.testing.assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize("shared_seed", [True, False])
+    def test_batch_matches_single(self, shared_seed):
+        """Test the batched core, on NumPy, against per-vector FFT products."""
+        rng = np.random.default_rng(9)
+        num_rows, num_cols, batch = 40, 5000, 3
+        seeds = rng.integers(0, 2, (batch, num_rows + num_cols - 1), dtype=np.uint8)
+        if shared_seed:
+            seeds = seeds[0]
+        vectors = rng.integers(0, 2, (batch, num_cols), dtype=np.uint8)
+        result = _toeplitz_batch_parity(np, sp_fft, seeds, vectors, num_rows, num_cols)
+        assert result.shape == (batch, num_rows) and result.dtype == np.uint8
+        for i in range(batch):
+            seed = seeds if shared_seed else seeds[i]
+            np.testing.assert_array_equal(
+                result[i], toeplitz_multiply_fft(seed, num_rows, num_cols, vectors[i])
+            )
+
+    def test_batch_shape_mismatch(self):
+        """Test that the batch rejects mismatched seeds and vectors."""
+        vectors = np.zeros((3, 10), dtype=np.uint8)
+        with pytest.raises(ValueError):
+            _toeplitz_batch_parity(np, sp_fft, np.zeros(13, dtype=np.uint8), vectors, 5, 10)
+        with pytest.raises(ValueError):
+            _toeplitz_batch_parity(np, sp_fft, np.zeros((2, 14), dtype=np.uint8), vectors, 5, 10)
+
+    @pytest.mark.skipif(_load_cupy() is None, reason="cupy not installed")
+    def test_batch_gpu_matches_cpu(self):
+        """Test that the CuPy batch matches the CPU batch."""
+        rng = np.random.default_rng(10)
+        seeds = rng.integers(0, 2, (4, 1099), dtype=np.uint8)
+        vectors = rng.integers(0, 2, (4, 1000), dtype=np.uint8)
+        np.testing.assert_array_equal(
+            toeplitz_multiply_batch_gpu(seeds, vectors, 100, 1000),
+            _toeplitz_batch_parity(np, sp_fft, seeds, vectors, 100, 1000),
+        )
+
+    def test_fft_length_mismatch(self):
+        """Test that mismatched seed or vector lengths raise errors."""
+        with pytest.raises(ValueError):
+            toeplitz_multiply_fft([0] * 10, 5, 10, np.zeros(10, dtype=np.uint8))
+        with pytest.raises(ValueError):
+            toeplitz_multiply_fft([0] * 14, 5, 10, np.zeros(9, dtype=np.uint8))
+
+    def test_pack_bits_to_uint64(self):
+        """Test word layout and zero padding of packed bit rows."""
+        bits = np.zeros((2, 70), dtype=np.uint8)
+        bits[0, 0] = bits[0, 65] = bits[1, 63] = 1
+        words = pack_bits_to_uint64(bits)
+        assert words.shape == (2, 2) and words.dtype == np.uint64
+        assert words[0].tolist() == [1, 2]
+        assert words[1].tolist() == [1 << 63, 0]
+
 
 class TestExtractToeplitzComponents:
     """Test suite for component extraction."""
@@ -838,6 +1240,15 @@ class TestBitsBytes:
         bits = [1, 0, 1]  # 3 bits
         result = bits_to_bytes(bits)
         assert len(result) == 1
+        assert result == b"\xa0"
+
+    def test_long_roundtrip(self):
+        """Test a long, unaligned roundtrip and array input."""
+        original = np.random.default_rng(6).integers(0, 2, 1001, dtype=np.uint8)
+        converted = bits_to_bytes(original)
+        assert converted == bits_to_bytes(original.tolist())
+        assert bytes_to_bits(converted, 1001) == original.tolist()
+        assert len(bytes_to_bits(converted)) == 8 * len(converted)
 
 
 # =============================================================================
@@ -876,6 +1287,15 @@ class TestPrivacyAmplifier:
         assert length > 0
         assert length < 10000
 
+    def test_compute_output_length_matches_uncached(self):
+        """Test that memoized lengths match compute_final_key_length."""
+        for epsilon in (1e-12, 1e-6):
+            amplifier = PrivacyAmplifier(epsilon_sec=epsilon)
+            for qber in (0.01, 0.0500001, 0.05):
+                expected = compute_final_key_length(10000, qber, 500, 64, epsilon_sec=epsilon)
+                assert amplifier.compute_output_length(10000, qber, 500, 64) == expected
+                assert amplifier.compute_output_length(10000, qber, 500, 64) == expected
+
     def test_generate_seed(self, deterministic_amplifier):
         """Test seed generation."""
         seed = deterministic_amplifier.generate_seed(100, 50)
@@ -903,7 +1323,7 @@ class TestAmplify:
         seed = generate_toeplitz_seed(len(small_key), 8, rng_seed=42)
         result1 = deterministic_amplifier.amplify(small_key, seed, 8)
         result2 = deterministic_amplifier.amplify(small_key, seed, 8)
-        assert result1 == result2
+        assert np.array_equal(result1, result2)
 
     def test_different_keys_different_output(self, deterministic_amplifier):
         """Test that different keys produce different outputs."""
@@ -912,7 +1332,126 @@ class TestAmplify:
         seed = generate_toeplitz_seed(16, 8, rng_seed=42)
         result1 = deterministic_amplifier.amplify(key1, seed, 8)
         result2 = deterministic_amplifier.amplify(key2, seed, 8)
-        assert result1 != result2
+        assert not np.array_equal(result1, result2)
+
+    @pytest.mark.parametrize(
+        "key_length,new_length", [(1, 1), (17, 5), (300, 299), (2048, 700), (20000, 16)]
+    )
+    def test_matches_dense_product(self, deterministic_amplifier, key_length, new_length):
+        """Test that amplify equals the dense Toeplitz product mod 2."""
+        rng = np.random.default_rng(key_length)
+        key = rng.integers(0, 2, key_length).tolist()
+        seed = generate_toeplitz_seed(key_length, new_length, rng_seed=key_length)
+        matrix = construct_toeplitz_matrix(seed, new_length, key_length)
+        expected = (matrix.astype(np.int64) @ np.array(key)) % 2
+
+        assert deterministic_amplifier.amplify(key, seed, new_length).tolist() == expected.tolist()
+
+    @pytest.mark.parametrize(
+        "key_length,new_length", [(1, 1), (5, 3), (64, 64), (65, 2), (200, 130), (5000, 8)]
+    )
+    def test_packed_kernel_matches_dense_product(self, key_length, new_length):
+        """Test the bit-packed GF(2) kernel against the dense product."""
+        rng = np.random.default_rng(key_length)
+        key = rng.integers(0, 2, key_length, dtype=np.uint8)
+        seed = rng.integers(0, 2, key_length + new_length - 1, dtype=np.uint8)
+        matrix = construct_toeplitz_matrix(seed.tolist(), new_length, key_length)
+        expected = (matrix.astype(np.int64) @ key) % 2
+
+        assert _amplify_packed(key, seed, new_length).tolist() == expected.tolist()
+
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+    def test_jit_kernel_matches_numpy(self):
+        """Test that the Numba kernel agrees with the NumPy implementation."""
+        from hackathon_challenge.privacy.amplifier import _amplify_packed_jit
+
+        rng = np.random.default_rng(3)
+        key = rng.integers(0, 2, 1000, dtype=np.uint8)
+        seed = rng.integers(0, 2, 1000 + 300 - 1, dtype=np.uint8)
+        key_words = _pack_u64(key, 16)
+        diag = _toeplitz_diagonals(seed, 300)
+        diag_words = _pack_u64(diag, -(-len(diag) // 64) + 1)
+
+        assert np.array_equal(
+            _amplify_packed_jit(key_words, diag_words, 300),
+            _amplify_packed_numpy(key_words, diag, 300),
+        )
+
+    def test_fft_path_matches_packed_kernel(self, deterministic_amplifier):
+        """Test that a long output (FFT path) agrees with the packed kernel."""
+        rng = np.random.default_rng(8)
+        key = rng.integers(0, 2, 8000, dtype=np.uint8)
+        seed = rng.integers(0, 2, 8000 + 7000 - 1, dtype=np.uint8)
+
+        assert np.array_equal(
+            deterministic_amplifier.amplify(key, seed, 7000), _amplify_packed(key, seed, 7000)
+        )
+
+    def test_broken_cupy_import_disables_gpu(self, monkeypatch):
+        """Test that any error raised while importing CuPy is caught."""
+        import builtins
+
+        real_import = builtins.__import__
+
+        def failing_import(name, *args, **kwargs):
+            if name == "cupy":
+                raise RuntimeError("CUDA driver not found")
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", failing_import)
+        monkeypatch.setenv(GPU_ENV_VAR, "1")
+        _load_cupy.cache_clear()
+        try:
+            assert _load_cupy() is None
+            assert not _gpu_is_enabled(100_000, 50_000)
+        finally:
+            _load_cupy.cache_clear()
+
+    def test_gpu_path_requires_opt_in(self, monkeypatch):
+        """Test that the GPU path needs QKD_USE_GPU=1 and a large matrix."""
+        monkeypatch.delenv(GPU_ENV_VAR, raising=False)
+        assert not _gpu_is_enabled(100_000, 50_000)
+
+        monkeypatch.setenv(GPU_ENV_VAR, "1")
+        assert _gpu_is_enabled(100_000, 50_000) == (_load_cupy() is not None)
+        assert not _gpu_is_enabled(1000, 500)
+
+    @pytest.mark.skipif(_load_cupy() is None, reason="cupy not installed")
+    def test_gpu_kernel_matches_packed_kernel(self):
+        """Test that the CuPy product agrees with the packed kernel."""
+        from hackathon_challenge.privacy.amplifier import _amplify_gpu
+
+        rng = np.random.default_rng(10)
+        key = rng.integers(0, 2, 3000, dtype=np.uint8)
+        seed = rng.integers(0, 2, 3000 + 2000 - 1, dtype=np.uint8)
+
+        assert np.array_equal(
+            _amplify_gpu(key, seed, 2000), _amplify_packed(key, seed, 2000)
+        )
+
+    def test_fft_seed_spectrum_cache(self, deterministic_amplifier):
+        """Test that a cached seed spectrum is reused only for the same seed."""
+        rng = np.random.default_rng(9)
+        key = rng.integers(0, 2, 600, dtype=np.uint8)
+        other_key = rng.integers(0, 2, 600, dtype=np.uint8)
+        seed = rng.integers(0, 2, 600 + 400 - 1, dtype=np.uint8)
+        other_seed = 1 - seed
+
+        def dense(k, s):
+            matrix = construct_toeplitz_matrix(s.tolist(), 400, 600).astype(np.int64)
+            return (matrix @ k).tolist()
+
+        product = deterministic_amplifier._fft_product(key, seed, 400)
+        cached = deterministic_amplifier._seed_fft_cache[1]
+        assert np.rint(product).astype(np.int64).tolist() == dense(key, seed)
+
+        product = deterministic_amplifier._fft_product(other_key, seed, 400)
+        assert deterministic_amplifier._seed_fft_cache[1] is cached
+        assert np.rint(product).astype(np.int64).tolist() == dense(other_key, seed)
+
+        product = deterministic_amplifier._fft_product(key, other_seed, 400)
+        assert deterministic_amplifier._seed_fft_cache[1] is not cached
+        assert np.rint(product).astype(np.int64).tolist() == dense(key, other_seed)
 
     def test_empty_key_error(self, deterministic_amplifier):
         """Test that empty key raises error."""
@@ -952,6 +1491,19 @@ class TestAmplifyWithResult:
         assert result.input_length == len(sample_key)
         assert 0 < result.compression_ratio < 1
 
+    def test_secret_key_is_uint8_array(self, sample_key, deterministic_amplifier):
+        """Test that the key is stored as uint8 with a list view on demand."""
+        result = deterministic_amplifier.amplify_with_result(
+            key=sample_key,
+            qber=0.05,
+            leakage_ec=50,
+            leakage_ver=64,
+        )
+        assert isinstance(result.secret_key, np.ndarray)
+        assert result.secret_key.dtype == np.uint8
+        assert result.secret_key_list == result.secret_key.tolist()
+        assert all(type(bit) is int for bit in result.secret_key_list)
+
     def test_failure_high_qber(self, sample_key, deterministic_amplifier):
         """Test failure due to high QBER."""
         result = deterministic_amplifier.amplify_with_result(
@@ -1083,7 +1635,7 @@ class TestPrivacyAmplificationIntegration:
         result1 = amp1.amplify_with_result(key, 0.05, 50, 64)
         result2 = amp2.amplify_with_result(key, 0.05, 50, 64)
 
-        assert result1.secret_key == result2.secret_key
+        np.testing.assert_array_equal(result1.secret_key, result2.secret_key)
 
     def test_key_compression_ratio_bounds(self):
         """Test that compression ratio is reasonable."""
@@ -15,10 +15,16 @@ from unittest.mock import Mock, MagicMock, patch
 import numpy as np
 
 from hackathon_challenge.core.protocol import (
+    NUMBA_AVAILABLE,
     AliceProgram,
     BobProgram,
     QkdProgram,
+    PairArrays,
     PairInfo,
+    _pack_bits,
+    _score_test_bits,
+    _score_test_bits_numpy,
+    _unpack_bits,
     create_qkd_programs,
 )
 from hackathon_challenge.core.constants import (
@@ -120,6 +126,96 @@ def tested_pair_info():
 # =============================================================================
 
 
+class TestPairArrays:
+    """Tests for the PairArrays structure-of-arrays container."""
+
+    def test_round_trip_pair_info(self, tested_pair_info):
+        """Conversion to arrays and back preserves every field."""
+        arrays = PairArrays.from_pair_info(tested_pair_info)
+        restored = arrays.to_pair_info()
+
+        assert len(arrays) == len(tested_pair_info)
+        for original, pair in zip(tested_pair_info, restored):
+            assert pair.index == original.index
+            assert pair.basis == original.basis
+            assert pair.outcome == original.outcome
+            assert pair.same_basis == original.same_basis
+            assert pair.test_outcome == original.test_outcome
+            assert pair.same_outcome == bool(original.same_outcome)
+
+    def test_from_measurements_clears_flags(self):
+        """Fresh measurements start with every flag cleared."""
+        arrays = PairArrays.from_measurements([0, 1, 1], [1, 0, 1])
+        assert arrays.basis.dtype == np.uint8
+        assert arrays.outcome.tolist() == [1, 0, 1]
+        assert not arrays.same_basis.any()
+        assert not arrays.test_outcome.any()
+
+    def test_mark_test_pairs(self):
+        """Only the given indices are flagged; earlier flags are cleared."""
+        arrays = PairArrays.from_measurements([0] * 6, [1] * 6)
+        arrays.mark_test_pairs([0, 1])
+        idx = arrays.mark_test_pairs([4, 2])
+
+        assert idx.tolist() == [4, 2]
+        assert arrays.test_outcome.tolist() == [False, False, True, False, True, False]
+
+    @pytest.mark.parametrize("bad_index", [-1, 6])
+    def test_mark_test_pairs_rejects_out_of_range(self, bad_index):
+        """Peer-supplied indices outside the pair range are rejected."""
+        arrays = PairArrays.from_measurements([0] * 6, [1] * 6)
+        with pytest.raises(ValueError):
+            arrays.mark_test_pairs([1, bad_index])
+
+
+class TestBitPacking:
+    """Tests for the packed-bit message encoding."""
+
+    @pytest.mark.parametrize("length", [0, 1, 8, 13, 200])
+    def test_round_trip(self, length):
+        """Packed bits decode back to the original array."""
+        bits = np.random.default_rng(length).integers(0, 2, length, dtype=np.uint8)
+        decoded = _unpack_bits(_pack_bits(bits), length)
+        assert decoded.dtype == np.uint8
+        assert np.array_equal(decoded, bits)
+
+    def test_rejects_wrong_length(self):
+        """A payload for a different bit count is rejected."""
+        with pytest.raises(ValueError):
+            _unpack_bits(_pack_bits([1] * 9), 20)
+
+
+class TestScoreTestBits:
+    """Tests for the test-bit comparison kernel."""
+
+    def test_counts_errors_and_marks_matches(self):
+        """Mismatches are counted and matches are written at the test indices."""
+        same_outcome = np.zeros(8, dtype=bool)
+        test_idx = np.array([6, 1, 3], dtype=np.intp)
+        local = np.array([1, 0, 1], dtype=np.uint8)
+        remote = np.array([1, 1, 1], dtype=np.int64)
+
+        assert _score_test_bits(local, remote, test_idx, same_outcome) == 1
+        assert np.flatnonzero(same_outcome).tolist() == [3, 6]
+
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+    def test_jit_matches_numpy(self):
+        """Test that the Numba kernel agrees with the NumPy implementation."""
+        from hackathon_challenge.core.protocol import _score_test_bits_jit
+
+        rng = np.random.default_rng(5)
+        test_idx = rng.permutation(100)[:40].astype(np.intp)
+        local = rng.integers(0, 2, 40, dtype=np.uint8)
+        remote = rng.integers(0, 2, 40).astype(np.int64)
+        jit_flags = np.zeros(100, dtype=bool)
+        numpy_flags = np.zeros(100, dtype=bool)
+
+        assert _score_test_bits_jit(local, remote, test_idx, jit_flags) == (
+            _score_test_bits_numpy(local, remote, test_idx, numpy_flags)
+        )
+        assert np.array_equal(jit_flags, numpy_flags)
+
+
 class TestPairInfo:
     """Tests for PairInfo dataclass."""
 
@@ -228,6 +324,12 @@ class TestProgramInitialization:
         assert alice._verification_tag_bits == 128
         assert alice._security_parameter == 1e-10
 
+    def test_rng_seed_reproducible(self):
+        """The private RNG is seeded independently of cascade_seed."""
+        first = AliceProgram(cascade_seed=1, rng_seed=7)
+        second = AliceProgram(cascade_seed=2, rng_seed=7)
+        assert first._rng.integers(0, 2**63) == second._rng.integers(0, 2**63)
+
     def test_default_auth_key(self):
         """Test default authentication key is set."""
         alice = AliceProgram()
@@ -266,7 +368,7 @@ class TestExtractRawKey:
 
     def test_extracts_correct_bits(self, alice_program, tested_pair_info):
         """Test raw key extraction from sifted, non-test pairs."""
-        raw_key = alice_program._extract_raw_key(tested_pair_info)
+        raw_key = alice_program._extract_raw_key(PairArrays.from_pair_info(tested_pair_info))
         
         # Should only include pairs where same_basis=True and test_outcome=False
         expected_count = sum(
@@ -274,6 +376,8 @@ class TestExtractRawKey:
             if p.same_basis and not p.test_outcome
         )
         assert len(raw_key) == expected_count
+        assert isinstance(raw_key, np.ndarray)
+        assert raw_key.dtype == np.uint8
 
     def test_excludes_different_basis(self, alice_program):
         """Test pairs with different basis are excluded."""
@@ -281,7 +385,7 @@ class TestExtractRawKey:
             PairInfo(index=0, basis=0, outcome=1, same_basis=False, test_outcome=False),
             PairInfo(index=1, basis=1, outcome=0, same_basis=True, test_outcome=False),
         ]
-        raw_key = alice_program._extract_raw_key(pairs)
+        raw_key = alice_program._extract_raw_key(PairArrays.from_pair_info(pairs))
         assert len(raw_key) == 1
         assert raw_key[0] == 0
 
@@ -291,14 +395,14 @@ class TestExtractRawKey:
             PairInfo(index=0, basis=0, outcome=1, same_basis=True, test_outcome=True),
             PairInfo(index=1, basis=1, outcome=0, same_basis=True, test_outcome=False),
         ]
-        raw_key = alice_program._extract_raw_key(pairs)
+        raw_key = alice_program._extract_raw_key(PairArrays.from_pair_info(pairs))
         assert len(raw_key) == 1
         assert raw_key[0] == 0
 
     def test_empty_pairs(self, alice_program):
         """Test with empty pair list."""
-        raw_key = alice_program._extract_raw_key([])
-        assert raw_key == []
+        raw_key = alice_program._extract_raw_key(PairArrays.from_pair_info([]))
+        assert raw_key.tolist() == []
 
     def test_all_excluded(self, alice_program):
         """Test when all pairs are excluded."""
@@ -306,8 +410,8 @@ class TestExtractRawKey:
             PairInfo(index=0, basis=0, outcome=1, same_basis=False, test_outcome=False),
             PairInfo(index=1, basis=1, outcome=0, same_basis=True, test_outcome=True),
         ]
-        raw_key = alice_program._extract_raw_key(pairs)
-        assert raw_key == []
+        raw_key = alice_program._extract_raw_key(PairArrays.from_pair_info(pairs))
+        assert raw_key.tolist() == []
 
 
 class TestErrorResult:
@@ -361,6 +465,34 @@ class TestQKDResultDataclass:
         assert result.success is False
         assert result.error_message == "QBER too high"
 
+    def test_mapping_access(self):
+        """Test dictionary-style access by the RESULT_* keys."""
+        result = QKDResult(
+            secret_key=[1, 0], qber=0.02, key_length=2, leakage=10, success=True
+        )
+        assert result[RESULT_SECRET_KEY] == [1, 0]
+        assert result.get(RESULT_SUCCESS) is True
+        assert RESULT_ERROR not in result
+        assert result.get(RESULT_ERROR, "none") == "none"
+        with pytest.raises(KeyError):
+            result[RESULT_ERROR]
+        assert result.to_dict()["qber"] == 0.02
+
+    def test_failure_matches_old_error_dict(self):
+        """Test that failure results expose the keys of the old error dict."""
+        result = QKDResult.failure("qber_too_high", "QBER 0.2000 > 0.11")
+        assert result.to_dict() == {
+            RESULT_SECRET_KEY: [],
+            RESULT_SUCCESS: False,
+            RESULT_ERROR: "qber_too_high",
+            "message": "QBER 0.2000 > 0.11",
+        }
+        for key in (RESULT_QBER, RESULT_KEY_LENGTH, RESULT_LEAKAGE):
+            assert key not in result
+            assert result.get(key, "default") == "default"
+            with pytest.raises(KeyError):
+                result[key]
+
 
 class TestConstants:
     """Tests for protocol constants."""
@@ -428,6 +560,88 @@ class TestProgramLogger:
 # =============================================================================
 
 
+def _mock_epr_context(peer: str) -> Mock:
+    """Build a mocked ProgramContext that records flushes and batch sizes."""
+    batch_sizes = []
+    flushes = []
+
+    def make_qubits(count):
+        batch_sizes.append(count)
+        qubits = []
+        for _ in range(count):
+            q = Mock()
+            q.measure.return_value = 1
+            qubits.append(q)
+        return qubits
+
+    def flush():
+        flushes.append(len(batch_sizes))
+        yield
+
+    epr_socket = Mock()
+    epr_socket.create_keep.side_effect = make_qubits
+    epr_socket.recv_keep.side_effect = make_qubits
+
+    context = Mock()
+    context.connection.flush.side_effect = flush
+    context.epr_sockets = {peer: epr_socket}
+    context.batch_sizes = batch_sizes
+    context.flushes = flushes
+    return context
+
+
+def _run_generator(gen):
+    """Drive a protocol generator to completion and return its value."""
+    try:
+        while True:
+            next(gen)
+    except StopIteration as e:
+        return e.value
+
+
+class TestMockedDistributeStates:
+    """Tests for _distribute_states with a mocked context."""
+
+    def test_batches_by_max_qubits(self):
+        """Qubits are created in batches with one flush per batch."""
+        num_pairs = 2 * DEFAULT_MAX_QUBITS + 3
+        alice = AliceProgram(num_epr_pairs=num_pairs)
+        context = _mock_epr_context(alice.PEER)
+
+        pairs = _run_generator(alice._distribute_states(context, is_initiator=True))
+
+        assert context.batch_sizes == [DEFAULT_MAX_QUBITS, DEFAULT_MAX_QUBITS, 3]
+        assert context.flushes == [1, 2, 3]
+        assert len(pairs) == num_pairs
+        assert pairs.outcome.tolist() == [1] * num_pairs
+
+    def test_responder_receives(self):
+        """Responder uses recv_keep instead of create_keep."""
+        bob = BobProgram(num_epr_pairs=5)
+        context = _mock_epr_context(bob.PEER)
+
+        pairs = _run_generator(bob._distribute_states(context, is_initiator=False))
+
+        epr_socket = context.epr_sockets[bob.PEER]
+        epr_socket.recv_keep.assert_called_once_with(5)
+        epr_socket.create_keep.assert_not_called()
+        assert len(pairs) == 5
+
+    def test_bases_follow_drawn_array(self):
+        """Element i of the drawn bases selects the basis of pair i."""
+        num_pairs = DEFAULT_MAX_QUBITS + 2
+        drawn = np.zeros(num_pairs, dtype=np.uint8)
+        drawn[[0, 3, DEFAULT_MAX_QUBITS + 1]] = 1
+        alice = AliceProgram(num_epr_pairs=num_pairs)
+        context = _mock_epr_context(alice.PEER)
+
+        with patch.object(alice, "_rng") as rng:
+            rng.integers.return_value = drawn
+            pairs = _run_generator(alice._distribute_states(context, is_initiator=True))
+
+        assert pairs.basis.tolist() == drawn.tolist()
+
+
 class TestMockedFilterBases:
     """Tests for _filter_bases with mocked socket."""
 
@@ -436,8 +650,8 @@ class TestMockedFilterBases:
         # Create mock socket
         mock_socket = Mock()
         
-        # Remote bases (same basis for even indices, different for odd)
-        remote_bases = [(i, i % 2) for i in range(len(pair_info_list))]
+        # Remote bases identical to the local ones
+        remote_bases = PairArrays.from_pair_info(pair_info_list).packed_bases()
         mock_response = Mock()
         mock_response.payload = remote_bases
         
@@ -449,7 +663,9 @@ class TestMockedFilterBases:
         mock_socket.recv_structured.return_value = mock_recv()
         
         # Run filter (need to consume the generator)
-        gen = alice_program._filter_bases(mock_socket, pair_info_list, is_initiator=True)
+        gen = alice_program._filter_bases(
+            mock_socket, PairArrays.from_pair_info(pair_info_list), is_initiator=True
+        )
         
         # Advance generator - this should call send_structured first
         try:
@@ -462,15 +678,15 @@ class TestMockedFilterBases:
         mock_socket.send_structured.assert_called_once()
         
         # All pairs should have same_basis set (all True since bases match)
-        for pair in result:
-            assert pair.same_basis is not None
+        assert result.same_basis.all()
 
     def test_filter_bases_responder(self, bob_program, pair_info_list):
         """Test basis filtering as responder (Bob)."""
         mock_socket = Mock()
         
-        # Remote bases
-        remote_bases = [(i, 0) for i in range(len(pair_info_list))]
+        # Remote bases (all Z)
+        n = len(pair_info_list)
+        remote_bases = PairArrays.from_measurements([0] * n, [0] * n).packed_bases()
         mock_response = Mock()
         mock_response.payload = remote_bases
         
@@ -480,7 +696,9 @@ class TestMockedFilterBases:
         
         mock_socket.recv_structured.return_value = mock_recv()
         
-        gen = bob_program._filter_bases(mock_socket, pair_info_list, is_initiator=False)
+        gen = bob_program._filter_bases(
+            mock_socket, PairArrays.from_pair_info(pair_info_list), is_initiator=False
+        )
         
         try:
             while True:
@@ -491,6 +709,40 @@ class TestMockedFilterBases:
         # Verify recv was called before send
         mock_socket.recv_structured.assert_called_once()
 
+        # Only the Z-basis (even) pairs match
+        assert result.same_basis.tolist() == [i % 2 == 0 for i in range(n)]
+
+    def test_filter_bases_sends_packed_bits(self, alice_program):
+        """The sifting message carries bases packed eight per byte."""
+        pairs = PairArrays.from_measurements([1, 0, 0, 1, 0, 0, 0, 0, 1], [0] * 9)
+
+        mock_socket = Mock()
+
+        def mock_recv():
+            yield
+            return Mock(payload=pairs.packed_bases())
+
+        mock_socket.recv_structured.return_value = mock_recv()
+        _run_generator(alice_program._filter_bases(mock_socket, pairs, is_initiator=True))
+
+        sent = mock_socket.send_structured.call_args[0][0]
+        assert sent.payload == "0901"
+
+    def test_filter_bases_rejects_wrong_length(self, alice_program, pair_info_list):
+        """A bases message for a different number of pairs is rejected."""
+        mock_socket = Mock()
+
+        def mock_recv():
+            yield
+            return Mock(payload="00")
+
+        mock_socket.recv_structured.return_value = mock_recv()
+        gen = alice_program._filter_bases(
+            mock_socket, PairArrays.from_pair_info(pair_info_list), is_initiator=True
+        )
+        with pytest.raises(ValueError):
+            _run_generator(gen)
+
 
 class TestMockedEstimateErrorRate:
     """Tests for _estimate_error_rate with mocked socket."""
@@ -526,17 +778,41 @@ class TestMockedEstimateErrorRate:
         mock_socket.recv_structured.return_value = mock_recv()
         
         gen = alice_program._estimate_error_rate(
-            mock_socket, sifted_pair_info, test_count, is_initiator=True
+            mock_socket, PairArrays.from_pair_info(sifted_pair_info), test_count, is_initiator=True
         )
         
         try:
             while True:
                 next(gen)
         except StopIteration as e:
-            pairs, error_rate = e.value
+            pairs, num_errors, num_tests = e.value
         
-        # With matching outcomes, error rate should be 0
-        assert error_rate == 0.0
+        # With matching outcomes there should be no errors
+        assert num_errors == 0
+        assert num_tests == test_count
+
+    def test_estimate_initiator_uses_given_indices(self, alice_program, sifted_pair_info):
+        """A precomputed same-basis index array is sampled from directly."""
+        pairs = PairArrays.from_pair_info(sifted_pair_info)
+        sent = {}
+        mock_socket = Mock()
+        mock_socket.send_structured.side_effect = lambda msg: sent.setdefault(
+            msg.header, msg.payload
+        )
+
+        def mock_recv():
+            yield
+            return Mock(payload=[(i, int(pairs.outcome[i])) for i in sent["Test indices"]])
+
+        mock_socket.recv_structured.return_value = mock_recv()
+
+        gen = alice_program._estimate_error_rate(
+            mock_socket, pairs, 2, is_initiator=True, same_basis_indices=np.array([4, 2])
+        )
+        _, num_errors, num_tests = _run_generator(gen)
+
+        assert sorted(sent["Test indices"]) == [2, 4]
+        assert (num_errors, num_tests) == (0, 2)
 
     def test_estimate_responder(self, bob_program, sifted_pair_info):
         """Test error estimation as responder."""
@@ -563,7 +839,7 @@ class TestMockedEstimateErrorRate:
         mock_socket.recv_structured.side_effect = [mock_recv(), mock_recv()]
         
         gen = bob_program._estimate_error_rate(
-            mock_socket, sifted_pair_info, 5, is_initiator=False
+            mock_socket, PairArrays.from_pair_info(sifted_pair_info), 5, is_initiator=False
         )
         
         # Consume generator
@@ -571,11 +847,41 @@ class TestMockedEstimateErrorRate:
             while True:
                 next(gen)
         except StopIteration as e:
-            pairs, error_rate = e.value
+            pairs, num_errors, num_tests = e.value
         
         # Test bits should be marked
         for idx in test_indices:
-            assert pairs[idx].test_outcome is True
+            assert pairs.test_outcome[idx]
+
+    def test_estimate_responder_counts_errors_in_index_order(
+        self, bob_program, sifted_pair_info
+    ):
+        """Outcomes are compared in the order of the received test indices."""
+        mock_socket = Mock()
+
+        # Deliberately unsorted test indices
+        test_indices = [10, 1, 7, 5]
+        flipped = {1, 5}
+        remote_outcomes = [
+            (i, sifted_pair_info[i].outcome ^ (i in flipped)) for i in test_indices
+        ]
+
+        responses = iter([Mock(payload=test_indices), Mock(payload=remote_outcomes)])
+
+        def mock_recv():
+            yield
+            return next(responses)
+
+        mock_socket.recv_structured.side_effect = [mock_recv(), mock_recv()]
+
+        gen = bob_program._estimate_error_rate(
+            mock_socket, PairArrays.from_pair_info(sifted_pair_info), 4, is_initiator=False
+        )
+        pairs, num_errors, num_tests = _run_generator(gen)
+
+        assert (num_errors, num_tests) == (2, 4)
+        assert pairs.same_outcome[[10, 7]].all()
+        assert not pairs.same_outcome[[1, 5]].any()
 
 
 # =============================================================================
@@ -295,6 +295,46 @@ class TestConfiguration:
         with pytest.raises(FileNotFoundError):
             load_scenario("nonexistent_scenario_xyz")
 
+    def test_deep_merge_nested(self):
+        """Test that nested overrides merge without modifying the base."""
+        from hackathon_challenge.configs import _deep_merge
+
+        base = {"a": {"b": {"c": 1, "d": 2}, "e": 3}, "f": 4}
+        override = {"a": {"b": {"c": 10}, "x": 5}, "f": {"g": 6}}
+        merged = _deep_merge(base, override)
+
+        assert merged == {"a": {"b": {"c": 10, "d": 2}, "e": 3, "x": 5}, "f": {"g": 6}}
+        assert base == {"a": {"b": {"c": 1, "d": 2}, "e": 3}, "f": 4}
+
+    def test_deep_merge_in_place(self):
+        """Test that in-place merging reuses the base dictionaries."""
+        from hackathon_challenge.configs import _deep_merge
+
+        base = {"a": {"b": 1}, "c": 2}
+        inner = base["a"]
+        merged = _deep_merge(base, {"a": {"d": 3}}, in_place=True)
+
+        assert merged is base and merged["a"] is inner
+        assert merged == {"a": {"b": 1, "d": 3}, "c": 2}
+
+    def test_yaml_cache_returns_copies_and_tracks_mtime(self, tmp_path):
+        """Test that cached YAML loads are isolated and refresh on change."""
+        import os
+
+        from hackathon_challenge.configs import _load_yaml
+
+        path = tmp_path / "cfg.yaml"
+        path.write_text("a:\n  b: 1\n")
+
+        first = _load_yaml(path)
+        first["a"]["b"] = 99
+        assert _load_yaml(path) == {"a": {"b": 1}}
+
+        path.write_text("a:\n  b: 2\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert _load_yaml(path) == {"a": {"b": 2}}
+
     def test_config_inheritance(self):
         """Test that scenario configs inherit from base."""
         base = load_base_config()
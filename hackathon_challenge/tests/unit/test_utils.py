@@ -8,13 +8,14 @@ import pytest
 
 from hackathon_challenge.reconciliation.utils import (
     apply_permutation_to_key,
+    compute_block_parities,
     compute_optimal_block_size,
     compute_parity,
     inverse_permutation,
     permute_indices,
     split_into_blocks,
 )
-from hackathon_challenge.utils.math import xor_bits
+from hackathon_challenge.utils.math import bit_count, parity_u64, xor_bits
 
 
 class TestXORBits:
@@ -41,6 +42,21 @@ class TestXORBits:
         assert xor_bits([0, 0, 0, 0]) == 0
 
 
+class TestBitCount:
+    """Test suite for per-element bit counts and parities."""
+
+    @pytest.mark.parametrize("dtype", [np.uint8, np.uint64])
+    @pytest.mark.parametrize("numpy_popcount", [True, False])
+    def test_matches_exact_count(self, monkeypatch, dtype, numpy_popcount):
+        """Test both the NumPy >= 2.0 path and the fallback against bin()."""
+        words = np.random.default_rng(3).integers(0, np.iinfo(dtype).max, size=(4, 6), dtype=dtype)
+        expected = [[bin(int(w)).count("1") for w in row] for row in words]
+        if not numpy_popcount:
+            monkeypatch.delattr(np, "bitwise_count", raising=False)
+        assert bit_count(words).tolist() == expected
+        assert parity_u64(words).tolist() == [[c & 1 for c in row] for row in expected]
+
+
 class TestComputeParity:
     """Test suite for parity computation."""
 
@@ -239,6 +255,22 @@ class TestSplitIntoBlocks:
         assert blocks == []
 
 
+class TestComputeBlockParities:
+    """Test suite for batched block parities."""
+
+    @pytest.mark.parametrize("length,block_size", [(12, 4), (10, 4), (3, 10), (1, 4)])
+    def test_matches_per_block_parity(self, length, block_size):
+        """Test that batched parities match compute_parity per block."""
+        rng = np.random.default_rng(length)
+        key = rng.integers(0, 2, length, dtype=np.uint8)
+        permutation = permute_indices(length, seed=42, pass_idx=1)
+        expected = [
+            compute_parity(key, [int(permutation[i]) for i in block])
+            for block in split_into_blocks(length, block_size)
+        ]
+        assert compute_block_parities(key, permutation, block_size).tolist() == expected
+
+
 class TestApplyPermutationToKey:
     """Test suite for applying permutation to key."""
 
@@ -17,6 +17,7 @@ from hackathon_challenge.verification.polynomial_hash import (
     compute_polynomial_hash_with_length,
     generate_hash_salt,
     minimum_tag_bits_for_security,
+    tags_equal,
     verify_hash,
 )
 from hackathon_challenge.verification.utils import (
@@ -249,6 +250,14 @@ class TestBitsToFieldElements:
         # Should be padded: [1, 0, 1, 0, 0, 0, 0, 0] = 0xA0
         assert elements[0] == 0xA0
 
+    def test_array_input_matches_list(self):
+        """Test that uint8 arrays convert like the equivalent list."""
+        bits = [1, 0, 1, 1, 0, 0, 1, 0, 1, 1, 1] * 13
+        for element_bits in (8, 64, 128, 5):
+            assert bits_to_field_elements(
+                np.array(bits, dtype=np.uint8), element_bits
+            ) == bits_to_field_elements(bits, element_bits)
+
 
 class TestValidateFieldElement:
     """Test suite for field element validation."""
@@ -365,6 +374,20 @@ class TestComputePolynomialHashWithLength:
         assert hash1 != hash2
 
 
+class TestTagsEqual:
+    """Test suite for constant-time tag comparison."""
+
+    def test_equal_and_different_tags(self):
+        """Test that equal tags match and different tags do not."""
+        assert tags_equal(0x1234, 0x1234, field_bits=64)
+        assert not tags_equal(0x1234, 0x1235, field_bits=64)
+
+    def test_rejects_invalid_tags(self):
+        """Test that malformed remote tags never match."""
+        for bad in (None, "4660", 4660.0, True, -1, 1 << 64):
+            assert not tags_equal(4660, bad, field_bits=64)
+
+
 class TestVerifyHash:
     """Test suite for hash verification function."""
 
@@ -466,6 +489,13 @@ class TestKeyVerifierInit:
         with pytest.raises(ValueError, match="64 or 128"):
             KeyVerifier(tag_bits=32)
 
+    def test_reset_leakage(self):
+        """Test that reset_leakage clears the leakage counter."""
+        verifier = KeyVerifier()
+        verifier._leakage_bits = 128
+        verifier.reset_leakage()
+        assert verifier.leakage_bits == 0
+
 
 class TestKeyVerifierComputeHash:
     """Test suite for KeyVerifier.compute_hash."""
@@ -488,6 +518,15 @@ class TestKeyVerifierComputeHash:
         module_hash = compute_polynomial_hash(key, salt, field_bits=64)
         assert verifier_hash == module_hash
 
+    def test_array_key_matches_list_key(self):
+        """Test that a uint8 array key hashes like the equivalent list."""
+        verifier = KeyVerifier(tag_bits=64)
+        key = [1, 0, 1, 1, 0, 0, 1, 0] * 4
+        salt = 0x12345678
+        assert verifier.compute_hash(np.array(key, dtype=np.uint8), salt) == verifier.compute_hash(
+            key, salt
+        )
+
 
 class TestKeyVerifierVerifyLocal:
     """Test suite for KeyVerifier.verify_local."""
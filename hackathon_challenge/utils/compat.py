@@ -0,0 +1,14 @@
+"""Python version and optional dependency compatibility helpers."""
+
+import sys
+from typing import Dict
+
+# ``slots=True`` needs Python 3.10; on 3.9 dataclasses fall back to a __dict__
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+try:
+    import numba  # noqa: F401
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
@@ -5,6 +5,8 @@ Reference: implementation_plan.md §Phase 0
 
 from typing import List
 
+import numpy as np
+
 
 def xor_bits(bits: List[int]) -> int:
     """Compute XOR of a list of bits.
@@ -23,3 +25,41 @@ def xor_bits(bits: List[int]) -> int:
     for bit in bits:
         result ^= bit
     return result
+
+
+def bit_count(words: np.ndarray) -> np.ndarray:
+    """Count the set bits of each element of an unsigned integer array.
+
+    Parameters
+    ----------
+    words : np.ndarray
+        Unsigned integer array.
+
+    Returns
+    -------
+    np.ndarray
+        Array of the same shape with the number of set bits per element.
+    """
+    if hasattr(np, "bitwise_count"):
+        # NumPy >= 2.0 exposes a vectorized popcount
+        return np.bitwise_count(words)
+
+    as_bytes = np.ascontiguousarray(words).view(np.uint8)
+    as_bytes = as_bytes.reshape(words.shape + (words.dtype.itemsize,))
+    return np.unpackbits(as_bytes, axis=-1).sum(axis=-1, dtype=np.uint8)
+
+
+def parity_u64(words: np.ndarray) -> np.ndarray:
+    """Compute the parity of each element of an unsigned integer array.
+
+    Parameters
+    ----------
+    words : np.ndarray
+        Unsigned integer array, typically packed uint64 words.
+
+    Returns
+    -------
+    np.ndarray
+        uint8 array of the same shape with the parity (0 or 1) of each element.
+    """
+    return (bit_count(words) & 1).astype(np.uint8)
@@ -45,6 +45,7 @@ from hackathon_challenge.verification.polynomial_hash import (
     compute_polynomial_hash_with_length,
     generate_hash_salt,
     minimum_tag_bits_for_security,
+    tags_equal,
     verify_hash,
 )
 from hackathon_challenge.verification.utils import (
@@ -88,6 +89,7 @@ __all__ = [
     "compute_polynomial_hash_with_length",
     "generate_hash_salt",
     "verify_hash",
+    "tags_equal",
     "collision_probability",
     "minimum_tag_bits_for_security",
     # Verifier
@@ -23,7 +23,8 @@ This is an ε-almost universal hash family with collision probability:
 where |F| = 2^n is the field size.
 """
 
-from typing import List, Optional
+import hmac
+from typing import Any, List, Optional
 
 import numpy as np
 
@@ -84,7 +85,7 @@ def compute_polynomial_hash(
     >>> salt = 0x12345678
     >>> tag = compute_polynomial_hash(key, salt, field_bits=64)
     """
-    if not key:
+    if len(key) == 0:
         raise ValueError("Key cannot be empty")
     if salt == 0:
         raise ValueError("Salt must be non-zero")
@@ -146,7 +147,7 @@ def compute_polynomial_hash_with_length(
 
     For fixed-length QKD blocks this may be omitted, but it's good practice.
     """
-    if not key:
+    if len(key) == 0:
         raise ValueError("Key cannot be empty")
     if salt == 0:
         raise ValueError("Salt must be non-zero")
@@ -221,7 +222,42 @@ def verify_hash(
         True if computed hash matches expected tag.
     """
     computed_tag = compute_polynomial_hash(key, salt, field_bits, element_bits)
-    return computed_tag == expected_tag
+    return tags_equal(computed_tag, expected_tag, field_bits)
+
+
+def tags_equal(tag_a: Any, tag_b: Any, field_bits: int = 64) -> bool:
+    """Compare two hash tags in constant time.
+
+    Both tags are encoded as fixed-width big-endian bytes of the field
+    size and compared with ``hmac.compare_digest``, so the comparison
+    time does not depend on where the tags first differ.
+
+    Parameters
+    ----------
+    tag_a : Any
+        First tag (normally an int in [0, 2^field_bits)).
+    tag_b : Any
+        Second tag. May come from the network, so any type is accepted.
+    field_bits : int, optional
+        Field size in bits (default 64).
+
+    Returns
+    -------
+    bool
+        True if both tags are valid field elements and equal.
+    """
+    for tag in (tag_a, tag_b):
+        if isinstance(tag, bool) or not isinstance(tag, (int, np.integer)):
+            return False
+
+    width = (field_bits + 7) // 8
+    try:
+        bytes_a = int(tag_a).to_bytes(width, "big")
+        bytes_b = int(tag_b).to_bytes(width, "big")
+    except OverflowError:
+        # Negative or wider than the field: not a valid tag
+        return False
+    return hmac.compare_digest(bytes_a, bytes_b)
 
 
 def collision_probability(key_length: int, field_bits: int = 64) -> float:
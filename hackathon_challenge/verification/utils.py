@@ -295,10 +295,27 @@ def bits_to_field_elements(
     Notes
     -----
     The key is split into chunks of element_bits and each chunk
-    is converted to an integer field element.
+    is converted to an integer field element. Lists and uint8 arrays
+    are both accepted; for byte-aligned element sizes the chunks are
+    packed with ``np.packbits`` instead of being built bit by bit.
     """
-    chunks = chunk_bits(bits, element_bits)
-    return [bits_to_int(chunk) for chunk in chunks]
+    if element_bits % 8:
+        chunks = chunk_bits(list(bits), element_bits)
+        return [bits_to_int(chunk) for chunk in chunks]
+
+    bits_arr = np.asarray(bits, dtype=np.uint8) & 1
+    if bits_arr.size == 0:
+        return []
+
+    # Zero-pad the last chunk, then pack MSB-first (matches bits_to_int)
+    padded = np.zeros(-(-bits_arr.size // element_bits) * element_bits, dtype=np.uint8)
+    padded[: bits_arr.size] = bits_arr
+    packed = np.packbits(padded).tobytes()
+    element_bytes = element_bits // 8
+    return [
+        int.from_bytes(packed[i : i + element_bytes], "big")
+        for i in range(0, len(packed), element_bytes)
+    ]
 
 
 def validate_field_element(value: int, field_bits: int = 128) -> bool:
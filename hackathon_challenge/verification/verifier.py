@@ -38,6 +38,7 @@ from hackathon_challenge.verification.polynomial_hash import (
     collision_probability,
     compute_polynomial_hash,
     generate_hash_salt,
+    tags_equal,
 )
 
 if TYPE_CHECKING:
@@ -139,6 +140,10 @@ class KeyVerifier:
         """Return total bits leaked during verification."""
         return self._leakage_bits
 
+    def reset_leakage(self) -> None:
+        """Reset the leakage counter before verifying a new key."""
+        self._leakage_bits = 0
+
     def get_collision_probability(self, key_length: int) -> float:
         """Calculate collision probability for a given key length.
 
@@ -154,12 +159,12 @@ class KeyVerifier:
         """
         return collision_probability(key_length, self._element_bits)
 
-    def compute_hash(self, key: List[int], salt: int) -> int:
+    def compute_hash(self, key: Union[List[int], np.ndarray], salt: int) -> int:
         """Compute the polynomial hash of a key.
 
         Parameters
         ----------
-        key : List[int]
+        key : Union[List[int], np.ndarray]
             Key bits to hash.
         salt : int
             Random evaluation point.
@@ -176,7 +181,7 @@ class KeyVerifier:
     def verify(
         self,
         socket: "AuthenticatedSocket",
-        key: List[int],
+        key: Union[List[int], np.ndarray],
         is_alice: bool,
     ) -> Generator[EventExpression, None, bool]:
         """Verify key equality using polynomial hashing.
@@ -188,7 +193,7 @@ class KeyVerifier:
         ----------
         socket : AuthenticatedSocket
             Authenticated classical channel for communication.
-        key : List[int]
+        key : Union[List[int], np.ndarray]
             Local reconciled key bits.
         is_alice : bool
             True if this is Alice (initiator who generates salt).
@@ -225,7 +230,7 @@ class KeyVerifier:
     def _verify_alice(
         self,
         socket: "AuthenticatedSocket",
-        key: List[int],
+        key: Union[List[int], np.ndarray],
     ) -> Generator[EventExpression, None, bool]:
         """Alice's verification protocol.
 
@@ -233,7 +238,7 @@ class KeyVerifier:
         ----------
         socket : AuthenticatedSocket
             Communication channel.
-        key : List[int]
+        key : Union[List[int], np.ndarray]
             Alice's key.
 
         Yields
@@ -273,7 +278,7 @@ class KeyVerifier:
     def _verify_bob(
         self,
         socket: "AuthenticatedSocket",
-        key: List[int],
+        key: Union[List[int], np.ndarray],
     ) -> Generator[EventExpression, None, bool]:
         """Bob's verification protocol.
 
@@ -281,7 +286,7 @@ class KeyVerifier:
         ----------
         socket : AuthenticatedSocket
             Communication channel.
-        key : List[int]
+        key : Union[List[int], np.ndarray]
             Bob's key.
 
         Yields
@@ -309,8 +314,8 @@ class KeyVerifier:
         # Compute local hash with same salt
         local_tag = self.compute_hash(key, salt)
 
-        # Compare tags
-        match = local_tag == remote_tag
+        # Compare tags in constant time
+        match = tags_equal(local_tag, remote_tag, self._tag_bits)
 
         # Track leakage
         self._leakage_bits += self._tag_bits
@@ -348,7 +353,7 @@ class KeyVerifier:
         tag_b = self.compute_hash(key_b, salt)
 
         return VerificationResult(
-            success=(tag_a == tag_b),
+            success=tags_equal(tag_a, tag_b, self._tag_bits),
             salt=salt,
             local_tag=tag_a,
             remote_tag=tag_b,